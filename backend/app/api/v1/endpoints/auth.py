@@ -39,7 +39,7 @@ def login_access_token(
         subject=str(user.id),
         auth_source="local",
         role=(Role.ADMIN if user.is_superuser else Role.VIEWER),
-        permissions=set(),
+        permissions=frozenset(),
         user=user,
     )
     log_audit_event(
@@ -11,7 +11,7 @@ from app.db.session import get_db
 from app.models.robot import ArtifactType
 from app.schemas.robot import RobotVersionRead
 from app.services.audit_service import extract_client_ip, log_audit_event
-from app.services.robot_service import is_valid_semver, publish_robot_version
+from app.services.robot_service import check_new_version, is_valid_semver, publish_robot_version
 from app.services.storage_service import extract_required_env_keys_from_artifact, get_artifact_storage
 
 router = APIRouter(prefix="/deploy", tags=["deploy"])
@@ -53,6 +53,12 @@ async def publish_version_from_ci(
     if not isinstance(parsed_env_vars, dict) or not all(isinstance(k, str) and isinstance(v, str) for k, v in parsed_env_vars.items()):
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="env_vars_json must be a JSON object of string pairs.")
 
+    # Missing robots and duplicate versions are rejected before the upload is written to storage.
+    try:
+        check_new_version(db=db, robot_id=robot_id, version=version)
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+
     storage = get_artifact_storage()
     try:
         stored = await storage.save_robot_version_artifact(robot_id=robot_id, version=version, upload=artifact)
@@ -86,8 +92,11 @@ async def publish_version_from_ci(
             arguments=parsed_arguments,
             env_vars=parsed_env_vars,
             working_directory=working_directory,
+            checked=True,
         )
     except ValueError as exc:
+        # The version row was not written, so the artifact stored for it would be left orphaned.
+        storage.delete_robot_version_artifact(stored)
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
 
     log_audit_event(
@@ -112,4 +121,4 @@ async def publish_version_from_ci(
             "required_env_keys_json": required_env_keys,
         },
     )
-    return RobotVersionRead.model_validate(published)
+    return RobotVersionRead.from_row(published)
@@ -290,7 +290,7 @@ async def run_service_endpoint(
             "parameters": result.validated_parameters,
         },
     )
-    return RunRead.model_validate(result.run)
+    return RunRead.from_row(result.run)
 
 
 @router.get("/services/{service_id}/runs", response_model=list[RunRead])
@@ -305,4 +305,4 @@ def list_service_runs_endpoint(
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Service not found.")
     _deny_if_robot_out_of_scope(db=db, principal=principal, robot_id=service.robot_id, permission=PERMISSION_RUN_READ)
     items = list_runs_for_service(db=db, service_id=service_id, limit=limit)
-    return [RunRead.model_validate(item) for item in items]
+    return [RunRead.from_row(item) for item in items]
@@ -14,10 +14,11 @@ from app.schemas.common import Message
 from app.schemas.env_var import RobotEnvVarRead, RobotEnvVarUpsertRequest
 from app.schemas.robot import RobotCreate, RobotListResponse, RobotRead, RobotTagsUpdate, RobotVersionRead
 from app.schemas.scheduler import ScheduleCreate, ScheduleRead, ScheduleUpdate, SlaRuleCreate, SlaRuleRead, SlaRuleUpdate
-from app.services.audit_service import extract_client_ip, log_audit_event
+from app.services.audit_service import build_audit_event, extract_client_ip, log_audit_event, log_audit_events
 from app.services.identity_service import Principal
 from app.services.robot_service import (
     activate_robot_version,
+    check_new_version,
     create_robot,
     get_robot,
     is_valid_semver,
@@ -35,21 +36,21 @@ router = APIRouter(prefix="/robots", tags=["robots"])
 
 
 def _serialize_version(version) -> RobotVersionRead:
-    return RobotVersionRead.model_validate(version)
+    return RobotVersionRead.from_row(version)
 
 
 def _serialize_robot(robot) -> RobotRead:
     versions = sorted(getattr(robot, "versions", []), key=lambda item: item.created_at, reverse=True)
-    return RobotRead.model_validate(
-        {
-            "id": robot.id,
-            "name": robot.name,
-            "description": robot.description,
-            "created_at": robot.created_at,
-            "updated_at": robot.updated_at,
-            "versions": [_serialize_version(version) for version in versions],
-            "tags": [item.tag for item in getattr(robot, "tags", [])],
-        }
+    version_count = getattr(robot, "version_count", None)
+    return RobotRead.model_construct(
+        id=robot.id,
+        name=robot.name,
+        description=robot.description,
+        created_at=robot.created_at,
+        updated_at=robot.updated_at,
+        versions=[_serialize_version(version) for version in versions],
+        version_count=len(versions) if version_count is None else version_count,
+        tags=[item.tag for item in getattr(robot, "tags", [])],
     )
 
 
@@ -85,7 +86,7 @@ def get_robots(
         items, total = list_robots(db=db, skip=skip, limit=limit)
     else:
         items, total = list_robots_scoped(db=db, robot_ids=allowed_ids, skip=skip, limit=limit)
-    return RobotListResponse(items=[_serialize_robot(item) for item in items], total=total)
+    return RobotListResponse.model_construct(items=[_serialize_robot(item) for item in items], total=total)
 
 
 @router.get("/{robot_id}/versions", response_model=list[RobotVersionRead])
@@ -136,6 +137,12 @@ async def publish_version(
     if not isinstance(parsed_env_vars, dict) or not all(isinstance(k, str) and isinstance(v, str) for k, v in parsed_env_vars.items()):
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="env_vars_json must be a JSON object of string pairs.")
 
+    # Missing robots and duplicate versions are rejected before the upload is written to storage.
+    try:
+        check_new_version(db=db, robot_id=robot_id, version=version)
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+
     storage = get_artifact_storage()
     try:
         stored = await storage.save_robot_version_artifact(robot_id=robot_id, version=version, upload=artifact)
@@ -169,8 +176,11 @@ async def publish_version(
             arguments=parsed_arguments,
             env_vars=parsed_env_vars,
             working_directory=working_directory,
+            checked=True,
         )
     except ValueError as exc:
+        # The version row was not written, so the artifact stored for it would be left orphaned.
+        storage.delete_robot_version_artifact(stored)
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
 
     log_audit_event(
@@ -282,22 +292,27 @@ def put_robot_env_vars(
         raise HTTPException(status_code=status_code, detail=str(exc)) from exc
 
     normalized_env = normalize_env_name(env)
-    for item, action in zip(touched, actions):
-        log_audit_event(
-            db=db,
-            action=f"robot_env_var.{action}",
-            principal=principal,
-            actor_ip=extract_client_ip(request.headers.get("x-forwarded-for"), request.client.host if request.client else None),
-            target_type="robot_env_var",
-            target_id=f"{robot_id}:{normalized_env}:{item.key}",
-            metadata={
-                "robot_id": str(robot_id),
-                "env_name": normalized_env,
-                "key": item.key,
-                "is_secret": item.is_secret,
-                "action": action,
-            },
-        )
+    actor_ip = extract_client_ip(request.headers.get("x-forwarded-for"), request.client.host if request.client else None)
+    log_audit_events(
+        db,
+        [
+            build_audit_event(
+                action=f"robot_env_var.{action}",
+                principal=principal,
+                actor_ip=actor_ip,
+                target_type="robot_env_var",
+                target_id=f"{robot_id}:{normalized_env}:{item.key}",
+                metadata={
+                    "robot_id": str(robot_id),
+                    "env_name": normalized_env,
+                    "key": item.key,
+                    "is_secret": item.is_secret,
+                    "action": action,
+                },
+            )
+            for item, action in zip(touched, actions)
+        ],
+    )
     return list_env_vars(db=db, robot_id=robot_id, env_name=normalized_env)
 
 
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import os
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
@@ -16,7 +17,7 @@ from app.core.rbac import (
 )
 from app.db.session import get_db
 from app.models.run import Run, RunStatus
-from app.schemas.run import RunExecuteRequest, RunListResponse, RunLogRead, RunRead
+from app.schemas.run import RunExecuteRequest, RunListResponse, RunLogRead, RunLogReadListAdapter, RunRead
 from app.services.artifact_service import get_artifact, resolve_artifact_path
 from app.services.audit_service import extract_client_ip, log_audit_event
 from app.services.identity_service import Principal
@@ -39,6 +40,8 @@ async def execute_robot(
             robot_id=robot_id,
             payload=payload,
             triggered_by=principal.user.id if principal.user else None,
+            hydrate=True,
+            background=True,
         )
     except ValueError as exc:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)) from exc
@@ -52,7 +55,7 @@ async def execute_robot(
         target_id=str(run.run_id),
         metadata={"run_id": str(run.run_id), "robot_id": str(robot_id), "version_id": str(run.robot_version_id)},
     )
-    return RunRead.model_validate(run)
+    return RunRead.from_row(run)
 
 
 @router.get("", response_model=RunListResponse)
@@ -80,7 +83,7 @@ def get_runs(
         skip=skip,
         limit=limit,
     )
-    return RunListResponse(items=[RunRead.model_validate(item) for item in items], total=total)
+    return RunListResponse.model_construct(items=[RunRead.from_row(item) for item in items], total=total)
 
 
 @router.get("/{run_id}", response_model=RunRead)
@@ -92,7 +95,7 @@ def get_run_by_id(
     run = get_run(db=db, run_id=run_id)
     if not run:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Run not found.")
-    return RunRead.model_validate(run)
+    return RunRead.from_row(run)
 
 
 @router.post("/{run_id}/cancel", response_model=RunRead)
@@ -107,7 +110,7 @@ def cancel_run(
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Run not found.")
 
     if run.status == RunStatus.CANCELED.value:
-        return RunRead.model_validate(get_run(db=db, run_id=run_id) or run)
+        return RunRead.from_row(get_run(db=db, run_id=run_id) or run)
 
     if run.status != RunStatus.RUNNING.value:
         raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Only RUNNING runs can be canceled.")
@@ -133,7 +136,7 @@ def cancel_run(
             },
         )
 
-    return RunRead.model_validate(get_run(db=db, run_id=run_id) or run)
+    return RunRead.from_row(get_run(db=db, run_id=run_id) or run)
 
 
 @router.get("/{run_id}/logs", response_model=list[RunLogRead])
@@ -144,7 +147,7 @@ def get_logs(
     limit: int = Query(500, ge=1, le=5000),
 ) -> list[RunLogRead]:
     logs = get_run_logs(db=db, run_id=run_id, limit=limit)
-    return [RunLogRead.model_validate(log) for log in logs]
+    return RunLogReadListAdapter.validate_python(logs, from_attributes=True)
 
 
 @router.get("/{run_id}/artifacts/{artifact_id}/download")
@@ -164,7 +167,7 @@ def download_artifact(
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Run not found.")
 
     artifact_path = resolve_artifact_path(artifact)
-    if not artifact_path.exists():
+    if not os.path.exists(artifact_path):
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Artifact file not found on disk.")
 
     log_audit_event(
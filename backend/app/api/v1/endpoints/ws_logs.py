@@ -11,8 +11,9 @@ from app.api.deps import authenticate_websocket_principal, can_access_run
 from app.core.rbac import PERMISSION_RUN_READ
 from app.db.session import SessionLocal
 from app.models.run import Run
-from app.services.queue_service import get_async_redis, get_run_log_channel
-from app.services.run_service import get_run_logs
+from app.schemas.run import dump_ws_log
+from app.services.queue_service import get_async_pubsub, get_run_log_channel
+from app.services.run_service import stream_run_logs
 
 router = APIRouter(prefix="/ws", tags=["websocket"])
 
@@ -45,20 +46,14 @@ async def run_log_stream(websocket: WebSocket, run_id: UUID) -> None:
 
     await websocket.accept()
 
-    recent_logs = get_run_logs(db=db, run_id=run_id, limit=200)
-    for log_item in recent_logs:
-        await websocket.send_json(
-            {
-                "run_id": str(run_id),
-                "timestamp": log_item.timestamp.isoformat(),
-                "level": log_item.level,
-                "message": log_item.message,
-            }
+    run_id_text = str(run_id)
+    for log_item in stream_run_logs(db=db, run_id=run_id, limit=200):
+        await websocket.send_text(
+            dump_ws_log(run_id_text, log_item.timestamp, log_item.level, log_item.message).decode("utf-8")
         )
     db.close()
 
-    redis = await get_async_redis()
-    pubsub = redis.pubsub()
+    pubsub = get_async_pubsub()
     await pubsub.subscribe(get_run_log_channel(str(run_id)))
 
     async def watch_disconnect() -> None:
@@ -38,6 +38,7 @@ class Settings(BaseSettings):
     redis_queue_name: str = "enesa:runs:queue"
     redis_pubsub_prefix: str = "enesa:runs"
     redis_worker_heartbeat_prefix: str = "enesa:workers:heartbeat"
+    redis_max_connections: int = 128
 
     artifacts_root: Path = Field(default=Path("./data/artifacts"))
     python_executable: str = "python"
@@ -113,15 +114,15 @@ class Settings(BaseSettings):
         return f"https://login.microsoftonline.com/{self.azure_ad_tenant_id}/discovery/v2.0/keys"
 
     @property
-    def azure_group_admin_list(self) -> set[str]:
+    def azure_group_admin_list(self) -> frozenset[str]:
         return _csv_to_set(self.azure_ad_group_admin_ids)
 
     @property
-    def azure_group_operator_list(self) -> set[str]:
+    def azure_group_operator_list(self) -> frozenset[str]:
         return _csv_to_set(self.azure_ad_group_operator_ids)
 
     @property
-    def azure_group_viewer_list(self) -> set[str]:
+    def azure_group_viewer_list(self) -> frozenset[str]:
         return _csv_to_set(self.azure_ad_group_viewer_ids)
 
     def run_channel(self, run_id: str) -> str:
@@ -131,8 +132,10 @@ class Settings(BaseSettings):
         return f"{self.redis_worker_heartbeat_prefix}:{worker_name}"
 
 
-def _csv_to_set(raw: str) -> set[str]:
-    return {item.strip() for item in raw.split(",") if item.strip()}
+# Keyed on the raw setting string, so runtime changes to the setting still take effect.
+@lru_cache(maxsize=32)
+def _csv_to_set(raw: str) -> frozenset[str]:
+    return frozenset(item.strip() for item in raw.split(",") if item.strip())
 
 
 @lru_cache(maxsize=1)
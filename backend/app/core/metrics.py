@@ -1,18 +1,75 @@
 from __future__ import annotations
 
+import gzip
+import hashlib
+import threading
+import time
+from dataclasses import dataclass
+
 from prometheus_client import CONTENT_TYPE_LATEST, Counter, Gauge, Histogram, generate_latest
 
+# Classic buckets sized to robot runtimes: most runs finish within minutes and the
+# default schedule timeout is one hour, so the top bucket sits at that timeout.
+RUN_DURATION_BUCKETS = (5, 15, 30, 60, 300, 900, 1800, 3600)
+METRICS_RENDER_TTL_SECONDS = 0.5
+
 runs_total = Counter("enesa_runs_total", "Total number of run completions")
 runs_failed_total = Counter("enesa_runs_failed_total", "Total number of failed runs")
 run_duration_seconds = Histogram(
     "enesa_run_duration_seconds",
     "Duration of run execution in seconds",
-    buckets=(1, 5, 10, 30, 60, 120, 300, 600, 1200),
+    buckets=RUN_DURATION_BUCKETS,
 )
 queue_depth = Gauge("enesa_queue_depth", "Current queue depth in Redis")
 worker_heartbeat = Gauge("enesa_worker_heartbeat_unix", "Worker heartbeat unix timestamp", ["worker"])
 
 
-def render_metrics() -> tuple[bytes, str]:
-    return generate_latest(), CONTENT_TYPE_LATEST
+@dataclass(slots=True)
+class RenderedMetrics:
+    body: bytes
+    gzip_body: bytes
+    etag: str
+    headers: dict[str, str]
+    gzip_headers: dict[str, str]
+    rendered_at: float
+
+
+_rendered_metrics: RenderedMetrics | None = None
+_render_lock = threading.Lock()
+
+
+def render_metrics() -> RenderedMetrics:
+    global _rendered_metrics
+
+    cached = _rendered_metrics
+    if cached is not None and time.monotonic() - cached.rendered_at < METRICS_RENDER_TTL_SECONDS:
+        return cached
 
+    with _render_lock:
+        cached = _rendered_metrics
+        now = time.monotonic()
+        if cached is not None and now - cached.rendered_at < METRICS_RENDER_TTL_SECONDS:
+            return cached
+        body = generate_latest()
+        gzip_body = gzip.compress(body, compresslevel=1)
+        etag = f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+        _rendered_metrics = RenderedMetrics(
+            body=body,
+            gzip_body=gzip_body,
+            etag=etag,
+            headers={
+                "content-type": CONTENT_TYPE_LATEST,
+                "content-length": str(len(body)),
+                "etag": etag,
+                "vary": "Accept-Encoding",
+            },
+            gzip_headers={
+                "content-type": CONTENT_TYPE_LATEST,
+                "content-length": str(len(gzip_body)),
+                "content-encoding": "gzip",
+                "etag": etag,
+                "vary": "Accept-Encoding",
+            },
+            rendered_at=now,
+        )
+        return _rendered_metrics
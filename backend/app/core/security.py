@@ -10,6 +10,8 @@ from app.core.config import get_settings
 
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
+LOCAL_TOKEN_ISSUER = "enesa-local"
+
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
@@ -27,7 +29,7 @@ def create_access_token(subject: str, extra: dict[str, Any] | None = None, expir
         "sub": subject,
         "iat": int(now.timestamp()),
         "exp": int(expire.timestamp()),
-        "iss": "enesa-local",
+        "iss": LOCAL_TOKEN_ISSUER,
         "token_type": "local_access",
     }
     if extra:
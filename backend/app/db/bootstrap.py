@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from sqlalchemy import select
+from sqlalchemy import inspect, select, text
+from sqlalchemy.engine import Connection
 from sqlalchemy.orm import Session
 
 from app.core.config import get_settings
@@ -39,9 +40,53 @@ DEFAULT_PERMISSIONS = [
 ]
 
 
+BOOTSTRAP_LOCK_RESOURCE = "enesa_bootstrap"
+BOOTSTRAP_LOCK_TIMEOUT_MS = 10000
+
+
 def bootstrap_database(db: Session) -> None:
-    Base.metadata.create_all(bind=engine)
-    _seed_admin_user(db)
+    if not engine.dialect.name.startswith("mssql"):
+        if not inspect(engine).has_table("users"):
+            Base.metadata.create_all(bind=engine)
+        _seed_admin_user(db)
+        return
+
+    # Fast path: once the schema exists every API/worker process skips the create_all reflection.
+    if db.execute(text("SELECT OBJECT_ID('dbo.users')")).scalar() is not None:
+        _seed_admin_user(db)
+        return
+
+    # Session-owned app lock on a dedicated connection so only one process runs the DDL + seed.
+    with engine.connect() as lock_conn:
+        _acquire_bootstrap_lock(lock_conn)
+        try:
+            if lock_conn.execute(text("SELECT OBJECT_ID('dbo.users')")).scalar() is None:
+                Base.metadata.create_all(bind=engine)
+            _seed_admin_user(db)
+        finally:
+            lock_conn.execute(
+                text("EXEC sp_releaseapplock @Resource = :resource, @LockOwner = 'Session';"),
+                {"resource": BOOTSTRAP_LOCK_RESOURCE},
+            )
+
+
+def _acquire_bootstrap_lock(conn: Connection) -> None:
+    row = conn.execute(
+        text(
+            """
+            DECLARE @result INT;
+            EXEC @result = sp_getapplock
+                @Resource = :resource,
+                @LockMode = 'Exclusive',
+                @LockOwner = 'Session',
+                @LockTimeout = :timeout_ms;
+            SELECT @result AS result;
+            """
+        ),
+        {"resource": BOOTSTRAP_LOCK_RESOURCE, "timeout_ms": BOOTSTRAP_LOCK_TIMEOUT_MS},
+    ).mappings().first()
+    if not row or row["result"] < 0:
+        raise RuntimeError("Could not acquire database bootstrap lock.")
 
 
 def _seed_admin_user(db: Session) -> None:
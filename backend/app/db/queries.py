@@ -0,0 +1,23 @@
+from __future__ import annotations
+
+from typing import Any
+
+from sqlalchemy import Select, exists, func, literal_column, select
+from sqlalchemy.orm import Session
+
+
+def exists_flag(db: Session, *criteria: Any) -> bool:
+    # SELECT 1 WHERE EXISTS (...) stops at the first matching row instead of counting them all.
+    return db.scalar(select(literal_column("1")).where(exists().where(*criteria))) is not None
+
+
+def fetch_page(db: Session, stmt: Select[Any], skip: int, limit: int) -> tuple[list[Any], int]:
+    # The total rides along as a window column, so a page costs one round trip.
+    rows = db.execute(stmt.add_columns(func.count().over().label("total")).offset(skip).limit(limit)).all()
+    if rows:
+        return [row[0] for row in rows], rows[0].total
+    if skip == 0:
+        return [], 0
+    # Past the last page there is no row to carry the window total.
+    total = db.scalar(stmt.with_only_columns(func.count(), maintain_column_froms=True).order_by(None))
+    return [], total or 0
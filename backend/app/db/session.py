@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import orjson
 from sqlalchemy import create_engine
 from sqlalchemy.orm import Session, sessionmaker
 
@@ -7,11 +8,22 @@ from app.core.config import get_settings
 
 settings = get_settings()
 
+
+# JSON columns (run parameters, required env keys) are encoded by orjson instead of the stdlib encoder.
+def _json_serializer(value: object) -> str:
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
 engine = create_engine(
     settings.sqlalchemy_database_uri,
     pool_pre_ping=True,
     pool_recycle=1800,
     future=True,
+    json_serializer=_json_serializer,
+    json_deserializer=orjson.loads,
+    insertmanyvalues_page_size=1000,
+    # pyodbc ships executemany batches (run log ingest) as one array-bound round trip.
+    fast_executemany=True,
 )
 
 SessionLocal = sessionmaker(bind=engine, class_=Session, autocommit=False, autoflush=False, expire_on_commit=False)
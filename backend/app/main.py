@@ -5,7 +5,7 @@ from pathlib import Path
 
 from fastapi import FastAPI, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import Response as FastAPIResponse
+from fastapi.responses import ORJSONResponse
 from starlette.middleware.trustedhost import TrustedHostMiddleware
 
 from app.api.v1.api import api_router
@@ -14,12 +14,13 @@ from app.core.logging import configure_logging
 from app.core.metrics import render_metrics
 from app.db.bootstrap import bootstrap_database
 from app.db.session import SessionLocal
+from app.services.run_service import drain_enqueue_tasks
 
 settings = get_settings()
 configure_logging(level=getattr(logging, settings.log_level.upper(), logging.INFO), log_format=settings.log_format)
 logger = logging.getLogger(__name__)
 
-app = FastAPI(title=settings.app_name, version="2.0.0")
+app = FastAPI(title=settings.app_name, version="2.0.0", default_response_class=ORJSONResponse)
 
 
 @app.middleware("http")
@@ -47,9 +48,13 @@ app.include_router(api_router, prefix=settings.api_v1_prefix)
 
 
 @app.get("/metrics", include_in_schema=False)
-def metrics() -> FastAPIResponse:
-    output, content_type = render_metrics()
-    return FastAPIResponse(content=output, media_type=content_type)
+def metrics(request: Request) -> Response:
+    rendered = render_metrics()
+    if request.headers.get("if-none-match") == rendered.etag:
+        return Response(status_code=304, headers={"etag": rendered.etag})
+    if "gzip" in request.headers.get("accept-encoding", ""):
+        return Response(content=rendered.gzip_body, headers=rendered.gzip_headers)
+    return Response(content=rendered.body, headers=rendered.headers)
 
 
 @app.on_event("startup")
@@ -62,3 +67,7 @@ def on_startup() -> None:
         db.close()
     logger.info("API startup complete")
 
+
+@app.on_event("shutdown")
+async def on_shutdown() -> None:
+    await drain_enqueue_tasks()
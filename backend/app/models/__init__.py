@@ -2,7 +2,17 @@ from app.models.artifact import Artifact
 from app.models.audit_event import AuditEvent
 from app.models.portal import Domain, Service
 from app.models.permission import Permission
-from app.models.robot import ArtifactType, EntryPointType, ReleaseChannel, Robot, RobotReleaseTag, RobotTag, RobotVersion
+from app.models.robot import (
+    ArtifactType,
+    EntryPointType,
+    ReleaseChannel,
+    Robot,
+    RobotReleaseTag,
+    RobotTag,
+    RobotVersion,
+    RobotVersionArgument,
+    RobotVersionEnvVar,
+)
 from app.models.robot_env_var import RobotEnvVar
 from app.models.scheduler import AlertEvent, AlertSeverity, AlertType, Schedule, SlaRule, TriggerType
 from app.models.run import Run, RunLog, RunStatus
@@ -24,6 +34,8 @@ __all__ = [
     "RobotReleaseTag",
     "RobotTag",
     "RobotVersion",
+    "RobotVersionArgument",
+    "RobotVersionEnvVar",
     "RobotEnvVar",
     "Run",
     "RunLog",
@@ -1,12 +1,12 @@
 from __future__ import annotations
 
 import uuid
-from datetime import datetime, timezone
+from datetime import datetime
 
 from sqlalchemy import JSON, DateTime, Integer, String, Uuid
 from sqlalchemy.orm import Mapped, mapped_column
 
-from app.models.base import Base
+from app.models.base import Base, _utcnow, utcnow
 
 
 class AuditEvent(Base):
@@ -18,6 +18,6 @@ class AuditEvent(Base):
     target_type: Mapped[str | None] = mapped_column(String(80), nullable=True, index=True)
     target_id: Mapped[str | None] = mapped_column(String(255), nullable=True, index=True)
     metadata_json: Mapped[dict] = mapped_column(JSON, nullable=False, default=dict)
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc), nullable=False, index=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=_utcnow, server_default=utcnow(), nullable=False, index=True)
     ip: Mapped[str | None] = mapped_column(String(64), nullable=True)
 
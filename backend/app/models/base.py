@@ -1,8 +1,53 @@
 from __future__ import annotations
 
+from datetime import datetime, timezone
+from enum import Enum
+
+from sqlalchemy import DateTime
+from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.sql.expression import FunctionElement
+
+
+_utc = timezone.utc
+_now = datetime.now
 
 
 class Base(DeclarativeBase):
     pass
 
+
+def _utcnow() -> datetime:
+    return _now(_utc)
+
+
+# Persist Enum members by value so the stored strings never depend on member names.
+def enum_values(enum_cls: type[Enum]) -> list[str]:
+    return [member.value for member in enum_cls]
+
+
+# Timestamp defaults are stamped by the database instead of per-row Python datetime calls.
+class utcnow(FunctionElement):
+    type = DateTime(timezone=True)
+    inherit_cache = True
+
+
+@compiles(utcnow)
+def _default_utcnow(element, compiler, **kw) -> str:
+    return "CURRENT_TIMESTAMP"
+
+
+@compiles(utcnow, "mssql")
+def _mssql_utcnow(element, compiler, **kw) -> str:
+    return "SYSDATETIMEOFFSET()"
+
+
+@compiles(utcnow, "postgresql")
+def _postgresql_utcnow(element, compiler, **kw) -> str:
+    return "TIMEZONE('utc', CURRENT_TIMESTAMP)"
+
+
+@compiles(utcnow, "sqlite")
+def _sqlite_utcnow(element, compiler, **kw) -> str:
+    # Millisecond precision padded to the six fractional digits SQLAlchemy parses back.
+    return "strftime('%Y-%m-%d %H:%M:%f000', 'now')"
@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+import os
+import time
+import uuid
+
+_TIMESTAMP_MASK = (1 << 48) - 1
+_VERSION_MASK = ~(0xF << 76)
+_VARIANT_MASK = ~(0x3 << 62)
+_VERSION_8 = 0x8 << 76
+_VARIANT_RFC = 0x2 << 62
+_CLEAR_MASK = _VERSION_MASK & _VARIANT_MASK
+_SET_BITS = _VERSION_8 | _VARIANT_RFC
+
+# Bound once: primary keys are minted per inserted row.
+_urandom = os.urandom
+_time_ns = time.time_ns
+_from_bytes = int.from_bytes
+_UUID = uuid.UUID
+
+
+def sequential_uuid() -> uuid.UUID:
+    """Time-ordered UUID for clustered SQL Server keys.
+
+    SQL Server orders ``uniqueidentifier`` values by their last six bytes first, so the
+    48-bit millisecond timestamp lives there (the layout NEWSEQUENTIALID produces) and new
+    rows append to the right edge of the index. The remaining bits are random and the
+    value is tagged as an RFC 9562 version 8 (custom layout) UUID.
+    """
+    value = (_from_bytes(_urandom(10), "big") << 48) | (_time_ns() // 1_000_000 & _TIMESTAMP_MASK)
+    return _UUID(int=value & _CLEAR_MASK | _SET_BITS)
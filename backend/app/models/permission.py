@@ -1,12 +1,12 @@
 from __future__ import annotations
 
 import uuid
-from datetime import datetime, timezone
+from datetime import datetime
 
 from sqlalchemy import DateTime, ForeignKey, Integer, String, Uuid
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from app.models.base import Base
+from app.models.base import Base, _utcnow, utcnow
 
 
 class Permission(Base):
@@ -18,6 +18,6 @@ class Permission(Base):
     resource_id: Mapped[uuid.UUID | None] = mapped_column(Uuid(as_uuid=True), nullable=True, index=True)
     scope_tag: Mapped[str | None] = mapped_column(String(100), nullable=True, index=True)
     action: Mapped[str] = mapped_column(String(80), nullable=False, index=True)
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc), nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=_utcnow, server_default=utcnow(), nullable=False)
 
     user: Mapped["User"] = relationship(back_populates="permissions")
@@ -1,22 +1,23 @@
 from __future__ import annotations
 
 import uuid
-from datetime import datetime, timezone
+from datetime import datetime
 
 from sqlalchemy import JSON, Boolean, DateTime, ForeignKey, String, Text, UniqueConstraint, Uuid
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from app.models.base import Base
+from app.models.base import Base, _utcnow, utcnow
+from app.models.ids import sequential_uuid
 
 
 class Domain(Base):
     __tablename__ = "domains"
 
-    id: Mapped[uuid.UUID] = mapped_column(Uuid(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(Uuid(as_uuid=True), primary_key=True, default=sequential_uuid)
     name: Mapped[str] = mapped_column(String(200), nullable=False, unique=True)
     slug: Mapped[str] = mapped_column(String(120), nullable=False, unique=True, index=True)
     description: Mapped[str | None] = mapped_column(Text, nullable=True)
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc), nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=_utcnow, server_default=utcnow(), nullable=False)
 
     services: Mapped[list["Service"]] = relationship(back_populates="domain", cascade="all, delete-orphan")
 
@@ -24,8 +25,10 @@ class Domain(Base):
 class Service(Base):
     __tablename__ = "services"
     __table_args__ = (UniqueConstraint("domain_id", "title", name="uq_services_domain_id_title"),)
+    # The onupdate timestamp comes back with the UPDATE itself instead of a follow-up SELECT.
+    __mapper_args__ = {"eager_defaults": True}
 
-    id: Mapped[uuid.UUID] = mapped_column(Uuid(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(Uuid(as_uuid=True), primary_key=True, default=sequential_uuid)
     domain_id: Mapped[uuid.UUID] = mapped_column(Uuid(as_uuid=True), ForeignKey("domains.id", ondelete="CASCADE"), nullable=False, index=True)
     robot_id: Mapped[uuid.UUID] = mapped_column(Uuid(as_uuid=True), ForeignKey("robots.id"), nullable=False, index=True)
     title: Mapped[str] = mapped_column(String(200), nullable=False)
@@ -36,11 +39,11 @@ class Service(Base):
     form_schema_json: Mapped[dict] = mapped_column(JSON, nullable=False, default=dict)
     run_template_json: Mapped[dict] = mapped_column(JSON, nullable=False, default=dict)
     created_by: Mapped[uuid.UUID | None] = mapped_column(Uuid(as_uuid=True), ForeignKey("users.id"), nullable=True)
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc), nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=_utcnow, server_default=utcnow(), nullable=False)
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
-        default=lambda: datetime.now(timezone.utc),
-        onupdate=lambda: datetime.now(timezone.utc),
+        default=_utcnow, server_default=utcnow(),
+        onupdate=utcnow(),
         nullable=False,
     )
 
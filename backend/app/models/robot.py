@@ -1,13 +1,15 @@
 from __future__ import annotations
 
 import uuid
-from datetime import datetime, timezone
+from datetime import datetime
 from enum import Enum
 
-from sqlalchemy import JSON, DateTime, ForeignKey, Integer, String, Text, UniqueConstraint, Uuid
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy import JSON, DateTime, ForeignKey, Index, Integer, String, Text, UniqueConstraint, Uuid
+from sqlalchemy import Enum as SAEnum
+from sqlalchemy.orm import Mapped, mapped_column, query_expression, relationship
 
-from app.models.base import Base
+from app.models.base import Base, _utcnow, enum_values, utcnow
+from app.models.ids import sequential_uuid
 
 
 class EntryPointType(str, Enum):
@@ -28,14 +30,16 @@ class ReleaseChannel(str, Enum):
 
 class Robot(Base):
     __tablename__ = "robots"
+    # The onupdate timestamp comes back with the UPDATE itself instead of a follow-up SELECT.
+    __mapper_args__ = {"eager_defaults": True}
 
-    id: Mapped[uuid.UUID] = mapped_column(Uuid(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(Uuid(as_uuid=True), primary_key=True, default=sequential_uuid)
     name: Mapped[str] = mapped_column(String(200), nullable=False, unique=True, index=True)
     description: Mapped[str | None] = mapped_column(Text, nullable=True)
     created_by: Mapped[uuid.UUID | None] = mapped_column(Uuid(as_uuid=True), ForeignKey("users.id"), nullable=True)
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc), nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=_utcnow, server_default=utcnow(), nullable=False)
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), default=lambda: datetime.now(timezone.utc), onupdate=lambda: datetime.now(timezone.utc), nullable=False
+        DateTime(timezone=True), default=_utcnow, server_default=utcnow(), onupdate=utcnow(), nullable=False
     )
 
     versions: Mapped[list["RobotVersion"]] = relationship(back_populates="robot", cascade="all, delete-orphan")
@@ -48,13 +52,16 @@ class Robot(Base):
     release_tags: Mapped[list["RobotReleaseTag"]] = relationship(back_populates="robot", cascade="all, delete-orphan")
     env_vars: Mapped[list["RobotEnvVar"]] = relationship(back_populates="robot", cascade="all, delete-orphan")
 
+    # Filled by list queries, which ship only the most recent versions; None wherever the full history is loaded.
+    version_count: Mapped[int | None] = query_expression()
+
 
 class RobotVersion(Base):
     __tablename__ = "robot_versions"
     __table_args__ = (UniqueConstraint("robot_id", "version", name="uq_robot_versions_robot_id_version"),)
 
-    id: Mapped[uuid.UUID] = mapped_column(Uuid(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    robot_id: Mapped[uuid.UUID] = mapped_column(Uuid(as_uuid=True), ForeignKey("robots.id", ondelete="CASCADE"), nullable=False, index=True)
+    id: Mapped[uuid.UUID] = mapped_column(Uuid(as_uuid=True), primary_key=True, default=sequential_uuid)
+    robot_id: Mapped[uuid.UUID] = mapped_column(Uuid(as_uuid=True), ForeignKey("robots.id", ondelete="CASCADE"), nullable=False)
     version: Mapped[str] = mapped_column(String(50), nullable=False)
     channel: Mapped[str] = mapped_column(String(20), nullable=False, default=ReleaseChannel.STABLE.value)
     artifact_type: Mapped[str] = mapped_column(String(20), nullable=False, default=ArtifactType.ZIP.value)
@@ -67,19 +74,71 @@ class RobotVersion(Base):
     created_source: Mapped[str] = mapped_column(String(50), nullable=False, default="user")
     required_env_keys_json: Mapped[list[str]] = mapped_column(JSON, nullable=False, default=list)
 
-    entrypoint_type: Mapped[str] = mapped_column(String(20), nullable=False, default=EntryPointType.PYTHON.value)
+    entrypoint_type: Mapped[EntryPointType] = mapped_column(
+        SAEnum(EntryPointType, name="entrypoint_type", native_enum=False, length=20, values_callable=enum_values),
+        nullable=False,
+        default=EntryPointType.PYTHON,
+    )
     entrypoint_path: Mapped[str] = mapped_column(String(1024), nullable=False, default="main.py")
-    arguments: Mapped[list[str]] = mapped_column(JSON, nullable=False, default=list)
-    env_vars: Mapped[dict[str, str]] = mapped_column(JSON, nullable=False, default=dict)
     working_directory: Mapped[str | None] = mapped_column(String(1024), nullable=True)
     checksum: Mapped[str | None] = mapped_column(String(255), nullable=True)
 
     created_by: Mapped[uuid.UUID | None] = mapped_column(Uuid(as_uuid=True), ForeignKey("users.id"), nullable=True)
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc), nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=_utcnow, server_default=utcnow(), nullable=False)
     is_active: Mapped[bool] = mapped_column(nullable=False, default=True)
 
     robot: Mapped["Robot"] = relationship(back_populates="versions")
-    runs: Mapped[list["Run"]] = relationship(back_populates="robot_version")
+    runs: Mapped[list["Run"]] = relationship(back_populates="robot_version", lazy="raise")
+    argument_items: Mapped[list["RobotVersionArgument"]] = relationship(
+        back_populates="robot_version",
+        cascade="all, delete-orphan",
+        lazy="selectin",
+        order_by="RobotVersionArgument.position",
+    )
+    env_var_items: Mapped[list["RobotVersionEnvVar"]] = relationship(
+        back_populates="robot_version", cascade="all, delete-orphan", lazy="selectin"
+    )
+
+    @property
+    def arguments(self) -> list[str]:
+        return [item.value for item in self.argument_items]
+
+    @arguments.setter
+    def arguments(self, values: list[str] | None) -> None:
+        self.argument_items = [RobotVersionArgument(position=index, value=value) for index, value in enumerate(values or [])]
+
+    @property
+    def env_vars(self) -> dict[str, str]:
+        return {item.key: item.value for item in self.env_var_items}
+
+    @env_vars.setter
+    def env_vars(self, values: dict[str, str] | None) -> None:
+        self.env_var_items = [RobotVersionEnvVar(key=key, value=value) for key, value in (values or {}).items()]
+
+
+class RobotVersionArgument(Base):
+    __tablename__ = "robot_version_arguments"
+
+    robot_version_id: Mapped[uuid.UUID] = mapped_column(
+        Uuid(as_uuid=True), ForeignKey("robot_versions.id", ondelete="CASCADE"), primary_key=True
+    )
+    position: Mapped[int] = mapped_column(Integer, primary_key=True)
+    value: Mapped[str] = mapped_column(Text, nullable=False)
+
+    robot_version: Mapped["RobotVersion"] = relationship(back_populates="argument_items")
+
+
+class RobotVersionEnvVar(Base):
+    __tablename__ = "robot_version_env_vars"
+    __table_args__ = (Index("IX_robot_version_env_vars_key", "key"),)
+
+    robot_version_id: Mapped[uuid.UUID] = mapped_column(
+        Uuid(as_uuid=True), ForeignKey("robot_versions.id", ondelete="CASCADE"), primary_key=True
+    )
+    key: Mapped[str] = mapped_column(String(150), primary_key=True)
+    value: Mapped[str] = mapped_column(Text, nullable=False)
+
+    robot_version: Mapped["RobotVersion"] = relationship(back_populates="env_var_items")
 
 
 class RobotTag(Base):
@@ -87,7 +146,7 @@ class RobotTag(Base):
     __table_args__ = (UniqueConstraint("robot_id", "tag", name="uq_robot_tags_robot_id_tag"),)
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
-    robot_id: Mapped[uuid.UUID] = mapped_column(Uuid(as_uuid=True), ForeignKey("robots.id", ondelete="CASCADE"), nullable=False, index=True)
+    robot_id: Mapped[uuid.UUID] = mapped_column(Uuid(as_uuid=True), ForeignKey("robots.id", ondelete="CASCADE"), nullable=False)
     tag: Mapped[str] = mapped_column(String(100), nullable=False, index=True)
 
     robot: Mapped["Robot"] = relationship(back_populates="tags")
@@ -98,8 +157,10 @@ class RobotReleaseTag(Base):
     __table_args__ = (UniqueConstraint("robot_id", "tag", name="uq_robot_release_tags_robot_tag"),)
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
-    robot_id: Mapped[uuid.UUID] = mapped_column(Uuid(as_uuid=True), ForeignKey("robots.id", ondelete="CASCADE"), nullable=False, index=True)
+    robot_id: Mapped[uuid.UUID] = mapped_column(Uuid(as_uuid=True), ForeignKey("robots.id", ondelete="CASCADE"), nullable=False)
     tag: Mapped[str] = mapped_column(String(30), nullable=False, index=True)
     version_id: Mapped[uuid.UUID] = mapped_column(Uuid(as_uuid=True), ForeignKey("robot_versions.id", ondelete="CASCADE"), nullable=False)
 
     robot: Mapped["Robot"] = relationship(back_populates="release_tags")
+    # Gives the unit of work the version -> release tag insert order when both are pending in one flush.
+    version: Mapped["RobotVersion"] = relationship()
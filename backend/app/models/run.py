@@ -1,13 +1,15 @@
 from __future__ import annotations
 
 import uuid
-from datetime import datetime, timezone
-from enum import Enum
+from datetime import datetime
+from enum import Enum, IntEnum
 
-from sqlalchemy import JSON, Boolean, DateTime, Float, ForeignKey, Integer, String, Text, Uuid
+from sqlalchemy import JSON, BigInteger, Boolean, DateTime, Float, ForeignKey, Index, Integer, SmallInteger, String, Text, TypeDecorator, Uuid, text
+from sqlalchemy import Enum as SAEnum
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from app.models.base import Base
+from app.models.base import Base, _utcnow, enum_values
+from app.models.ids import sequential_uuid
 from app.models.scheduler import TriggerType
 
 
@@ -19,19 +21,46 @@ class RunStatus(str, Enum):
     CANCELED = "CANCELED"
 
 
+class LogLevel(IntEnum):
+    DEBUG = 10
+    INFO = 20
+    WARN = 30
+    ERROR = 40
+
+
+# Stored as SMALLINT codes; the application, API and websocket payloads keep using level names.
+class LogLevelType(TypeDecorator):
+    impl = SmallInteger
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        if value is None or isinstance(value, int):
+            return value
+        return LogLevel[value].value
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        return LogLevel(value).name
+
+
 class Run(Base):
     __tablename__ = "runs"
 
-    run_id: Mapped[uuid.UUID] = mapped_column(Uuid(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    robot_id: Mapped[uuid.UUID] = mapped_column(Uuid(as_uuid=True), ForeignKey("robots.id"), nullable=False, index=True)
+    run_id: Mapped[uuid.UUID] = mapped_column(Uuid(as_uuid=True), primary_key=True, default=sequential_uuid)
+    robot_id: Mapped[uuid.UUID] = mapped_column(Uuid(as_uuid=True), ForeignKey("robots.id"), nullable=False)
     robot_version_id: Mapped[uuid.UUID] = mapped_column(Uuid(as_uuid=True), ForeignKey("robot_versions.id"), nullable=False, index=True)
     service_id: Mapped[uuid.UUID | None] = mapped_column(Uuid(as_uuid=True), ForeignKey("services.id"), nullable=True, index=True)
     schedule_id: Mapped[uuid.UUID | None] = mapped_column(Uuid(as_uuid=True), ForeignKey("schedules.id"), nullable=True, index=True)
     parameters_json: Mapped[dict | None] = mapped_column(JSON, nullable=True)
     trigger_type: Mapped[str] = mapped_column(String(20), nullable=False, default=TriggerType.MANUAL.value, index=True)
     attempt: Mapped[int] = mapped_column(Integer, nullable=False, default=1)
-    status: Mapped[str] = mapped_column(String(20), nullable=False, default=RunStatus.PENDING.value, index=True)
-    queued_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc), nullable=False)
+    status: Mapped[RunStatus] = mapped_column(
+        SAEnum(RunStatus, name="run_status", native_enum=False, length=20, values_callable=enum_values),
+        nullable=False,
+        default=RunStatus.PENDING,
+    )
+    queued_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=_utcnow, nullable=False)
     started_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
     finished_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
     duration_seconds: Mapped[float | None] = mapped_column(Float, nullable=True)
@@ -52,13 +81,44 @@ class Run(Base):
     artifacts: Mapped[list["Artifact"]] = relationship(back_populates="run", cascade="all, delete-orphan")
 
 
+# Serve the run list/dashboard filters (robot + status, newest first) and the scheduler's
+# active-run counts from the index; the leading columns replace the single-column indexes.
+Index(
+    "ix_runs_robot_status_queued",
+    Run.robot_id,
+    Run.status,
+    Run.queued_at.desc(),
+    mssql_include=["finished_at", "duration_seconds"],
+    postgresql_include=["finished_at", "duration_seconds"],
+)
+Index(
+    "ix_runs_status_queued",
+    Run.status,
+    Run.queued_at.desc(),
+    mssql_include=["finished_at", "duration_seconds"],
+    postgresql_include=["finished_at", "duration_seconds"],
+)
+
+
 class RunLog(Base):
     __tablename__ = "run_logs"
+    __table_args__ = (
+        Index("ix_run_logs_run_ts", "run_id", "timestamp"),
+        # Filtered index for "errors/warnings of run X" lookups.
+        Index(
+            "ix_run_logs_errors",
+            "run_id",
+            mssql_where=text("level >= 30"),
+            postgresql_where=text("level >= 30"),
+            sqlite_where=text("level >= 30"),
+        ),
+    )
 
-    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
-    run_id: Mapped[uuid.UUID] = mapped_column(Uuid(as_uuid=True), ForeignKey("runs.run_id", ondelete="CASCADE"), nullable=False, index=True)
-    timestamp: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc), nullable=False, index=True)
-    level: Mapped[str] = mapped_column(String(20), nullable=False, index=True)
+    # SQLite only autoincrements INTEGER PRIMARY KEY columns.
+    id: Mapped[int] = mapped_column(BigInteger().with_variant(Integer, "sqlite"), primary_key=True, autoincrement=True)
+    run_id: Mapped[uuid.UUID] = mapped_column(Uuid(as_uuid=True), ForeignKey("runs.run_id", ondelete="CASCADE"), nullable=False)
+    timestamp: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=_utcnow, nullable=False, index=True)
+    level: Mapped[str] = mapped_column(LogLevelType(), nullable=False)
     message: Mapped[str] = mapped_column(Text, nullable=False)
 
     run: Mapped["Run"] = relationship(back_populates="logs")
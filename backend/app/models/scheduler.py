@@ -1,13 +1,15 @@
 from __future__ import annotations
 
 import uuid
-from datetime import datetime, timezone
+from datetime import datetime
 from enum import Enum
 
 from sqlalchemy import JSON, Boolean, DateTime, ForeignKey, Integer, String, Text, Uuid
+from sqlalchemy import Enum as SAEnum
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from app.models.base import Base
+from app.models.base import Base, _utcnow, enum_values, utcnow
+from app.models.ids import sequential_uuid
 
 
 class TriggerType(str, Enum):
@@ -32,7 +34,7 @@ class AlertSeverity(str, Enum):
 class Schedule(Base):
     __tablename__ = "schedules"
 
-    id: Mapped[uuid.UUID] = mapped_column(Uuid(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(Uuid(as_uuid=True), primary_key=True, default=sequential_uuid)
     robot_id: Mapped[uuid.UUID] = mapped_column(Uuid(as_uuid=True), ForeignKey("robots.id", ondelete="CASCADE"), nullable=False, unique=True)
     enabled: Mapped[bool] = mapped_column(Boolean, nullable=False, default=True)
     cron_expr: Mapped[str] = mapped_column(String(120), nullable=False)
@@ -44,7 +46,7 @@ class Schedule(Base):
     retry_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
     retry_backoff_seconds: Mapped[int] = mapped_column(Integer, nullable=False, default=60)
     created_by: Mapped[uuid.UUID | None] = mapped_column(Uuid(as_uuid=True), ForeignKey("users.id"), nullable=True)
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc), nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=_utcnow, server_default=utcnow(), nullable=False)
 
     robot: Mapped["Robot"] = relationship(back_populates="schedule")
     runs: Mapped[list["Run"]] = relationship(back_populates="schedule")
@@ -52,8 +54,10 @@ class Schedule(Base):
 
 class SlaRule(Base):
     __tablename__ = "sla_rules"
+    # The onupdate timestamp comes back with the UPDATE itself instead of a follow-up SELECT.
+    __mapper_args__ = {"eager_defaults": True}
 
-    id: Mapped[uuid.UUID] = mapped_column(Uuid(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(Uuid(as_uuid=True), primary_key=True, default=sequential_uuid)
     robot_id: Mapped[uuid.UUID] = mapped_column(Uuid(as_uuid=True), ForeignKey("robots.id", ondelete="CASCADE"), nullable=False, unique=True)
     expected_run_every_minutes: Mapped[int | None] = mapped_column(Integer, nullable=True)
     expected_daily_time: Mapped[str | None] = mapped_column(String(5), nullable=True)
@@ -62,11 +66,11 @@ class SlaRule(Base):
     alert_on_late: Mapped[bool] = mapped_column(Boolean, nullable=False, default=True)
     notify_channels_json: Mapped[dict] = mapped_column(JSON, nullable=False, default=dict)
     created_by: Mapped[uuid.UUID | None] = mapped_column(Uuid(as_uuid=True), ForeignKey("users.id"), nullable=True)
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc), nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=_utcnow, server_default=utcnow(), nullable=False)
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
-        default=lambda: datetime.now(timezone.utc),
-        onupdate=lambda: datetime.now(timezone.utc),
+        default=_utcnow, server_default=utcnow(),
+        onupdate=utcnow(),
         nullable=False,
     )
 
@@ -76,14 +80,22 @@ class SlaRule(Base):
 class AlertEvent(Base):
     __tablename__ = "alert_events"
 
-    id: Mapped[uuid.UUID] = mapped_column(Uuid(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(Uuid(as_uuid=True), primary_key=True, default=sequential_uuid)
     robot_id: Mapped[uuid.UUID] = mapped_column(Uuid(as_uuid=True), ForeignKey("robots.id", ondelete="CASCADE"), nullable=False, index=True)
     run_id: Mapped[uuid.UUID | None] = mapped_column(Uuid(as_uuid=True), ForeignKey("runs.run_id"), nullable=True, index=True)
-    type: Mapped[str] = mapped_column(String(40), nullable=False, index=True)
-    severity: Mapped[str] = mapped_column(String(20), nullable=False, index=True)
+    type: Mapped[AlertType] = mapped_column(
+        SAEnum(AlertType, name="alert_type", native_enum=False, length=40, values_callable=enum_values),
+        nullable=False,
+        index=True,
+    )
+    severity: Mapped[AlertSeverity] = mapped_column(
+        SAEnum(AlertSeverity, name="alert_severity", native_enum=False, length=20, values_callable=enum_values),
+        nullable=False,
+        index=True,
+    )
     message: Mapped[str] = mapped_column(Text, nullable=False)
     metadata_json: Mapped[dict] = mapped_column(JSON, nullable=False, default=dict)
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc), nullable=False, index=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=_utcnow, server_default=utcnow(), nullable=False, index=True)
     resolved_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True, index=True)
 
     robot: Mapped["Robot"] = relationship(back_populates="alerts")
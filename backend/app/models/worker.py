@@ -1,13 +1,15 @@
 from __future__ import annotations
 
 import uuid
-from datetime import datetime, timezone
+from datetime import datetime
 from enum import Enum
 
 from sqlalchemy import DateTime, String, Uuid
+from sqlalchemy import Enum as SAEnum
 from sqlalchemy.orm import Mapped, mapped_column
 
-from app.models.base import Base
+from app.models.base import Base, _utcnow, enum_values, utcnow
+from app.models.ids import sequential_uuid
 
 
 class WorkerStatus(str, Enum):
@@ -19,9 +21,14 @@ class WorkerStatus(str, Enum):
 class Worker(Base):
     __tablename__ = "workers"
 
-    id: Mapped[uuid.UUID] = mapped_column(Uuid(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(Uuid(as_uuid=True), primary_key=True, default=sequential_uuid)
     hostname: Mapped[str] = mapped_column(String(255), nullable=False, index=True)
-    status: Mapped[str] = mapped_column(String(20), nullable=False, default=WorkerStatus.RUNNING.value, index=True)
-    last_heartbeat: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc), nullable=False, index=True)
+    status: Mapped[WorkerStatus] = mapped_column(
+        SAEnum(WorkerStatus, name="worker_status", native_enum=False, length=20, values_callable=enum_values),
+        nullable=False,
+        default=WorkerStatus.RUNNING,
+        index=True,
+    )
+    last_heartbeat: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=_utcnow, server_default=utcnow(), nullable=False, index=True)
     version: Mapped[str | None] = mapped_column(String(50), nullable=True)
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc), nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=_utcnow, server_default=utcnow(), nullable=False)
@@ -1,25 +1,73 @@
-from app.schemas.auth import AuthUser, Token
-from app.schemas.common import HealthResponse, Message
-from app.schemas.env_var import RobotEnvVarRead, RobotEnvVarUpsertRequest
-from app.schemas.permission import PermissionGrantRequest, PermissionRead
-from app.schemas.portal import DomainCreate, DomainRead, DomainUpdate, ServiceCreate, ServiceRead, ServiceRunRequest, ServiceUpdate
-from app.schemas.robot import (
-    RobotCreate,
-    RobotListResponse,
-    RobotRead,
-    RobotTagsUpdate,
-    RobotVersionCreate,
-    RobotVersionPublishResult,
-    RobotVersionRead,
-)
-from app.schemas.run import ArtifactRead, RunExecuteRequest, RunListResponse, RunLogRead, RunRead
-from app.schemas.scheduler import AlertEventRead, ScheduleCreate, ScheduleRead, ScheduleUpdate, SlaRuleCreate, SlaRuleRead, SlaRuleUpdate
-from app.schemas.user import UserCreate, UserRead
-from app.schemas.worker import OpsStatusRead, WorkerRead
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from app.schemas.auth import AuthUser, Token
+    from app.schemas.common import HealthResponse, Message
+    from app.schemas.env_var import RobotEnvVarRead, RobotEnvVarUpsertRequest
+    from app.schemas.permission import PermissionGrantRequest, PermissionRead
+    from app.schemas.portal import DomainCreate, DomainRead, DomainUpdate, ServiceCreate, ServiceRead, ServiceRunRequest, ServiceUpdate
+    from app.schemas.robot import (
+        RobotCreate,
+        RobotListResponse,
+        RobotRead,
+        RobotTagsUpdate,
+        RobotVersionCreate,
+        RobotVersionPublishResult,
+        RobotVersionRead,
+    )
+    from app.schemas.run import ArtifactRead, RunExecuteRequest, RunListResponse, RunLogRead, RunRead
+    from app.schemas.scheduler import AlertEventRead, ScheduleCreate, ScheduleRead, ScheduleUpdate, SlaRuleCreate, SlaRuleRead, SlaRuleUpdate
+    from app.schemas.user import UserCreate, UserRead
+    from app.schemas.worker import OpsStatusRead, WorkerRead
+
+# Schema modules are imported on first attribute access so processes only pay for the ones they use.
+_EXPORTS: dict[str, str] = {
+    "ArtifactRead": "app.schemas.run",
+    "AlertEventRead": "app.schemas.scheduler",
+    "AuthUser": "app.schemas.auth",
+    "DomainCreate": "app.schemas.portal",
+    "DomainRead": "app.schemas.portal",
+    "DomainUpdate": "app.schemas.portal",
+    "HealthResponse": "app.schemas.common",
+    "Message": "app.schemas.common",
+    "PermissionGrantRequest": "app.schemas.permission",
+    "PermissionRead": "app.schemas.permission",
+    "RobotEnvVarRead": "app.schemas.env_var",
+    "RobotEnvVarUpsertRequest": "app.schemas.env_var",
+    "RobotCreate": "app.schemas.robot",
+    "RobotListResponse": "app.schemas.robot",
+    "RobotRead": "app.schemas.robot",
+    "RobotTagsUpdate": "app.schemas.robot",
+    "RobotVersionCreate": "app.schemas.robot",
+    "RobotVersionPublishResult": "app.schemas.robot",
+    "RobotVersionRead": "app.schemas.robot",
+    "RunExecuteRequest": "app.schemas.run",
+    "RunListResponse": "app.schemas.run",
+    "RunLogRead": "app.schemas.run",
+    "RunRead": "app.schemas.run",
+    "ScheduleCreate": "app.schemas.scheduler",
+    "ScheduleRead": "app.schemas.scheduler",
+    "ScheduleUpdate": "app.schemas.scheduler",
+    "ServiceCreate": "app.schemas.portal",
+    "ServiceRead": "app.schemas.portal",
+    "ServiceRunRequest": "app.schemas.portal",
+    "ServiceUpdate": "app.schemas.portal",
+    "SlaRuleCreate": "app.schemas.scheduler",
+    "SlaRuleRead": "app.schemas.scheduler",
+    "SlaRuleUpdate": "app.schemas.scheduler",
+    "Token": "app.schemas.auth",
+    "UserCreate": "app.schemas.user",
+    "UserRead": "app.schemas.user",
+    "OpsStatusRead": "app.schemas.worker",
+    "WorkerRead": "app.schemas.worker",
+}
 
 __all__ = [
-    "ArtifactRead",
     "AlertEventRead",
+    "ArtifactRead",
     "AuthUser",
     "DomainCreate",
     "DomainRead",
@@ -57,3 +105,16 @@ __all__ = [
     "OpsStatusRead",
     "WorkerRead",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
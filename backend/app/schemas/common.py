@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from datetime import datetime
+from typing import Any, Self
 from uuid import UUID
 
 from pydantic import BaseModel, ConfigDict
@@ -9,6 +10,11 @@ from pydantic import BaseModel, ConfigDict
 class ORMModel(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
+    # Trusted ORM rows are already typed; build flat read models without re-validation.
+    @classmethod
+    def from_row(cls, row: Any) -> Self:
+        return cls.model_construct(**{name: getattr(row, name) for name in cls.model_fields})
+
 
 class Message(ORMModel):
     message: str
@@ -21,5 +27,7 @@ class HealthResponse(ORMModel):
 
 
 class UUIDResponse(ORMModel):
+    model_config = ConfigDict(defer_build=True)
+
     id: UUID
 
@@ -1,17 +1,23 @@
 from __future__ import annotations
 
+import string
+from collections.abc import Callable
 from datetime import date, datetime
 from typing import Any, Literal
 from uuid import UUID
 
-from pydantic import BaseModel, Field, model_validator
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, model_validator
 
 from app.schemas.common import ORMModel
 
 FIELD_TYPE_VALUES = {"text", "number", "date", "select", "checkbox"}
 
 
+# Form and template models are only validated on demand by portal_service, so their
+# validators are built on first use (defer_build) rather than at import.
 class FormFieldValidation(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     min: float | None = None
     max: float | None = None
     regex: str | None = None
@@ -24,11 +30,15 @@ class FormFieldValidation(BaseModel):
 
 
 class FormFieldOption(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     label: str = Field(..., min_length=1, max_length=120)
     value: str = Field(..., min_length=1, max_length=120)
 
 
 class FormFieldSchema(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     key: str = Field(..., min_length=1, max_length=80, pattern=r"^[a-zA-Z][a-zA-Z0-9_]*$")
     label: str = Field(..., min_length=1, max_length=120)
     type: Literal["text", "number", "date", "select", "checkbox"]
@@ -38,36 +48,77 @@ class FormFieldSchema(BaseModel):
     validation: FormFieldValidation | None = None
     options: list[FormFieldOption] | None = None
 
+    _valid_values: frozenset[str] = PrivateAttr(default=frozenset())
+
     @model_validator(mode="after")
     def validate_options(self) -> "FormFieldSchema":
         if self.type == "select":
             if not self.options:
                 raise ValueError(f"Field '{self.key}' of type 'select' requires non-empty options.")
+            self._valid_values = frozenset(option.value for option in self.options)
         elif self.options:
             raise ValueError(f"Field '{self.key}' only supports options when type is 'select'.")
         return self
 
 
 class ServiceFormSchema(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     fields: list[FormFieldSchema] = Field(default_factory=list)
 
     @model_validator(mode="after")
     def validate_unique_keys(self) -> "ServiceFormSchema":
+        keys = [field.key for field in self.fields]
+        if len(set(keys)) == len(keys):
+            return self
         seen: set[str] = set()
-        for field in self.fields:
-            if field.key in seen:
-                raise ValueError(f"Duplicate field key '{field.key}' in form schema.")
-            seen.add(field.key)
+        for key in keys:
+            if key in seen:
+                raise ValueError(f"Duplicate field key '{key}' in form schema.")
+            seen.add(key)
         return self
 
 
+# (literal, field name) pairs; None means the template needs the full str.format machinery.
+TemplateSegments = tuple[tuple[str, str | None], ...] | None
+
+_parse_format = string.Formatter().parse
+
+
+def compile_template(template: str) -> TemplateSegments:
+    try:
+        parsed = list(_parse_format(template))
+    except ValueError:
+        return None
+    segments: list[tuple[str, str | None]] = []
+    for literal, field_name, format_spec, conversion in parsed:
+        if field_name is not None and (format_spec or conversion or not field_name.isidentifier()):
+            return None
+        segments.append((literal, field_name))
+    return tuple(segments)
+
+
 class RunTemplateMapping(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     runtime_arguments: list[str] = Field(default_factory=list)
     runtime_env: dict[str, str] = Field(default_factory=dict)
     parameter_aliases: dict[str, str] = Field(default_factory=dict)
 
+    _compiled_arguments: tuple[TemplateSegments, ...] = PrivateAttr(default=())
+    _compiled_env: dict[str, TemplateSegments] = PrivateAttr(default_factory=dict)
+
+    @model_validator(mode="after")
+    def compile_templates(self) -> "RunTemplateMapping":
+        # Templates are fixed per service; parse them once instead of on every render.
+        self._compiled_arguments = tuple(compile_template(template) for template in self.runtime_arguments)
+        self._compiled_env = {key: compile_template(template) for key, template in self.runtime_env.items()}
+        return self
+
 
 class RunTemplateSchema(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     defaults: dict[str, Any] = Field(default_factory=dict)
     mapping: RunTemplateMapping = Field(default_factory=RunTemplateMapping)
 
@@ -137,60 +188,81 @@ class ServiceRunRequest(BaseModel):
 
 
 class ValidatedServiceParameters(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     resolved_parameters: dict[str, Any]
     runtime_arguments: list[str]
     runtime_env: dict[str, str]
 
 
-def coerce_field_value(field: FormFieldSchema, raw: Any) -> Any:
-    if raw is None:
-        return None
+_TRUE = frozenset({"true", "1", "yes", "y"})
+_FALSE = frozenset({"false", "0", "no", "n"})
 
-    if field.type == "text":
-        if not isinstance(raw, str):
-            raise ValueError(f"Field '{field.key}' must be text.")
-        return raw
 
-    if field.type == "number":
-        if isinstance(raw, bool):
-            raise ValueError(f"Field '{field.key}' must be a number.")
-        if isinstance(raw, (int, float)):
-            return float(raw)
-        if isinstance(raw, str):
-            try:
-                return float(raw)
-            except ValueError as exc:
-                raise ValueError(f"Field '{field.key}' must be a number.") from exc
+def _coerce_text(field: FormFieldSchema, raw: Any) -> str:
+    if not isinstance(raw, str):
+        raise ValueError(f"Field '{field.key}' must be text.")
+    return raw
+
+
+def _coerce_number(field: FormFieldSchema, raw: Any) -> float:
+    if isinstance(raw, bool):
         raise ValueError(f"Field '{field.key}' must be a number.")
+    if isinstance(raw, (int, float)):
+        return float(raw)
+    if isinstance(raw, str):
+        try:
+            return float(raw)
+        except ValueError as exc:
+            raise ValueError(f"Field '{field.key}' must be a number.") from exc
+    raise ValueError(f"Field '{field.key}' must be a number.")
+
+
+def _coerce_date(field: FormFieldSchema, raw: Any) -> str:
+    if isinstance(raw, date):
+        return raw.isoformat()
+    if isinstance(raw, str):
+        try:
+            parsed = date.fromisoformat(raw)
+        except ValueError as exc:
+            raise ValueError(f"Field '{field.key}' must be a date in format YYYY-MM-DD.") from exc
+        return parsed.isoformat()
+    raise ValueError(f"Field '{field.key}' must be a date in format YYYY-MM-DD.")
 
-    if field.type == "date":
-        if isinstance(raw, date):
-            return raw.isoformat()
-        if isinstance(raw, str):
-            try:
-                parsed = date.fromisoformat(raw)
-            except ValueError as exc:
-                raise ValueError(f"Field '{field.key}' must be a date in format YYYY-MM-DD.") from exc
-            return parsed.isoformat()
-        raise ValueError(f"Field '{field.key}' must be a date in format YYYY-MM-DD.")
-
-    if field.type == "checkbox":
-        if isinstance(raw, bool):
-            return raw
-        if isinstance(raw, str):
-            lowered = raw.strip().lower()
-            if lowered in {"true", "1", "yes", "y"}:
-                return True
-            if lowered in {"false", "0", "no", "n"}:
-                return False
-        raise ValueError(f"Field '{field.key}' must be true/false.")
-
-    if field.type == "select":
-        if not isinstance(raw, str):
-            raise ValueError(f"Field '{field.key}' must be a string option.")
-        valid_values = {option.value for option in field.options or []}
-        if raw not in valid_values:
-            raise ValueError(f"Field '{field.key}' contains an invalid option.")
+
+def _coerce_checkbox(field: FormFieldSchema, raw: Any) -> bool:
+    if isinstance(raw, bool):
         return raw
+    if isinstance(raw, str):
+        lowered = raw.strip().lower()
+        if lowered in _TRUE:
+            return True
+        if lowered in _FALSE:
+            return False
+    raise ValueError(f"Field '{field.key}' must be true/false.")
+
+
+def _coerce_select(field: FormFieldSchema, raw: Any) -> str:
+    if not isinstance(raw, str):
+        raise ValueError(f"Field '{field.key}' must be a string option.")
+    if raw not in field._valid_values:
+        raise ValueError(f"Field '{field.key}' contains an invalid option.")
+    return raw
+
+
+_COERCERS: dict[str, Callable[[FormFieldSchema, Any], Any]] = {
+    "text": _coerce_text,
+    "number": _coerce_number,
+    "date": _coerce_date,
+    "checkbox": _coerce_checkbox,
+    "select": _coerce_select,
+}
 
-    raise ValueError(f"Unsupported field type '{field.type}'.")
+
+def coerce_field_value(field: FormFieldSchema, raw: Any) -> Any:
+    if raw is None:
+        return None
+    coercer = _COERCERS.get(field.type)
+    if coercer is None:
+        raise ValueError(f"Unsupported field type '{field.type}'.")
+    return coercer(field, raw)
@@ -1,26 +1,39 @@
 from __future__ import annotations
 
+import re
 from datetime import datetime
+from typing import Annotated
 from uuid import UUID
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, StringConstraints
 
 from app.schemas.common import ORMModel
 
 SEMVER_REGEX = r"^(0|[1-9]\d*)\.(0|[1-9]\d*)\.(0|[1-9]\d*)(?:-[0-9A-Za-z.-]+)?(?:\+[0-9A-Za-z.-]+)?$"
+# Compiled once and shared with the python-re regex engine instead of rebuilt per field.
+SEMVER_RE = re.compile(SEMVER_REGEX, re.ASCII)
+
+SemverStr = Annotated[str, StringConstraints(pattern=SEMVER_RE, max_length=50)]
+EntrypointTypeStr = Annotated[str, StringConstraints(pattern=re.compile(r"^(PYTHON|EXE)$"))]
+ChannelStr = Annotated[str, StringConstraints(pattern=re.compile(r"^(stable|beta|hotfix)$"))]
+ArtifactTypeStr = Annotated[str, StringConstraints(pattern=re.compile(r"^(ZIP|EXE)$"))]
+PathStr = Annotated[str, StringConstraints(max_length=1024)]
+UrlPathStr = Annotated[str, StringConstraints(max_length=2048)]
 
 
 class RobotVersionBase(BaseModel):
-    version: str = Field(..., pattern=SEMVER_REGEX, max_length=50)
-    entrypoint_type: str = Field(default="PYTHON", pattern="^(PYTHON|EXE)$")
+    model_config = ConfigDict(regex_engine="python-re")
+
+    version: SemverStr
+    entrypoint_type: EntrypointTypeStr = "PYTHON"
     entrypoint_path: str = Field(default="main.py", min_length=1, max_length=1024)
     arguments: list[str] = Field(default_factory=list)
     env_vars: dict[str, str] = Field(default_factory=dict)
-    working_directory: str | None = Field(default=None, max_length=1024)
+    working_directory: PathStr | None = None
     checksum: str | None = Field(default=None, max_length=255)
-    channel: str = Field(default="stable", pattern="^(stable|beta|hotfix)$")
-    artifact_type: str = Field(default="ZIP", pattern="^(ZIP|EXE)$")
-    artifact_path: str | None = Field(default=None, max_length=2048)
+    channel: ChannelStr = "stable"
+    artifact_type: ArtifactTypeStr = "ZIP"
+    artifact_path: UrlPathStr | None = None
     artifact_sha256: str | None = Field(default=None, max_length=128)
     changelog: str | None = None
 
@@ -33,6 +46,8 @@ class RobotCreate(BaseModel):
 
 
 class RobotVersionCreate(RobotVersionBase):
+    model_config = ConfigDict(defer_build=True)
+
     is_active: bool = True
 
 
@@ -49,7 +64,7 @@ class RobotVersionPublishResult(ORMModel):
     branch: str | None
     build_url: str | None
     created_source: str
-    required_env_keys_json: list[str] = Field(default_factory=list)
+    required_env_keys_json: list[str]
     entrypoint_type: str
     entrypoint_path: str
     arguments: list[str]
@@ -64,39 +79,20 @@ class RobotTagsUpdate(BaseModel):
     tags: list[str] = Field(default_factory=list)
 
 
-class RobotVersionRead(ORMModel):
-    id: UUID
-    robot_id: UUID
-    version: str
-    channel: str
-    artifact_type: str
-    artifact_path: str | None
-    artifact_sha256: str | None
-    changelog: str | None
-    commit_sha: str | None
-    branch: str | None
-    build_url: str | None
-    created_source: str
-    required_env_keys_json: list[str] = Field(default_factory=list)
-    entrypoint_type: str
-    entrypoint_path: str
-    arguments: list[str]
-    env_vars: dict[str, str]
-    working_directory: str | None
+class RobotVersionRead(RobotVersionPublishResult):
     checksum: str | None
-    created_by: UUID | None
-    created_at: datetime
-    is_active: bool
 
 
 class RobotRead(ORMModel):
     id: UUID
     name: str
     description: str | None
-    tags: list[str] = Field(default_factory=list)
+    tags: list[str]
     created_at: datetime
     updated_at: datetime
+    # List pages embed only the most recent versions; version_count is the robot's full total.
     versions: list[RobotVersionRead]
+    version_count: int
 
 
 class RobotListResponse(ORMModel):
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
 from datetime import datetime
+from typing import Any
 from uuid import UUID
 
-from pydantic import BaseModel, Field
+import orjson
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
 
 from app.schemas.common import ORMModel
 
@@ -20,7 +22,12 @@ class RunExecuteRequest(BaseModel):
         return self.version_id or self.robot_version_id
 
 
-class ArtifactRead(ORMModel):
+# Small per-row value objects are immutable once built; list endpoints create thousands of them.
+class _FrozenRead(ORMModel):
+    model_config = ConfigDict(frozen=True)
+
+
+class ArtifactRead(_FrozenRead):
     id: UUID
     run_id: UUID
     artifact_name: str
@@ -30,7 +37,7 @@ class ArtifactRead(ORMModel):
     created_at: datetime
 
 
-class RunLogRead(ORMModel):
+class RunLogRead(_FrozenRead):
     id: int
     run_id: UUID
     timestamp: datetime
@@ -38,7 +45,7 @@ class RunLogRead(ORMModel):
     message: str
 
 
-class RunVersionSummary(ORMModel):
+class RunVersionSummary(_FrozenRead):
     id: UUID
     version: str
     channel: str
@@ -46,7 +53,7 @@ class RunVersionSummary(ORMModel):
     artifact_sha256: str | None
 
 
-class RunServiceSummary(ORMModel):
+class RunServiceSummary(_FrozenRead):
     id: UUID
     title: str
 
@@ -75,7 +82,21 @@ class RunRead(ORMModel):
     canceled_by: UUID | None
     robot_version: RunVersionSummary | None = None
     service: RunServiceSummary | None = None
-    artifacts: list[ArtifactRead] = Field(default_factory=list)
+    artifacts: list[ArtifactRead]
+
+    @classmethod
+    def from_row(cls, row: Any) -> RunRead:
+        version = row.robot_version
+        service = row.service
+        return cls.model_construct(
+            **{name: getattr(row, name) for name in _RUN_SCALAR_FIELDS},
+            robot_version=RunVersionSummary.from_row(version) if version is not None else None,
+            service=RunServiceSummary.from_row(service) if service is not None else None,
+            artifacts=[ArtifactRead.from_row(artifact) for artifact in row.artifacts],
+        )
+
+
+_RUN_SCALAR_FIELDS = tuple(name for name in RunRead.model_fields if name not in {"robot_version", "service", "artifacts"})
 
 
 class RunListResponse(ORMModel):
@@ -83,8 +104,19 @@ class RunListResponse(ORMModel):
     total: int
 
 
-class WebSocketLogMessage(ORMModel):
+# Built once at import so list endpoints validate whole pages with a single cached validator.
+RunLogReadListAdapter = TypeAdapter(list[RunLogRead])
+
+
+class WebSocketLogMessage(_FrozenRead):
+    model_config = ConfigDict(defer_build=True)
+
     run_id: UUID
     timestamp: datetime
     level: str
     message: str
+
+
+# Live log frames are encoded straight from the raw fields with orjson, one call per line.
+def dump_ws_log(run_id: str, timestamp: datetime, level: str, message: str) -> bytes:
+    return orjson.dumps({"run_id": run_id, "timestamp": timestamp, "level": level, "message": message})
@@ -1,31 +1,55 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Any
+from typing import Annotated, Any
 from uuid import UUID
 
-from pydantic import BaseModel, Field, model_validator
+from pydantic import AfterValidator, BaseModel, Field, model_validator
 
 from app.schemas.common import ORMModel
 
-TIME_PATTERN = r"^([01]\d|2[0-3]):[0-5]\d$"
+_DIGITS = "0123456789"
+
+
+# Fixed-width HH:MM (00:00-23:59) checked with direct comparisons instead of a regex.
+def _validate_hhmm(value: str) -> str:
+    if (
+        len(value) != 5
+        or value[2] != ":"
+        or value[1] not in _DIGITS
+        or value[4] not in _DIGITS
+        or value[3] not in "012345"
+        or not (value[0] in "01" or (value[0] == "2" and value[1] in "0123"))
+    ):
+        raise ValueError("Time must be in HH:MM format (00:00-23:59).")
+    return value
+
+
+TimeStr = Annotated[str, AfterValidator(_validate_hhmm)]
 
 
 class ScheduleBase(BaseModel):
     enabled: bool = True
     cron_expr: str = Field(..., min_length=5, max_length=120)
     timezone: str = Field(default="America/Sao_Paulo", min_length=3, max_length=80)
-    window_start: str | None = Field(default=None, pattern=TIME_PATTERN)
-    window_end: str | None = Field(default=None, pattern=TIME_PATTERN)
+    window_start: str | None = None
+    window_end: str | None = None
     max_concurrency: int = Field(default=1, ge=1, le=100)
     timeout_seconds: int = Field(default=3600, ge=1, le=86400)
     retry_count: int = Field(default=0, ge=0, le=10)
     retry_backoff_seconds: int = Field(default=60, ge=1, le=3600)
 
+    # Pairing and HH:MM format share one callback instead of one per window field.
     @model_validator(mode="after")
     def validate_window(self) -> "ScheduleBase":
-        if bool(self.window_start) ^ bool(self.window_end):
+        if self.window_start is None:
+            if self.window_end is not None:
+                raise ValueError("window_start and window_end must be informed together.")
+            return self
+        if self.window_end is None:
             raise ValueError("window_start and window_end must be informed together.")
+        _validate_hhmm(self.window_start)
+        _validate_hhmm(self.window_end)
         return self
 
 
@@ -37,8 +61,8 @@ class ScheduleUpdate(BaseModel):
     enabled: bool | None = None
     cron_expr: str | None = Field(default=None, min_length=5, max_length=120)
     timezone: str | None = Field(default=None, min_length=3, max_length=80)
-    window_start: str | None = Field(default=None, pattern=TIME_PATTERN)
-    window_end: str | None = Field(default=None, pattern=TIME_PATTERN)
+    window_start: TimeStr | None = None
+    window_end: TimeStr | None = None
     max_concurrency: int | None = Field(default=None, ge=1, le=100)
     timeout_seconds: int | None = Field(default=None, ge=1, le=86400)
     retry_count: int | None = Field(default=None, ge=0, le=10)
@@ -63,7 +87,7 @@ class ScheduleRead(ORMModel):
 
 class SlaRuleBase(BaseModel):
     expected_run_every_minutes: int | None = Field(default=None, ge=1, le=10080)
-    expected_daily_time: str | None = Field(default=None, pattern=TIME_PATTERN)
+    expected_daily_time: TimeStr | None = None
     late_after_minutes: int = Field(default=15, ge=1, le=720)
     alert_on_failure: bool = True
     alert_on_late: bool = True
@@ -82,7 +106,7 @@ class SlaRuleCreate(SlaRuleBase):
 
 class SlaRuleUpdate(BaseModel):
     expected_run_every_minutes: int | None = Field(default=None, ge=1, le=10080)
-    expected_daily_time: str | None = Field(default=None, pattern=TIME_PATTERN)
+    expected_daily_time: TimeStr | None = None
     late_after_minutes: int | None = Field(default=None, ge=1, le=720)
     alert_on_failure: bool | None = None
     alert_on_late: bool | None = None
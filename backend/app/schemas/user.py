@@ -1,12 +1,28 @@
 from __future__ import annotations
 
+import re
 from datetime import datetime
+from typing import Annotated
 from uuid import UUID
 
-from pydantic import BaseModel, EmailStr, Field
+from pydantic import AfterValidator, BaseModel, Field
 
 from app.schemas.common import ORMModel
 
+_EMAIL_MATCH = re.compile(r"[^@\s]+@[^@\s]+\.[^@\s]+").fullmatch
+
+
+# Bounded, linear check used instead of EmailStr's full RFC parser on the user-creation path.
+def _fast_email_check(value: str | None) -> str | None:
+    if value is None:
+        return None
+    if len(value) > 254 or value.count("@") != 1 or _EMAIL_MATCH(value) is None:
+        raise ValueError("Invalid email address.")
+    return value
+
+
+EmailAddress = Annotated[str | None, AfterValidator(_fast_email_check)]
+
 
 class UserRead(ORMModel):
     id: UUID
@@ -22,6 +38,6 @@ class UserRead(ORMModel):
 class UserCreate(BaseModel):
     username: str = Field(..., min_length=3, max_length=128)
     password: str = Field(..., min_length=8, max_length=128)
-    email: EmailStr | None = None
+    email: EmailAddress = None
     full_name: str | None = Field(default=None, max_length=255)
     is_superuser: bool = False
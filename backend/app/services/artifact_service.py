@@ -1,18 +1,20 @@
 from __future__ import annotations
 
-from pathlib import Path
 from uuid import UUID
 
-from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 from app.models.artifact import Artifact
 
 
 def get_artifact(db: Session, run_id: UUID, artifact_id: UUID) -> Artifact | None:
-    return db.scalar(select(Artifact).where(Artifact.run_id == run_id, Artifact.id == artifact_id))
+    artifact = db.get(Artifact, artifact_id)
+    if artifact is None or artifact.run_id != run_id:
+        return None
+    return artifact
 
 
-def resolve_artifact_path(artifact: Artifact) -> Path:
-    return Path(artifact.file_path)
+# FileResponse accepts plain strings; callers that need a Path can build one at the use site.
+def resolve_artifact_path(artifact: Artifact) -> str:
+    return artifact.file_path
 
@@ -10,10 +10,33 @@ from app.services.identity_service import Principal
 
 def extract_client_ip(x_forwarded_for: str | None, fallback: str | None) -> str | None:
     if x_forwarded_for:
-        return x_forwarded_for.split(",")[0].strip()
+        # Only the first hop is needed; slice it out instead of splitting the whole header.
+        comma = x_forwarded_for.find(",")
+        return (x_forwarded_for if comma < 0 else x_forwarded_for[:comma]).strip()
     return fallback
 
 
+def build_audit_event(
+    action: str,
+    principal: Principal | None,
+    actor_ip: str | None,
+    target_type: str | None = None,
+    target_id: str | None = None,
+    metadata: dict[str, Any] | None = None,
+) -> AuditEvent:
+    event = AuditEvent(
+        actor_user_id=principal.user.id if principal and principal.user else None,
+        action=action,
+        target_type=target_type,
+        target_id=target_id,
+        ip=actor_ip,
+    )
+    # Without metadata the column default fills in the empty object.
+    if metadata is not None:
+        event.metadata_json = metadata
+    return event
+
+
 def log_audit_event(
     db: Session,
     action: str,
@@ -22,17 +45,24 @@ def log_audit_event(
     target_type: str | None = None,
     target_id: str | None = None,
     metadata: dict[str, Any] | None = None,
+    commit: bool = True,
 ) -> None:
-    actor_user_id = principal.user.id if principal and principal.user else None
     db.add(
-        AuditEvent(
-            actor_user_id=actor_user_id,
+        build_audit_event(
             action=action,
+            principal=principal,
+            actor_ip=actor_ip,
             target_type=target_type,
             target_id=target_id,
-            metadata_json=metadata or {},
-            ip=actor_ip,
+            metadata=metadata,
         )
     )
-    db.commit()
+    if commit:
+        db.commit()
+
 
+def log_audit_events(db: Session, events: list[AuditEvent]) -> None:
+    if not events:
+        return
+    db.add_all(events)
+    db.commit()
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import base64
 from functools import lru_cache
 
 from cryptography.fernet import Fernet, InvalidToken
@@ -20,14 +21,31 @@ def _get_fernet() -> Fernet:
         raise ValueError("ENCRYPTION_KEY must be a valid Fernet key.") from exc
 
 
-def encrypt_value(value: str) -> str:
+# Fernet tokens are stored as raw bytes; the urlsafe base64 wrapper is only rebuilt for decryption.
+def encrypt_value(value: str) -> bytes:
     token = _get_fernet().encrypt(value.encode("utf-8"))
-    return token.decode("utf-8")
+    return base64.urlsafe_b64decode(token)
 
 
-def decrypt_value(value_encrypted: str) -> str:
+def encrypt_values(values: list[str]) -> list[bytes]:
+    # Batch form for bulk upserts: one Fernet lookup and bound methods for the whole list.
+    encrypt = _get_fernet().encrypt
+    decode = base64.urlsafe_b64decode
+    return [decode(encrypt(value.encode("utf-8"))) for value in values]
+
+
+def decrypt_value(value_encrypted: bytes) -> str:
     try:
-        plain = _get_fernet().decrypt(value_encrypted.encode("utf-8"))
+        plain = _get_fernet().decrypt(base64.urlsafe_b64encode(value_encrypted))
     except InvalidToken as exc:
         raise ValueError("Unable to decrypt secret value.") from exc
     return plain.decode("utf-8")
+
+
+def decrypt_values(values: list[bytes]) -> list[str]:
+    fernet = _get_fernet()
+    encode = base64.urlsafe_b64encode
+    try:
+        return [fernet.decrypt(encode(value)).decode("utf-8") for value in values]
+    except InvalidToken as exc:
+        raise ValueError("Unable to decrypt secret value.") from exc
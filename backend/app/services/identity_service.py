@@ -3,7 +3,8 @@ from __future__ import annotations
 import logging
 import secrets
 import uuid
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Any
 
 import jwt
@@ -23,7 +24,7 @@ from app.core.rbac import (
     Role,
     permissions_for_role,
 )
-from app.core.security import get_password_hash
+from app.core.security import LOCAL_TOKEN_ISSUER, get_password_hash
 from app.models.permission import Permission
 from app.models.user import User
 
@@ -31,24 +32,30 @@ settings = get_settings()
 logger = logging.getLogger(__name__)
 
 
-@dataclass(slots=True)
+@dataclass(frozen=True, slots=True)
 class Principal:
     subject: str
     auth_source: str
     role: Role
-    permissions: set[str]
+    permissions: frozenset[str]
     user: User | None = None
-    groups: set[str] | None = None
+    groups: frozenset[str] | None = None
     claims: dict[str, Any] | None = None
+    is_admin: bool = field(init=False)
 
-    @property
-    def is_admin(self) -> bool:
-        return self.role == Role.ADMIN or PERMISSION_ADMIN_MANAGE in self.permissions
+    def __post_init__(self) -> None:
+        # RBAC checks read this several times per request; compute it once.
+        object.__setattr__(self, "is_admin", self.role == Role.ADMIN or PERMISSION_ADMIN_MANAGE in self.permissions)
 
 
 class AzureTokenValidator:
     def __init__(self) -> None:
         self._jwks_client = PyJWKClient(settings.resolved_azure_jwks_url) if settings.resolved_azure_jwks_url else None
+        # Keys are immutable per kid, so resolved keys are memoized; rotated keys arrive under a new kid.
+        self._signing_key_for_kid = lru_cache(maxsize=1024)(self._fetch_signing_key)
+
+    def _fetch_signing_key(self, kid: str) -> Any:
+        return self._jwks_client.get_signing_key(kid).key
 
     def validate(self, token: str) -> dict[str, Any]:
         if not settings.azure_enabled:
@@ -57,10 +64,10 @@ class AzureTokenValidator:
             raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Azure JWKS URL is not configured.")
 
         try:
-            signing_key = self._jwks_client.get_signing_key_from_jwt(token)
+            signing_key = self._signing_key_for_kid(jwt.get_unverified_header(token)["kid"])
             return jwt.decode(
                 token,
-                signing_key.key,
+                signing_key,
                 algorithms=["RS256"],
                 audience=settings.azure_ad_audience,
                 issuer=settings.resolved_azure_issuer,
@@ -74,28 +81,69 @@ class AzureTokenValidator:
 azure_token_validator = AzureTokenValidator()
 
 
-def _role_from_groups(groups: set[str]) -> Role:
-    if groups & settings.azure_group_admin_list:
+def _role_from_groups(groups: frozenset[str]) -> Role:
+    # isdisjoint stops at the first shared group instead of materializing intersections.
+    if not groups:
+        return Role.VIEWER
+    if not groups.isdisjoint(settings.azure_group_admin_list):
         return Role.ADMIN
-    if groups & settings.azure_group_operator_list and groups & settings.azure_group_viewer_list:
+    if not groups.isdisjoint(settings.azure_group_operator_list):
         return Role.OPERATOR
-    if groups & settings.azure_group_operator_list:
+    return Role.VIEWER
+
+
+_KNOWN_ACTIONS = tuple(sorted(ALL_PERMISSIONS))
+
+
+@lru_cache(maxsize=2048)
+def _resolve_groups(groups: tuple[str, ...], admin_ids: str, operator_ids: str) -> tuple[frozenset[str], Role]:
+    # The group settings are part of the key so a settings change never serves a stale role.
+    group_set = frozenset(groups)
+    return group_set, _role_from_groups(group_set)
+
+
+# Each known action gets a bit so role derivation is a few integer tests per distinct permission set.
+_PERMISSION_BITS = {action: 1 << index for index, action in enumerate(_KNOWN_ACTIONS)}
+_ADMIN_MASK = _PERMISSION_BITS[PERMISSION_ADMIN_MANAGE] | _PERMISSION_BITS[PERMISSION_SERVICE_MANAGE]
+_PUBLISH_MASK = _PERMISSION_BITS[PERMISSION_ROBOT_PUBLISH]
+_RUN_MASK = _PERMISSION_BITS[PERMISSION_ROBOT_RUN] | _PERMISSION_BITS[PERMISSION_SERVICE_RUN]
+
+
+@lru_cache(maxsize=256)
+def _derive_role(base_role: Role, user_permissions: frozenset[str], grants_admin: bool) -> Role:
+    if base_role != Role.VIEWER:
+        return base_role
+    mask = 0
+    for action in user_permissions:
+        mask |= _PERMISSION_BITS.get(action, 0)
+    if grants_admin and mask & _ADMIN_MASK:
+        return Role.ADMIN
+    if mask & _PUBLISH_MASK:
+        return Role.MAINTAINER
+    if mask & _RUN_MASK:
         return Role.OPERATOR
-    if groups & settings.azure_group_viewer_list:
-        return Role.VIEWER
     return Role.VIEWER
 
 
-def _permissions_from_user_entries(db: Session, user_id: uuid.UUID) -> set[str]:
-    actions = db.scalars(select(Permission.action).where(Permission.user_id == user_id))
-    return {action for action in actions if action in ALL_PERMISSIONS}
+@lru_cache(maxsize=256)
+def _effective_permissions(role: Role, user_permissions: frozenset[str]) -> frozenset[str]:
+    return frozenset(permissions_for_role(role)) | user_permissions
 
 
-def _build_local_principal(db: Session, token: str) -> Principal | None:
-    from jose import jwt as jose_jwt
+def _permissions_from_user_entries(db: Session, user_id: uuid.UUID) -> frozenset[str]:
+    # Unknown legacy actions are filtered by the database instead of being fetched and discarded.
+    return frozenset(
+        db.scalars(
+            select(Permission.action)
+            .where(Permission.user_id == user_id, Permission.action.in_(_KNOWN_ACTIONS))
+            .distinct()
+        )
+    )
+
 
+def _build_local_principal(db: Session, token: str) -> Principal | None:
     try:
-        payload = jose_jwt.decode(token, settings.secret_key, algorithms=[settings.algorithm])
+        payload = jwt.decode(token, settings.secret_key, algorithms=[settings.algorithm])
         subject = payload.get("sub")
         if not subject:
             return None
@@ -108,24 +156,15 @@ def _build_local_principal(db: Session, token: str) -> Principal | None:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid local user token.")
 
     user_permissions = _permissions_from_user_entries(db=db, user_id=user.id)
-    role = (
-        Role.ADMIN
-        if user.is_superuser or PERMISSION_ADMIN_MANAGE in user_permissions or PERMISSION_SERVICE_MANAGE in user_permissions
-        else Role.VIEWER
-    )
-    if role == Role.VIEWER and PERMISSION_ROBOT_PUBLISH in user_permissions:
-        role = Role.MAINTAINER
-    elif role == Role.VIEWER and (PERMISSION_ROBOT_RUN in user_permissions or PERMISSION_SERVICE_RUN in user_permissions):
-        role = Role.OPERATOR
+    role = _derive_role(Role.ADMIN if user.is_superuser else Role.VIEWER, user_permissions, True)
 
-    effective_permissions = permissions_for_role(role) | user_permissions
     return Principal(
         subject=str(user.id),
         auth_source="local",
         role=role,
-        permissions=effective_permissions,
+        permissions=_effective_permissions(role, user_permissions),
         user=user,
-        groups=set(),
+        groups=frozenset(),
         claims=payload,
     )
 
@@ -169,33 +208,47 @@ def _build_azure_principal(db: Session, token: str) -> Principal | None:
         return None
 
     payload = azure_token_validator.validate(token)
-    groups = set(payload.get("groups", []))
-    role = _role_from_groups(groups)
+    groups, role = _resolve_groups(
+        tuple(payload.get("groups", ())), settings.azure_ad_group_admin_ids, settings.azure_ad_group_operator_ids
+    )
 
     user = _resolve_or_create_azure_user(db=db, payload=payload)
-    user_permissions = _permissions_from_user_entries(db, user.id) if user else set()
-    if role == Role.VIEWER and PERMISSION_ROBOT_PUBLISH in user_permissions:
-        role = Role.MAINTAINER
-    elif role == Role.VIEWER and (PERMISSION_ROBOT_RUN in user_permissions or PERMISSION_SERVICE_RUN in user_permissions):
-        role = Role.OPERATOR
-    effective_permissions = permissions_for_role(role) | user_permissions
+    user_permissions = _permissions_from_user_entries(db, user.id) if user else frozenset()
+    role = _derive_role(role, user_permissions, False)
 
     subject = str(payload.get("oid") or payload.get("sub"))
     return Principal(
         subject=subject,
         auth_source="azure_ad",
         role=role,
-        permissions=effective_permissions,
+        permissions=_effective_permissions(role, user_permissions),
         user=user,
         groups=groups,
         claims=payload,
     )
 
 
+def _unverified_issuer(token: str) -> str | None:
+    try:
+        return jwt.decode(token, options={"verify_signature": False}).get("iss")
+    except jwt.PyJWTError:
+        return None
+
+
 def authenticate_token(db: Session, token: str) -> Principal:
     local_first = settings.auth_mode in {"hybrid", "local"}
     azure_enabled = settings.auth_mode in {"hybrid", "azure"} and settings.azure_enabled
 
+    # Route by the unverified issuer so each token is verified only by the decoder that issued it.
+    issuer = _unverified_issuer(token)
+    if azure_enabled and issuer is not None and issuer == settings.resolved_azure_issuer:
+        azure_principal = _build_azure_principal(db=db, token=token)
+        if azure_principal:
+            return azure_principal
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Token is invalid or unsupported.")
+    if issuer == LOCAL_TOKEN_ISSUER:
+        azure_enabled = False
+
     if local_first and settings.allow_local_auth:
         local_principal = _build_local_principal(db=db, token=token)
         if local_principal:
@@ -2,13 +2,16 @@ from __future__ import annotations
 
 import re
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any
 from uuid import UUID
 
+import orjson
 from pydantic import ValidationError
-from sqlalchemy import Select, func, select
+from sqlalchemy import Select, null, select
 from sqlalchemy.orm import Session, joinedload
 
+from app.db.queries import exists_flag, fetch_page
 from app.models.portal import Domain, Service
 from app.models.robot import Robot, RobotVersion
 from app.models.run import Run
@@ -19,6 +22,7 @@ from app.schemas.portal import (
     ServiceCreate,
     ServiceFormSchema,
     ServiceUpdate,
+    TemplateSegments,
     ValidatedServiceParameters,
     coerce_field_value,
 )
@@ -56,6 +60,36 @@ def validate_run_template(raw_template: dict[str, Any]) -> RunTemplateSchema:
         raise ValueError(f"Invalid run_template_json: {exc}") from exc
 
 
+# Service rows re-send the same stored JSON on every execution; validated schemas are cached by
+# their canonical encoding so a schema edit is a new key and never serves a stale model.
+@lru_cache(maxsize=1024)
+def _cached_form_schema(raw_schema: bytes) -> ServiceFormSchema:
+    return validate_form_schema(orjson.loads(raw_schema))
+
+
+@lru_cache(maxsize=1024)
+def _cached_run_template(raw_template: bytes) -> RunTemplateSchema:
+    return validate_run_template(orjson.loads(raw_template))
+
+
+# Executions without user input always resolve to the same defaults for a given schema pair. The cached
+# model is never handed out; callers get a deep copy so run rows, audit metadata and queue payloads
+# never share mutable dicts and lists across executions.
+def _default_parameters(form_key: bytes, template_key: bytes) -> ValidatedServiceParameters:
+    return _cached_default_parameters(form_key, template_key).model_copy(deep=True)
+
+
+@lru_cache(maxsize=1024)
+def _cached_default_parameters(form_key: bytes, template_key: bytes) -> ValidatedServiceParameters:
+    return validate_service_parameters(
+        form_schema=_cached_form_schema(form_key), run_template=_cached_run_template(template_key), parameters={}
+    )
+
+
+def _schema_key(raw: dict[str, Any] | None) -> bytes:
+    return orjson.dumps(raw or {}, option=orjson.OPT_SORT_KEYS)
+
+
 def validate_service_parameters(
     form_schema: ServiceFormSchema,
     run_template: RunTemplateSchema,
@@ -83,20 +117,21 @@ def validate_service_parameters(
     runtime_arguments: list[str] = []
     runtime_env: dict[str, str] = {}
 
-    aliased_values = {
-        run_template.mapping.parameter_aliases.get(key, key): value
-        for key, value in resolved.items()
-    }
-    format_context = {
-        **{key: _stringify(value) for key, value in resolved.items()},
-        **{key: _stringify(value) for key, value in aliased_values.items()},
-    }
+    # Each value is stringified once; aliases then overwrite in order, as the merged dicts did.
+    format_context = {key: _stringify(value) for key, value in resolved.items()}
+    aliases = run_template.mapping.parameter_aliases
+    if aliases:
+        alias_for = aliases.get
+        for key, text_value in list(format_context.items()):
+            format_context[alias_for(key, key)] = text_value
 
-    for template in run_template.mapping.runtime_arguments:
-        runtime_arguments.append(_render_template(template, format_context))
+    mapping = run_template.mapping
+    for template, segments in zip(mapping.runtime_arguments, mapping._compiled_arguments):
+        runtime_arguments.append(_render_template(template, format_context, segments))
 
-    for env_key, env_template in run_template.mapping.runtime_env.items():
-        runtime_env[env_key] = _render_template(env_template, format_context)
+    compiled_env = mapping._compiled_env
+    for env_key, env_template in mapping.runtime_env.items():
+        runtime_env[env_key] = _render_template(env_template, format_context, compiled_env.get(env_key))
 
     return ValidatedServiceParameters(
         resolved_parameters=resolved,
@@ -122,9 +157,7 @@ def create_domain(db: Session, payload: DomainCreate) -> Domain:
 
 
 def list_domains(db: Session, skip: int = 0, limit: int = 100) -> tuple[list[Domain], int]:
-    total = db.scalar(select(func.count()).select_from(Domain)) or 0
-    items = list(db.scalars(_domain_query().offset(skip).limit(limit)))
-    return items, total
+    return fetch_page(db, _domain_query(), skip, limit)
 
 
 def get_domain_by_id(db: Session, domain_id: UUID) -> Domain | None:
@@ -168,8 +201,7 @@ def delete_domain(db: Session, domain_id: UUID) -> None:
     domain = get_domain_by_id(db=db, domain_id=domain_id)
     if not domain:
         raise ValueError("Domain not found.")
-    linked_services = db.scalar(select(func.count()).select_from(Service).where(Service.domain_id == domain_id)) or 0
-    if linked_services > 0:
+    if exists_flag(db, Service.domain_id == domain_id):
         raise ValueError("Domain has linked services. Remove or move services before deleting the domain.")
     db.delete(domain)
     db.commit()
@@ -207,9 +239,11 @@ def create_service(db: Session, payload: ServiceCreate, created_by: UUID | None)
         created_by=created_by,
     )
     db.add(service)
+    db.flush()
+    service_id = service.id
     db.commit()
-    db.refresh(service)
-    return get_service(db=db, service_id=service.id) or service
+    # The eager-loading fetch repopulates the expired instance; a separate refresh would be a second SELECT.
+    return get_service(db=db, service_id=service_id) or service
 
 
 def list_services(
@@ -220,18 +254,11 @@ def list_services(
     enabled_only: bool | None = None,
 ) -> tuple[list[Service], int]:
     stmt = _service_query()
-    count_stmt = select(func.count()).select_from(Service)
-
     if domain_id:
         stmt = stmt.where(Service.domain_id == domain_id)
-        count_stmt = count_stmt.where(Service.domain_id == domain_id)
     if enabled_only is True:
         stmt = stmt.where(Service.enabled.is_(True))
-        count_stmt = count_stmt.where(Service.enabled.is_(True))
-
-    total = db.scalar(count_stmt) or 0
-    items = list(db.scalars(stmt.offset(skip).limit(limit)))
-    return items, total
+    return fetch_page(db, stmt, skip, limit)
 
 
 def list_services_by_domain_slug(db: Session, slug: str, enabled_only: bool = True) -> tuple[Domain, list[Service]]:
@@ -305,16 +332,14 @@ def update_service(db: Session, service_id: UUID, payload: ServiceUpdate) -> Ser
         service.default_version_id = payload.default_version_id
 
     db.commit()
-    db.refresh(service)
-    return get_service(db=db, service_id=service.id) or service
+    return get_service(db=db, service_id=service_id) or service
 
 
 def delete_service(db: Session, service_id: UUID) -> None:
     service = get_service(db=db, service_id=service_id)
     if not service:
         raise ValueError("Service not found.")
-    linked_runs = db.scalar(select(func.count()).select_from(Run).where(Run.service_id == service_id)) or 0
-    if linked_runs > 0:
+    if exists_flag(db, Run.service_id == service_id):
         raise ValueError("Service has historical runs and cannot be deleted. Disable it instead.")
     db.delete(service)
     db.commit()
@@ -332,9 +357,15 @@ async def execute_service(
     if not service.enabled:
         raise ValueError("Service is currently disabled.")
 
-    form_schema = validate_form_schema(service.form_schema_json)
-    run_template = validate_run_template(service.run_template_json)
-    validated = validate_service_parameters(form_schema=form_schema, run_template=run_template, parameters=parameters)
+    form_key = _schema_key(service.form_schema_json)
+    template_key = _schema_key(service.run_template_json)
+    run_template = _cached_run_template(template_key)
+    if parameters:
+        validated = validate_service_parameters(
+            form_schema=_cached_form_schema(form_key), run_template=run_template, parameters=parameters
+        )
+    else:
+        validated = _default_parameters(form_key, template_key)
     env_name = str(run_template.defaults.get("env_name", "PROD")).upper()
 
     payload = RunExecuteRequest(
@@ -350,6 +381,7 @@ async def execute_service(
         triggered_by=triggered_by,
         service_id=service.id,
         parameters_json=validated.resolved_parameters,
+        hydrate=True,
     )
     return ServiceExecutionResult(run=run, validated_parameters=validated.resolved_parameters)
 
@@ -365,16 +397,25 @@ def _validate_service_references(
     robot_id: UUID,
     default_version_id: UUID | None,
 ) -> None:
-    domain_exists = db.scalar(select(func.count()).select_from(Domain).where(Domain.id == domain_id))
-    if not domain_exists:
+    # All three references are resolved by scalar subqueries in one round trip.
+    version_robot_id = (
+        select(RobotVersion.robot_id).where(RobotVersion.id == default_version_id).scalar_subquery()
+        if default_version_id is not None
+        else null()
+    )
+    row = db.execute(
+        select(
+            select(Domain.id).where(Domain.id == domain_id).scalar_subquery(),
+            select(Robot.id).where(Robot.id == robot_id).scalar_subquery(),
+            version_robot_id,
+        )
+    ).one()
+    if row[0] is None:
         raise ValueError("Domain not found.")
-    robot_exists = db.scalar(select(func.count()).select_from(Robot).where(Robot.id == robot_id))
-    if not robot_exists:
+    if row[1] is None:
         raise ValueError("Robot not found.")
-    if default_version_id is not None:
-        version = db.scalar(select(RobotVersion).where(RobotVersion.id == default_version_id))
-        if not version or version.robot_id != robot_id:
-            raise ValueError("default_version_id must belong to the selected robot.")
+    if default_version_id is not None and row[2] != robot_id:
+        raise ValueError("default_version_id must belong to the selected robot.")
 
 
 def _validate_slug(slug: str) -> None:
@@ -382,6 +423,11 @@ def _validate_slug(slug: str) -> None:
         raise ValueError("Invalid slug format. Use lowercase and hyphen, example: dp-rh.")
 
 
+@lru_cache(maxsize=2048)
+def _compiled_regex(pattern: str) -> re.Pattern[str]:
+    return re.compile(pattern)
+
+
 def _validate_business_rules(field, value: Any) -> None:
     rules = field.validation
     if not rules:
@@ -392,7 +438,7 @@ def _validate_business_rules(field, value: Any) -> None:
             raise ValueError(f"Field '{field.label}' must contain at least {int(rules.min)} characters.")
         if rules.max is not None and len(value) > rules.max:
             raise ValueError(f"Field '{field.label}' must contain at most {int(rules.max)} characters.")
-        if rules.regex and not re.fullmatch(rules.regex, value):
+        if rules.regex and not _compiled_regex(rules.regex).fullmatch(value):
             raise ValueError(f"Field '{field.label}' has invalid format.")
     elif isinstance(value, (int, float)):
         if rules.min is not None and value < rules.min:
@@ -414,8 +460,10 @@ class _StrictFormatDict(dict[str, str]):
         raise KeyError(key)
 
 
-def _render_template(template: str, context: dict[str, str]) -> str:
+def _render_template(template: str, context: dict[str, str], segments: TemplateSegments = None) -> str:
     try:
-        return template.format_map(_StrictFormatDict(context))
+        if segments is None:
+            return template.format_map(_StrictFormatDict(context))
+        return "".join(literal if field_name is None else literal + context[field_name] for literal, field_name in segments)
     except KeyError as exc:
         raise ValueError(f"run_template_json references unknown field '{exc.args[0]}'.") from exc
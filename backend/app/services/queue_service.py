@@ -1,19 +1,47 @@
 from __future__ import annotations
 
-import json
 import time
 from typing import Any
 
+import orjson
 from redis import Redis
+from redis.asyncio import BlockingConnectionPool as AsyncBlockingConnectionPool
+from redis.asyncio import ConnectionPool as AsyncConnectionPool
 from redis.asyncio import Redis as AsyncRedis
+from redis.asyncio.client import PubSub as AsyncPubSub
 
 from app.core.config import get_settings
 from app.core.metrics import queue_depth
 
 settings = get_settings()
 
+# API-side pools are built once at import (no connection is opened until first use) and capped, so
+# bursts wait for a free connection instead of opening unbounded sockets. Client creation below has
+# no await between check and assignment, so the lazy singletons cannot race on the event loop.
+_async_pool = AsyncBlockingConnectionPool.from_url(
+    settings.redis_url,
+    max_connections=settings.redis_max_connections,
+    encoding="utf-8",
+    decode_responses=True,
+)
+_async_raw_pool = AsyncBlockingConnectionPool.from_url(
+    settings.redis_url,
+    max_connections=settings.redis_max_connections,
+    decode_responses=False,
+)
+# A subscribed connection stays checked out for as long as its log viewer is connected, so pub/sub
+# gets its own uncapped pool; sharing the capped one would let open viewers starve heartbeats and queue calls.
+_async_pubsub_pool = AsyncConnectionPool.from_url(
+    settings.redis_url,
+    encoding="utf-8",
+    decode_responses=True,
+)
+
 _async_redis: AsyncRedis | None = None
 _sync_redis: Redis | None = None
+# Byte-level clients for queue payloads: orjson bytes go out and come back without a UTF-8 round trip.
+_async_redis_raw: AsyncRedis | None = None
+_sync_redis_raw: Redis | None = None
 
 
 def get_run_log_channel(run_id: str) -> str:
@@ -23,10 +51,14 @@ def get_run_log_channel(run_id: str) -> str:
 async def get_async_redis() -> AsyncRedis:
     global _async_redis
     if _async_redis is None:
-        _async_redis = AsyncRedis.from_url(settings.redis_url, encoding="utf-8", decode_responses=True)
+        _async_redis = AsyncRedis(connection_pool=_async_pool)
     return _async_redis
 
 
+def get_async_pubsub() -> AsyncPubSub:
+    return AsyncRedis(connection_pool=_async_pubsub_pool).pubsub()
+
+
 def get_sync_redis() -> Redis:
     global _sync_redis
     if _sync_redis is None:
@@ -34,16 +66,33 @@ def get_sync_redis() -> Redis:
     return _sync_redis
 
 
+async def get_async_redis_raw() -> AsyncRedis:
+    global _async_redis_raw
+    if _async_redis_raw is None:
+        _async_redis_raw = AsyncRedis(connection_pool=_async_raw_pool)
+    return _async_redis_raw
+
+
+def get_sync_redis_raw() -> Redis:
+    global _sync_redis_raw
+    if _sync_redis_raw is None:
+        _sync_redis_raw = Redis.from_url(settings.redis_url, decode_responses=False)
+    return _sync_redis_raw
+
+
 async def enqueue_run(payload: dict[str, Any]) -> None:
-    redis = await get_async_redis()
-    await redis.lpush(settings.redis_queue_name, json.dumps(payload))
-    depth = await redis.llen(settings.redis_queue_name)
+    redis = await get_async_redis_raw()
+    # One round trip for the push and the depth read.
+    async with redis.pipeline(transaction=False) as pipe:
+        pipe.lpush(settings.redis_queue_name, orjson.dumps(payload))
+        pipe.llen(settings.redis_queue_name)
+        _, depth = await pipe.execute()
     queue_depth.set(depth)
 
 
 async def publish_run_log(run_id: str, payload: dict[str, Any]) -> None:
-    redis = await get_async_redis()
-    await redis.publish(get_run_log_channel(run_id), json.dumps(payload, default=str))
+    redis = await get_async_redis_raw()
+    await redis.publish(get_run_log_channel(run_id), orjson.dumps(payload, default=str))
 
 
 def refresh_queue_depth_sync() -> int:
@@ -72,17 +121,20 @@ def register_worker_heartbeat(worker_name: str, ttl_seconds: int = 180) -> None:
 def list_worker_heartbeats() -> dict[str, float]:
     try:
         redis = get_sync_redis()
-        keys = redis.keys(f"{settings.redis_worker_heartbeat_prefix}:*")
+        prefix = f"{settings.redis_worker_heartbeat_prefix}:"
+        # SCAN avoids blocking the server on KEYS; one MGET replaces a GET per worker.
+        keys = list(redis.scan_iter(match=f"{prefix}*", count=500))
+        if not keys:
+            return {}
         output: dict[str, float] = {}
-        for key in keys:
-            value = redis.get(key)
+        for key, value in zip(keys, redis.mget(keys)):
             if value is None:
                 continue
             try:
                 ts = float(value)
             except ValueError:
                 continue
-            worker_name = key.replace(f"{settings.redis_worker_heartbeat_prefix}:", "", 1)
+            worker_name = key.replace(prefix, "", 1)
             output[worker_name] = ts
         return output
     except Exception:  # noqa: BLE001
@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
-from pathlib import Path
 
 from sqlalchemy import delete, select
 from sqlalchemy.orm import Session
@@ -12,6 +14,7 @@ from app.models.artifact import Artifact
 from app.models.run import RunLog
 
 settings = get_settings()
+logger = logging.getLogger(__name__)
 
 
 @dataclass(slots=True)
@@ -19,6 +22,25 @@ class CleanupResult:
     removed_log_rows: int
     removed_artifact_rows: int
     removed_artifact_files: int
+    failed_artifact_files: int
+
+
+_UNLINK_WORKERS = 16
+_LOG_DELETE_BATCH_SIZE = 10_000
+
+
+def _remove_artifact_file(file_path: str) -> bool | None:
+    # True when removed, False when already gone, None when the unlink failed. unlink reports missing
+    # paths itself, so a stat beforehand only adds a syscall.
+    try:
+        os.unlink(file_path)
+    except FileNotFoundError:
+        return False
+    except OSError:
+        # The row is already deleted, so this log line is the only record of the orphaned file.
+        logger.exception("Failed to remove artifact file %s", file_path)
+        return None
+    return True
 
 
 def execute_retention_cleanup(db: Session) -> CleanupResult:
@@ -26,21 +48,36 @@ def execute_retention_cleanup(db: Session) -> CleanupResult:
     log_cutoff = now - timedelta(days=settings.log_retention_days)
     artifact_cutoff = now - timedelta(days=settings.artifact_retention_days)
 
-    artifact_rows = list(db.scalars(select(Artifact).where(Artifact.created_at < artifact_cutoff)))
-    removed_files = 0
-    for artifact in artifact_rows:
-        path = Path(artifact.file_path)
-        if path.exists() and path.is_file():
-            path.unlink(missing_ok=True)
-            removed_files += 1
-
-    removed_artifacts = db.execute(delete(Artifact).where(Artifact.created_at < artifact_cutoff)).rowcount or 0
-    removed_logs = db.execute(delete(RunLog).where(RunLog.timestamp < log_cutoff)).rowcount or 0
+    # One DELETE ... OUTPUT/RETURNING both removes the rows and hands back their paths, so the
+    # table is scanned once and rows created mid-cleanup cannot be treated inconsistently.
+    paths = db.scalars(delete(Artifact).where(Artifact.created_at < artifact_cutoff).returning(Artifact.file_path)).all()
+    removed_artifacts = len(paths)
     db.commit()
+    # Files are unlinked on a small pool so filesystem calls overlap.
+    with ThreadPoolExecutor(max_workers=_UNLINK_WORKERS) as pool:
+        outcomes = list(pool.map(_remove_artifact_file, paths))
+    removed_files = outcomes.count(True)
+    failed_files = outcomes.count(None)
+
+    # Expired logs go in bounded batches, each in its own transaction, so locks and log growth stay small.
+    removed_logs = 0
+    while True:
+        expired_ids = select(RunLog.id).where(RunLog.timestamp < log_cutoff).limit(_LOG_DELETE_BATCH_SIZE)
+        deleted = (
+            db.execute(
+                delete(RunLog).where(RunLog.id.in_(expired_ids)).execution_options(synchronize_session=False)
+            ).rowcount
+            or 0
+        )
+        db.commit()
+        removed_logs += deleted
+        if deleted < _LOG_DELETE_BATCH_SIZE:
+            break
 
     return CleanupResult(
         removed_log_rows=removed_logs,
         removed_artifact_rows=removed_artifacts,
         removed_artifact_files=removed_files,
+        failed_artifact_files=failed_files,
     )
 
@@ -1,15 +1,16 @@
 from __future__ import annotations
 
+from collections.abc import Iterable
 from datetime import datetime, timezone
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import Uuid, bindparam, select, text
 from sqlalchemy.orm import Session
 
 from app.models.robot import Robot
 from app.models.robot_env_var import RobotEnvVar
 from app.schemas.env_var import RobotEnvVarRead, RobotEnvVarUpsertItem
-from app.services.encryption_service import decrypt_value, encrypt_value
+from app.services.encryption_service import decrypt_values, encrypt_values
 
 ALLOWED_ENV_NAMES = {"PROD", "HML", "TEST"}
 
@@ -37,24 +38,21 @@ def list_env_vars(db: Session, robot_id: UUID, env_name: str) -> list[RobotEnvVa
             .order_by(RobotEnvVar.key.asc())
         )
     )
-    output: list[RobotEnvVarRead] = []
-    for item in items:
-        value = None
-        if not item.is_secret:
-            value = decrypt_value(item.value_encrypted)
-        output.append(
-            RobotEnvVarRead(
-                robot_id=item.robot_id,
-                env_name=item.env_name,
-                key=item.key,
-                is_secret=item.is_secret,
-                is_set=bool(item.value_encrypted),
-                value=value,
-                created_at=item.created_at,
-                updated_at=item.updated_at,
-            )
+    # Visible values are decrypted in one batch with the cached cipher.
+    plain_values = iter(decrypt_values([item.value_encrypted for item in items if not item.is_secret]))
+    return [
+        RobotEnvVarRead(
+            robot_id=item.robot_id,
+            env_name=item.env_name,
+            key=item.key,
+            is_secret=item.is_secret,
+            is_set=bool(item.value_encrypted),
+            value=None if item.is_secret else next(plain_values),
+            created_at=item.created_at,
+            updated_at=item.updated_at,
         )
-    return output
+        for item in items
+    ]
 
 
 def upsert_env_vars(
@@ -68,20 +66,23 @@ def upsert_env_vars(
     _ensure_robot_exists(db=db, robot_id=robot_id)
     now = datetime.now(timezone.utc)
 
-    touched: list[RobotEnvVar] = []
-    actions: list[str] = []
     for payload in items:
-        existing = db.scalar(
-            select(RobotEnvVar).where(
-                RobotEnvVar.robot_id == robot_id,
-                RobotEnvVar.env_name == env_name,
-                RobotEnvVar.key == payload.key,
-            )
-        )
         if payload.value is None:
             raise ValueError(f"value is required for key '{payload.key}'.")
+    encrypted_values = encrypt_values([payload.value for payload in items])
+
+    if db.bind and db.bind.dialect.name.startswith("mssql"):
+        return _merge_env_vars(db, robot_id, env_name, items, encrypted_values, actor_user_id, now)
 
-        encrypted = encrypt_value(payload.value)
+    # Existing rows for every requested key come back in one IN query instead of one SELECT per item.
+    scope = (RobotEnvVar.robot_id == robot_id, RobotEnvVar.env_name == env_name)
+    keys = list({payload.key for payload in items})
+    rows = {row.key: row for row in db.scalars(select(RobotEnvVar).where(*scope, RobotEnvVar.key.in_(keys)))} if keys else {}
+
+    touched: list[RobotEnvVar] = []
+    actions: list[str] = []
+    for payload, encrypted in zip(items, encrypted_values):
+        existing = rows.get(payload.key)
         if existing:
             existing.value_encrypted = encrypted
             existing.is_secret = payload.is_secret
@@ -100,12 +101,82 @@ def upsert_env_vars(
                 updated_by=actor_user_id,
             )
             db.add(created)
+            rows[payload.key] = created
             touched.append(created)
             actions.append("created")
 
     db.commit()
-    for item in touched:
-        db.refresh(item)
+    if keys:
+        # Reloading the expired rows together repopulates them in the identity map in one round trip.
+        db.scalars(select(RobotEnvVar).where(*scope, RobotEnvVar.key.in_(keys))).all()
+    return touched, actions
+
+
+# Rows per MERGE statement; keeps each batch well under the 2100-parameter limit of SQL Server.
+_MERGE_BATCH_SIZE = 500
+
+
+def _merge_env_vars(
+    db: Session,
+    robot_id: UUID,
+    env_name: str,
+    items: list[RobotEnvVarUpsertItem],
+    encrypted_values: list[bytes],
+    actor_user_id: UUID | None,
+    now: datetime,
+) -> tuple[list[RobotEnvVar], list[str]]:
+    # A later item for the same key wins, as it did when each item was applied in turn.
+    values = {payload.key: (encrypted, payload.is_secret) for payload, encrypted in zip(items, encrypted_values)}
+    if not values:
+        return [], []
+
+    merged: dict[str, str] = {}
+    keys = list(values)
+    for start in range(0, len(keys), _MERGE_BATCH_SIZE):
+        batch = keys[start : start + _MERGE_BATCH_SIZE]
+        params: dict[str, object] = {"robot_id": robot_id, "env_name": env_name, "actor": actor_user_id, "now": now}
+        rows_sql: list[str] = []
+        for index, key in enumerate(batch):
+            value_encrypted, is_secret = values[key]
+            params[f"key_{index}"] = key
+            params[f"value_{index}"] = value_encrypted
+            params[f"secret_{index}"] = is_secret
+            rows_sql.append(f"(:key_{index}, :value_{index}, :secret_{index})")
+        statement = text(
+            f"""
+            MERGE {RobotEnvVar.__tablename__} WITH (HOLDLOCK) AS target
+            USING (VALUES {", ".join(rows_sql)}) AS source ([key], value_encrypted, is_secret)
+            ON target.robot_id = :robot_id AND target.env_name = :env_name AND target.[key] = source.[key]
+            WHEN MATCHED THEN
+                UPDATE SET value_encrypted = source.value_encrypted, is_secret = source.is_secret,
+                           updated_at = :now, updated_by = :actor
+            WHEN NOT MATCHED THEN
+                INSERT (robot_id, env_name, [key], value_encrypted, is_secret, created_by, updated_by)
+                VALUES (:robot_id, :env_name, source.[key], source.value_encrypted, source.is_secret, :actor, :actor)
+            OUTPUT $action, inserted.[key];
+            """
+        ).bindparams(bindparam("robot_id", type_=Uuid()), bindparam("actor", type_=Uuid()))
+        for action, key in db.execute(statement, params):
+            merged[key] = action
+    db.commit()
+
+    rows = {
+        row.key: row
+        for row in db.scalars(
+            select(RobotEnvVar).where(
+                RobotEnvVar.robot_id == robot_id,
+                RobotEnvVar.env_name == env_name,
+                RobotEnvVar.key.in_(keys),
+            )
+        )
+    }
+    touched: list[RobotEnvVar] = []
+    actions: list[str] = []
+    seen: set[str] = set()
+    for payload in items:
+        touched.append(rows[payload.key])
+        actions.append("created" if payload.key not in seen and merged.get(payload.key) == "INSERT" else "updated")
+        seen.add(payload.key)
     return touched, actions
 
 
@@ -135,18 +206,21 @@ def resolve_runtime_env(db: Session, robot_id: UUID, env_name: str) -> dict[str,
             )
         )
     )
-    output: dict[str, str] = {}
-    for item in items:
-        output[item.key] = decrypt_value(item.value_encrypted)
-    return output
+    values = decrypt_values([item.value_encrypted for item in items])
+    return {item.key: value for item, value in zip(items, values)}
 
 
-def list_defined_env_keys(db: Session, robot_id: UUID, env_name: str) -> set[str]:
+def list_defined_env_keys_intersect(db: Session, robot_id: UUID, env_name: str, candidates: Iterable[str]) -> set[str]:
+    # Only the candidate keys that exist come back, instead of the whole env.
+    candidates = list(candidates)
+    if not candidates:
+        return set()
     env_name = normalize_env_name(env_name)
     keys = db.scalars(
         select(RobotEnvVar.key).where(
             RobotEnvVar.robot_id == robot_id,
             RobotEnvVar.env_name == env_name,
+            RobotEnvVar.key.in_(candidates),
         )
     )
     return set(keys)
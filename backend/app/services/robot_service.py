@@ -1,42 +1,52 @@
 from __future__ import annotations
 
-import re
 from uuid import UUID
 
-from sqlalchemy import func, select
-from sqlalchemy.orm import Session, selectinload
+from sqlalchemy import delete, func, insert, lambda_stmt, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session, aliased, selectinload
+from sqlalchemy.orm.attributes import set_committed_value
 
+from app.db.queries import fetch_page
+from app.models.ids import sequential_uuid
 from app.models.robot import Robot, RobotReleaseTag, RobotTag, RobotVersion
-from app.schemas.robot import RobotCreate, RobotVersionCreate, SEMVER_REGEX
+from app.schemas.robot import SEMVER_RE, RobotCreate, RobotVersionCreate
+from app.services.run_service import invalidate_version_cache
 
-semver_pattern = re.compile(SEMVER_REGEX)
+
+_semver_fullmatch = SEMVER_RE.fullmatch
 
 
 def is_valid_semver(version: str) -> bool:
-    return bool(semver_pattern.match(version))
+    return _semver_fullmatch(version) is not None
 
 
 def get_robot(db: Session, robot_id: UUID) -> Robot | None:
     return db.scalar(
-        select(Robot)
-        .where(Robot.id == robot_id)
-        .options(selectinload(Robot.versions), selectinload(Robot.tags), selectinload(Robot.release_tags))
+        lambda_stmt(
+            lambda: select(Robot)
+            .where(Robot.id == robot_id)
+            .options(selectinload(Robot.versions), selectinload(Robot.tags), selectinload(Robot.release_tags))
+        )
     )
 
 
 def create_robot(db: Session, payload: RobotCreate, created_by: UUID | None) -> Robot:
+    # Ids are generated up front so the whole graph goes out in the commit's single flush.
     robot = Robot(
+        id=sequential_uuid(),
         name=payload.name,
         description=payload.description,
         created_by=created_by,
     )
     db.add(robot)
-    db.flush()
 
-    for tag_value in sorted(set(payload.tags)):
+    # Tags are read back in table order, so write-time sorting buys nothing.
+    for tag_value in dict.fromkeys(payload.tags):
         db.add(RobotTag(robot_id=robot.id, tag=tag_value))
 
     version = RobotVersion(
+        id=sequential_uuid(),
         robot_id=robot.id,
         version=payload.initial_version.version,
         channel=payload.initial_version.channel,
@@ -54,9 +64,7 @@ def create_robot(db: Session, payload: RobotCreate, created_by: UUID | None) ->
         is_active=True,
     )
     db.add(version)
-    db.flush()
-    _set_release_tag(db, robot.id, "latest", version.id)
-    _set_release_tag(db, robot.id, "stable", version.id)
+    _set_release_tags(db, robot.id, version.id, _LATEST_AND_STABLE)
     db.commit()
 
     query = (
@@ -67,17 +75,49 @@ def create_robot(db: Session, payload: RobotCreate, created_by: UUID | None) ->
     return db.scalar(query)
 
 
-def list_robots(db: Session, skip: int = 0, limit: int = 50) -> tuple[list[Robot], int]:
-    total = db.scalar(select(func.count()).select_from(Robot)) or 0
-    robots = list(
-        db.scalars(
-            select(Robot)
-            .order_by(Robot.created_at.desc())
-            .options(selectinload(Robot.versions), selectinload(Robot.tags), selectinload(Robot.release_tags))
-            .offset(skip)
-            .limit(limit)
+# List pages carry the active version plus the most recent ones alongside the total version_count;
+# full history is served by list_robot_versions, so long-lived robots no longer ship every version on every page.
+LIST_VERSIONS_PER_ROBOT = 20
+
+
+def _attach_recent_versions(db: Session, robots: list[Robot]) -> None:
+    if not robots:
+        return
+    ranked = (
+        select(
+            RobotVersion,
+            func.row_number()
+            .over(
+                partition_by=RobotVersion.robot_id,
+                order_by=(RobotVersion.is_active.desc(), RobotVersion.created_at.desc()),
+            )
+            .label("position"),
+            func.count().over(partition_by=RobotVersion.robot_id).label("version_count"),
         )
+        .where(RobotVersion.robot_id.in_([robot.id for robot in robots]))
+        .subquery()
     )
+    recent = aliased(RobotVersion, ranked)
+    by_robot: dict[UUID, list[RobotVersion]] = {robot.id: [] for robot in robots}
+    counts: dict[UUID, int] = {}
+    for version, version_count in db.execute(
+        select(recent, ranked.c.version_count).where(ranked.c.position <= LIST_VERSIONS_PER_ROBOT)
+    ):
+        by_robot[version.robot_id].append(version)
+        counts[version.robot_id] = version_count
+    for robot in robots:
+        set_committed_value(robot, "versions", by_robot[robot.id])
+        set_committed_value(robot, "version_count", counts.get(robot.id, 0))
+
+
+def list_robots(db: Session, skip: int = 0, limit: int = 50) -> tuple[list[Robot], int]:
+    stmt = (
+        select(Robot)
+        .order_by(Robot.created_at.desc())
+        .options(selectinload(Robot.tags), selectinload(Robot.release_tags))
+    )
+    robots, total = fetch_page(db, stmt, skip, limit)
+    _attach_recent_versions(db, robots)
     return robots, total
 
 
@@ -85,32 +125,40 @@ def list_robots_scoped(db: Session, robot_ids: set[UUID], skip: int = 0, limit:
     if not robot_ids:
         return [], 0
 
-    total = db.scalar(select(func.count()).select_from(Robot).where(Robot.id.in_(robot_ids))) or 0
-    robots = list(
-        db.scalars(
-            select(Robot)
-            .where(Robot.id.in_(robot_ids))
-            .order_by(Robot.created_at.desc())
-            .options(selectinload(Robot.versions), selectinload(Robot.tags), selectinload(Robot.release_tags))
-            .offset(skip)
-            .limit(limit)
-        )
+    stmt = (
+        select(Robot)
+        .where(Robot.id.in_(robot_ids))
+        .order_by(Robot.created_at.desc())
+        .options(selectinload(Robot.tags), selectinload(Robot.release_tags))
     )
+    robots, total = fetch_page(db, stmt, skip, limit)
+    _attach_recent_versions(db, robots)
     return robots, total
 
 
-def add_robot_version(db: Session, robot_id: UUID, payload: RobotVersionCreate, created_by: UUID | None) -> RobotVersion:
-    robot = db.scalar(select(Robot).where(Robot.id == robot_id))
-    if not robot:
+def check_new_version(db: Session, robot_id: UUID, version: str) -> None:
+    # Robot existence and version collision come back as one row of scalar subqueries.
+    robot_found, duplicate_id = db.execute(
+        select(
+            select(Robot.id).where(Robot.id == robot_id).scalar_subquery(),
+            select(RobotVersion.id)
+            .where(RobotVersion.robot_id == robot_id, RobotVersion.version == version)
+            .scalar_subquery(),
+        )
+    ).one()
+    if robot_found is None:
         raise ValueError("Robot not found.")
-    if not is_valid_semver(payload.version):
+    if not is_valid_semver(version):
         raise ValueError("Invalid semver.")
-
-    existing = db.scalar(select(RobotVersion).where(RobotVersion.robot_id == robot_id, RobotVersion.version == payload.version))
-    if existing:
+    if duplicate_id is not None:
         raise ValueError("Version already exists for this robot.")
 
+
+def add_robot_version(db: Session, robot_id: UUID, payload: RobotVersionCreate, created_by: UUID | None) -> RobotVersion:
+    check_new_version(db, robot_id, payload.version)
+
     version = RobotVersion(
+        id=sequential_uuid(),
         robot_id=robot_id,
         version=payload.version,
         channel=payload.channel,
@@ -128,24 +176,23 @@ def add_robot_version(db: Session, robot_id: UUID, payload: RobotVersionCreate,
         is_active=payload.is_active,
     )
     if payload.is_active:
-        db.query(RobotVersion).filter(RobotVersion.robot_id == robot_id).update({RobotVersion.is_active: False})
+        _deactivate_versions(db, robot_id)
     db.add(version)
-    db.flush()
     if payload.is_active:
-        _set_release_tag(db, robot_id, "latest", version.id)
-        if payload.channel == "stable":
-            _set_release_tag(db, robot_id, "stable", version.id)
+        _set_release_tags(db, robot_id, version.id, _release_tags_for(payload.channel))
     db.commit()
-    db.refresh(version)
+    invalidate_version_cache()
     return version
 
 
 def list_robot_versions(db: Session, robot_id: UUID) -> list[RobotVersion]:
     return list(
         db.scalars(
-            select(RobotVersion)
-            .where(RobotVersion.robot_id == robot_id)
-            .order_by(RobotVersion.created_at.desc())
+            lambda_stmt(
+                lambda: select(RobotVersion)
+                .where(RobotVersion.robot_id == robot_id)
+                .order_by(RobotVersion.created_at.desc())
+            )
         )
     )
 
@@ -171,21 +218,17 @@ def publish_robot_version(
     branch: str | None = None,
     build_url: str | None = None,
     required_env_keys_json: list[str] | None = None,
+    checked: bool = False,
 ) -> RobotVersion:
-    robot = db.scalar(select(Robot).where(Robot.id == robot_id))
-    if not robot:
-        raise ValueError("Robot not found.")
-    if not is_valid_semver(version):
-        raise ValueError("Invalid semver.")
-
-    existing = db.scalar(select(RobotVersion).where(RobotVersion.robot_id == robot_id, RobotVersion.version == version))
-    if existing:
-        raise ValueError("Version already exists for this robot.")
+    # Upload endpoints run the check before storing the artifact and pass checked=True.
+    if not checked:
+        check_new_version(db, robot_id, version)
 
     if activate:
-        db.query(RobotVersion).filter(RobotVersion.robot_id == robot_id).update({RobotVersion.is_active: False})
+        _deactivate_versions(db, robot_id)
 
     published = RobotVersion(
+        id=sequential_uuid(),
         robot_id=robot_id,
         version=version,
         channel=channel,
@@ -208,29 +251,37 @@ def publish_robot_version(
         is_active=activate,
     )
     db.add(published)
-    db.flush()
     if activate:
-        _set_release_tag(db, robot_id, "latest", published.id)
-        if channel == "stable":
-            _set_release_tag(db, robot_id, "stable", published.id)
-    db.commit()
-    db.refresh(published)
+        _set_release_tags(db, robot_id, published.id, _release_tags_for(channel))
+    try:
+        db.commit()
+    except IntegrityError:
+        # With checked=True the check ran before the upload, so a concurrent publish may have taken the
+        # version since; re-checking turns the constraint violation into the usual ValueError.
+        db.rollback()
+        check_new_version(db, robot_id, version)
+        raise
+    invalidate_version_cache()
     return published
 
 
 def activate_robot_version(db: Session, robot_id: UUID, version_id: UUID) -> RobotVersion:
-    version = db.scalar(select(RobotVersion).where(RobotVersion.robot_id == robot_id, RobotVersion.id == version_id))
+    # populate_existing: an earlier Core deactivation in this session may have left is_active stale in memory,
+    # and setting an unchanged-looking flag would otherwise emit no UPDATE.
+    version = db.scalar(
+        select(RobotVersion)
+        .where(RobotVersion.robot_id == robot_id, RobotVersion.id == version_id)
+        .execution_options(populate_existing=True)
+    )
     if not version:
         raise ValueError("Version not found.")
 
-    db.query(RobotVersion).filter(RobotVersion.robot_id == robot_id).update({RobotVersion.is_active: False})
+    # The target is excluded so its in-session state stays accurate and the flag flip below is flushed.
+    _deactivate_versions(db, robot_id, keep_version_id=version.id)
     version.is_active = True
-    db.flush()
-    _set_release_tag(db, robot_id, "latest", version.id)
-    if version.channel == "stable":
-        _set_release_tag(db, robot_id, "stable", version.id)
+    _set_release_tags(db, robot_id, version.id, _release_tags_for(version.channel))
     db.commit()
-    db.refresh(version)
+    invalidate_version_cache()
     return version
 
 
@@ -239,26 +290,57 @@ def get_robot_tags(db: Session, robot_id: UUID) -> set[str]:
 
 
 def update_robot_tags(db: Session, robot_id: UUID, tags: list[str]) -> Robot | None:
-    robot = db.scalar(select(Robot).where(Robot.id == robot_id).options(selectinload(Robot.tags), selectinload(Robot.versions)))
+    robot = db.scalar(select(Robot).where(Robot.id == robot_id).options(selectinload(Robot.tags)))
     if not robot:
         return None
 
-    normalized_tags = sorted(set(tag.strip() for tag in tags if tag.strip()))
-    db.query(RobotTag).filter(RobotTag.robot_id == robot_id).delete()
-    for tag in normalized_tags:
-        db.add(RobotTag(robot_id=robot_id, tag=tag))
-    db.commit()
-    db.refresh(robot)
+    # Only the difference is written: one DELETE for dropped tags, one multi-row INSERT for new ones.
+    existing_tags = {item.tag for item in robot.tags}
+    normalized_tags = {tag.strip() for tag in tags if tag.strip()}
+    removed_tags = existing_tags - normalized_tags
+    added_tags = normalized_tags - existing_tags
+    if removed_tags:
+        db.execute(delete(RobotTag).where(RobotTag.robot_id == robot_id, RobotTag.tag.in_(removed_tags)))
+    if added_tags:
+        db.execute(insert(RobotTag), [{"robot_id": robot_id, "tag": tag} for tag in added_tags])
+    if removed_tags or added_tags:
+        db.commit()
     return db.scalar(
         select(Robot)
         .where(Robot.id == robot_id)
         .options(selectinload(Robot.tags), selectinload(Robot.versions), selectinload(Robot.release_tags))
+        .execution_options(populate_existing=True)
     )
 
 
-def _set_release_tag(db: Session, robot_id: UUID, tag: str, version_id: UUID) -> None:
-    existing = db.scalar(select(RobotReleaseTag).where(RobotReleaseTag.robot_id == robot_id, RobotReleaseTag.tag == tag))
-    if existing:
-        existing.version_id = version_id
-        return
-    db.add(RobotReleaseTag(robot_id=robot_id, tag=tag, version_id=version_id))
+def _deactivate_versions(db: Session, robot_id: UUID, keep_version_id: UUID | None = None) -> None:
+    # Only rows that are still active are touched. The identity map is not synchronized, so versions
+    # already loaded in the session keep their old flag; activate_robot_version reloads its target.
+    stmt = update(RobotVersion).where(RobotVersion.robot_id == robot_id, RobotVersion.is_active.is_(True))
+    if keep_version_id is not None:
+        stmt = stmt.where(RobotVersion.id != keep_version_id)
+    db.execute(stmt.values(is_active=False).execution_options(synchronize_session=False))
+
+
+_TAG_LATEST = "latest"
+_TAG_STABLE = "stable"
+_LATEST_ONLY = (_TAG_LATEST,)
+_LATEST_AND_STABLE = (_TAG_LATEST, _TAG_STABLE)
+
+
+def _release_tags_for(channel: str) -> tuple[str, ...]:
+    return _LATEST_AND_STABLE if channel == _TAG_STABLE else _LATEST_ONLY
+
+
+def _set_release_tags(db: Session, robot_id: UUID, version_id: UUID, tags: tuple[str, ...]) -> None:
+    # Both tags are read in one query; the updates and inserts go out in the same flush.
+    existing = {
+        row.tag: row
+        for row in db.scalars(select(RobotReleaseTag).where(RobotReleaseTag.robot_id == robot_id, RobotReleaseTag.tag.in_(tags)))
+    }
+    for tag in tags:
+        row = existing.get(tag)
+        if row:
+            row.version_id = version_id
+        else:
+            db.add(RobotReleaseTag(robot_id=robot_id, tag=tag, version_id=version_id))
@@ -1,31 +1,82 @@
 from __future__ import annotations
 
+import asyncio
+import logging
+import time
+from collections.abc import Iterator
 from datetime import datetime, timezone
+from functools import lru_cache
 from uuid import UUID
 
-from sqlalchemy import func, select
-from sqlalchemy.orm import Session, joinedload, selectinload
+from sqlalchemy import Row, lambda_stmt, select, update
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.orm import Session, joinedload, lazyload, selectinload
+from sqlalchemy.sql.lambdas import StatementLambdaElement
 
+from app.db.queries import fetch_page
 from app.models.robot import RobotVersion
 from app.models.run import Run, RunLog, RunStatus
 from app.models.scheduler import TriggerType
 from app.schemas.run import RunExecuteRequest
-from app.services.robot_env_service import list_defined_env_keys, normalize_env_name
+from app.services.robot_env_service import list_defined_env_keys_intersect, normalize_env_name
 from app.services.queue_service import enqueue_run
 
+logger = logging.getLogger(__name__)
 
-def _resolve_robot_version(db: Session, robot_id: UUID, requested_version_id: UUID | None) -> RobotVersion:
+# At most this many enqueues run in the background; past it callers await the queue directly,
+# so a slow Redis turns into request latency instead of an unbounded task set.
+_ENQUEUE_BACKLOG_LIMIT = 256
+_enqueue_tasks: set[asyncio.Task] = set()
+
+# Enum members resolved once for the run-creation hot path.
+_PENDING_STATUS = RunStatus.PENDING
+_MANUAL_TRIGGER = TriggerType.MANUAL.value
+
+_VERSION_CACHE_TTL_SECONDS = 30.0
+_VERSION_CACHE_MAX_ENTRIES = 4096
+_version_cache: dict[tuple[UUID, UUID | None], tuple[float, UUID, tuple[str, ...]]] = {}
+
+
+def _resolve_robot_version(db: Session, robot_id: UUID, requested_version_id: UUID | None) -> tuple[UUID, tuple[str, ...]]:
+    # Scheduled runs resolve the same version over and over; a short TTL bounds staleness across
+    # processes, and robot_service clears the cache whenever it publishes or activates in this one.
+    key = (robot_id, requested_version_id)
+    now = time.monotonic()
+    cached = _version_cache.get(key)
+    if cached is not None and cached[0] > now:
+        return cached[1], cached[2]
+
+    # lambda_stmt caches the built statement and its SQL per call site; only the bound values change.
     if requested_version_id:
-        version = db.scalar(select(RobotVersion).where(RobotVersion.id == requested_version_id, RobotVersion.robot_id == robot_id))
+        row = db.execute(
+            lambda_stmt(
+                lambda: select(RobotVersion.id, RobotVersion.required_env_keys_json).where(
+                    RobotVersion.id == requested_version_id, RobotVersion.robot_id == robot_id
+                )
+            )
+        ).first()
     else:
-        version = db.scalar(
-            select(RobotVersion)
-            .where(RobotVersion.robot_id == robot_id, RobotVersion.is_active.is_(True))
-            .order_by(RobotVersion.created_at.desc())
-        )
-    if not version:
+        row = db.execute(
+            lambda_stmt(
+                lambda: select(RobotVersion.id, RobotVersion.required_env_keys_json)
+                .where(RobotVersion.robot_id == robot_id, RobotVersion.is_active.is_(True))
+                .order_by(RobotVersion.created_at.desc())
+            )
+        ).first()
+    if not row:
         raise ValueError("Robot version not found for execution.")
-    return version
+
+    version_id, raw_keys = row
+    # Non-string JSON entries are dropped before the tuple is hashed as the cache key.
+    required_keys = _normalized_required_env_keys(tuple(item for item in raw_keys or () if isinstance(item, str)))
+    if len(_version_cache) >= _VERSION_CACHE_MAX_ENTRIES:
+        _version_cache.clear()
+    _version_cache[key] = (now + _VERSION_CACHE_TTL_SECONDS, version_id, required_keys)
+    return version_id, required_keys
+
+
+def invalidate_version_cache() -> None:
+    _version_cache.clear()
 
 
 async def create_run_and_enqueue(
@@ -35,51 +86,95 @@ async def create_run_and_enqueue(
     triggered_by: UUID | None,
     service_id: UUID | None = None,
     parameters_json: dict | None = None,
-    trigger_type: str = TriggerType.MANUAL.value,
+    trigger_type: str = _MANUAL_TRIGGER,
     attempt: int = 1,
     schedule_id: UUID | None = None,
     not_before_ts: float | None = None,
+    hydrate: bool = False,
+    background: bool = False,
 ) -> Run:
-    version = _resolve_robot_version(db, robot_id=robot_id, requested_version_id=payload.resolved_version_id)
+    version_id, required_keys = _resolve_robot_version(db, robot_id=robot_id, requested_version_id=payload.resolved_version_id)
     env_name = normalize_env_name(payload.env_name)
-    _validate_required_env_keys(db=db, robot_id=robot_id, env_name=env_name, required_keys=version.required_env_keys_json or [])
+    _validate_required_env_keys(
+        db=db,
+        robot_id=robot_id,
+        env_name=env_name,
+        required_keys=required_keys,
+    )
 
     run = Run(
         robot_id=robot_id,
-        robot_version_id=version.id,
+        robot_version_id=version_id,
         service_id=service_id,
         schedule_id=schedule_id,
         env_name=env_name,
         parameters_json=parameters_json,
         trigger_type=trigger_type,
         attempt=attempt,
-        status=RunStatus.PENDING.value,
+        status=_PENDING_STATUS,
         queued_at=datetime.now(timezone.utc),
         triggered_by=triggered_by,
     )
     db.add(run)
     db.commit()
-    db.refresh(run)
-
-    await enqueue_run(
-        {
-            "run_id": str(run.run_id),
-            "robot_id": str(robot_id),
-            "robot_version_id": str(version.id),
-            "runtime_arguments": payload.runtime_arguments,
-            "runtime_env": payload.runtime_env,
-            "triggered_by": str(triggered_by) if triggered_by else None,
-            "service_id": str(service_id) if service_id else None,
-            "schedule_id": str(schedule_id) if schedule_id else None,
-            "trigger_type": trigger_type,
-            "attempt": attempt,
-            "parameters_json": parameters_json or {},
-            "env_name": env_name,
-            "not_before_ts": not_before_ts,
-        }
-    )
 
-    return get_run(db=db, run_id=run.run_id) or run
+    queue_payload = {
+        "run_id": str(run.run_id),
+        "robot_id": str(robot_id),
+        "robot_version_id": str(version_id),
+        "runtime_arguments": payload.runtime_arguments,
+        "runtime_env": payload.runtime_env,
+        "triggered_by": str(triggered_by) if triggered_by else None,
+        "service_id": str(service_id) if service_id else None,
+        "schedule_id": str(schedule_id) if schedule_id else None,
+        "trigger_type": trigger_type,
+        "attempt": attempt,
+        "parameters_json": parameters_json or {},
+        "env_name": env_name,
+        "not_before_ts": not_before_ts,
+    }
+    if background and len(_enqueue_tasks) < _ENQUEUE_BACKLOG_LIMIT:
+        # The run row is committed, so the response does not have to wait on the queue.
+        task = asyncio.create_task(_safe_enqueue(db.get_bind(), queue_payload))
+        _enqueue_tasks.add(task)
+        task.add_done_callback(_enqueue_tasks.discard)
+    else:
+        await enqueue_run(queue_payload)
+
+    # Only callers that serialize the run graph pay for the eager-loaded reload.
+    if hydrate:
+        return get_run(db=db, run_id=run.run_id) or run
+    return run
+
+
+async def _safe_enqueue(bind: Engine | Connection, payload: dict) -> None:
+    try:
+        await enqueue_run(payload)
+    except Exception as exc:  # noqa: BLE001
+        logger.exception("Failed to enqueue run %s", payload["run_id"])
+        # The client already has the run; failing it keeps a lost enqueue from holding a PENDING slot forever.
+        with Session(bind=bind) as db:
+            db.execute(
+                update(Run)
+                .where(Run.run_id == UUID(payload["run_id"]), Run.status == _PENDING_STATUS)
+                .values(status=RunStatus.FAILED, error_message=f"Enqueue failed: {exc}", finished_at=datetime.now(timezone.utc))
+            )
+            db.commit()
+
+
+async def drain_enqueue_tasks() -> None:
+    # Called on shutdown so runs accepted just before it still reach the queue.
+    if _enqueue_tasks:
+        await asyncio.gather(*_enqueue_tasks, return_exceptions=True)
+
+
+# Only the relationships RunRead serializes are loaded eagerly. The version summary has no use for
+# the argument/env rows that RobotVersion would otherwise selectin-load.
+_RUN_READ_LOADS = (
+    selectinload(Run.artifacts),
+    joinedload(Run.robot_version).options(lazyload(RobotVersion.argument_items), lazyload(RobotVersion.env_var_items)),
+    joinedload(Run.service),
+)
 
 
 def list_runs(
@@ -91,64 +186,59 @@ def list_runs(
     skip: int = 0,
     limit: int = 50,
 ) -> tuple[list[Run], int]:
-    base_stmt = select(Run)
-    count_stmt = select(func.count()).select_from(Run)
-
+    stmt = select(Run)
     if robot_id:
-        base_stmt = base_stmt.where(Run.robot_id == robot_id)
-        count_stmt = count_stmt.where(Run.robot_id == robot_id)
-
+        stmt = stmt.where(Run.robot_id == robot_id)
     if service_id:
-        base_stmt = base_stmt.where(Run.service_id == service_id)
-        count_stmt = count_stmt.where(Run.service_id == service_id)
-
+        stmt = stmt.where(Run.service_id == service_id)
     if trigger_type:
-        base_stmt = base_stmt.where(Run.trigger_type == trigger_type)
-        count_stmt = count_stmt.where(Run.trigger_type == trigger_type)
-
+        stmt = stmt.where(Run.trigger_type == trigger_type)
     if status:
-        base_stmt = base_stmt.where(Run.status == status)
-        count_stmt = count_stmt.where(Run.status == status)
+        stmt = stmt.where(Run.status == status)
 
-    total = db.scalar(count_stmt) or 0
-
-    items = list(
-        db.scalars(
-            base_stmt.options(selectinload(Run.artifacts), joinedload(Run.robot_version), joinedload(Run.service), joinedload(Run.schedule))
-            .order_by(Run.queued_at.desc())
-            .offset(skip)
-            .limit(limit)
-        )
-    )
-    return items, total
+    stmt = stmt.options(*_RUN_READ_LOADS).order_by(Run.queued_at.desc())
+    return fetch_page(db, stmt, skip, limit)
 
 
 def get_run(db: Session, run_id: UUID) -> Run | None:
-    stmt = (
-        select(Run)
+    stmt = lambda_stmt(
+        lambda: select(Run)
         .where(Run.run_id == run_id)
-        .options(
-            selectinload(Run.artifacts),
-            joinedload(Run.robot),
-            joinedload(Run.robot_version),
-            joinedload(Run.service),
-            joinedload(Run.schedule),
-        )
+        .options(*_RUN_READ_LOADS)
     )
     return db.scalar(stmt)
 
 
-def get_run_logs(db: Session, run_id: UUID, limit: int = 500) -> list[RunLog]:
-    return list(db.scalars(select(RunLog).where(RunLog.run_id == run_id).order_by(RunLog.id.asc()).limit(limit)))
+def get_run_logs(db: Session, run_id: UUID, limit: int = 500) -> list[Row]:
+    # Plain column rows: the read schemas only need attribute access, not ORM instances.
+    return list(db.execute(_run_logs_stmt(run_id, limit)))
+
+
+def stream_run_logs(db: Session, run_id: UUID, limit: int = 500) -> Iterator[Row]:
+    yield from db.execute(_run_logs_stmt(run_id, limit), execution_options={"yield_per": 100})
+
+
+def _run_logs_stmt(run_id: UUID, limit: int) -> StatementLambdaElement:
+    return lambda_stmt(
+        lambda: select(RunLog.id, RunLog.run_id, RunLog.timestamp, RunLog.level, RunLog.message)
+        .where(RunLog.run_id == run_id)
+        .order_by(RunLog.id.asc())
+        .limit(limit)
+    )
+
+
+@lru_cache(maxsize=2048)
+def _normalized_required_env_keys(required_keys: tuple[str, ...]) -> tuple[str, ...]:
+    # Keyed on the raw keys alone, so an edited version never serves a stale list.
+    return tuple(sorted({item.strip() for item in required_keys if item.strip()}))
 
 
-def _validate_required_env_keys(db: Session, robot_id: UUID, env_name: str, required_keys: list[str]) -> None:
-    normalized_required = sorted({item.strip() for item in required_keys if isinstance(item, str) and item.strip()})
-    if not normalized_required:
+def _validate_required_env_keys(db: Session, robot_id: UUID, env_name: str, required_keys: tuple[str, ...]) -> None:
+    if not required_keys:
         return
 
-    defined_keys = list_defined_env_keys(db=db, robot_id=robot_id, env_name=env_name)
-    missing = [item for item in normalized_required if item not in defined_keys]
+    defined_keys = list_defined_env_keys_intersect(db=db, robot_id=robot_id, env_name=env_name, candidates=required_keys)
+    missing = [item for item in required_keys if item not in defined_keys]
     if missing:
         raise ValueError(
             f"Missing required env vars for {env_name}: {', '.join(missing)}. "
@@ -1,16 +1,16 @@
 from __future__ import annotations
 
 import logging
-import re
 import threading
 from dataclasses import dataclass
 from datetime import datetime, time, timedelta, timezone
+from functools import lru_cache
 from typing import Any
 from uuid import UUID
 from zoneinfo import ZoneInfo
 
 from sqlalchemy import and_, func, select, text
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, selectinload
 
 from app.core.config import get_settings
 from app.models.robot import Robot
@@ -26,7 +26,6 @@ settings = get_settings()
 logger = logging.getLogger(__name__)
 
 _local_schedule_locks: dict[str, threading.Lock] = {}
-_cron_field_regex = re.compile(r"^(\*|\d+|\d+-\d+)(/\d+)?$")
 
 
 @dataclass(slots=True)
@@ -201,8 +200,8 @@ def resolve_alert(db: Session, alert_id: UUID) -> AlertEvent:
 def create_alert_if_needed(
     db: Session,
     robot_id: UUID,
-    alert_type: str,
-    severity: str,
+    alert_type: AlertType,
+    severity: AlertSeverity,
     message: str,
     metadata: dict[str, Any] | None = None,
     run_id: UUID | None = None,
@@ -255,27 +254,37 @@ async def run_scheduler_cycle(db: Session, now_utc: datetime | None = None) -> S
     skipped_concurrency = 0
     skipped_duplicate = 0
 
+    due: list[Schedule] = []
     for schedule in schedules:
-        if not _is_schedule_due(schedule=schedule, now_utc=now_utc):
+        # One timezone conversion per schedule serves both the cron and the window checks.
+        local_now = now_utc.astimezone(_get_tz(schedule.timezone))
+        if not _is_schedule_due(schedule=schedule, local_now=local_now):
             continue
-        if not _inside_execution_window(schedule=schedule, now_utc=now_utc):
+        if not _inside_execution_window(schedule=schedule, local_now=local_now):
             skipped_window += 1
             continue
+        due.append(schedule)
+
+    # One grouped query per check for every due schedule, instead of two counts per schedule.
+    dispatched_ids, active_by_robot = _prefetch_dispatch_state(db=db, schedules=due, now_utc=now_utc)
+
+    for schedule in due:
+        if schedule.id in dispatched_ids:
+            skipped_duplicate += 1
+            continue
+        if active_by_robot.get(schedule.robot_id, 0) >= schedule.max_concurrency:
+            skipped_concurrency += 1
+            continue
 
         lock_key = f"schedule-dispatch:{schedule.robot_id}"
         if not _acquire_robot_lock(db=db, lock_key=lock_key):
             continue
         try:
-            if _already_dispatched_this_minute(db=db, schedule_id=schedule.id, now_utc=now_utc):
+            # Re-checked under the lock in one round trip, since another scheduler may have dispatched meanwhile.
+            already_dispatched, active = _dispatch_state(db=db, schedule=schedule, now_utc=now_utc)
+            if already_dispatched:
                 skipped_duplicate += 1
                 continue
-
-            active = db.scalar(
-                select(func.count()).select_from(Run).where(
-                    Run.robot_id == schedule.robot_id,
-                    Run.status.in_([RunStatus.PENDING.value, RunStatus.RUNNING.value]),
-                )
-            ) or 0
             if active >= schedule.max_concurrency:
                 skipped_concurrency += 1
                 continue
@@ -320,7 +329,14 @@ async def run_scheduler_cycle(db: Session, now_utc: datetime | None = None) -> S
 
 def run_sla_monitor_cycle(db: Session, now_utc: datetime | None = None) -> SlaCycleResult:
     now_utc = now_utc or datetime.now(timezone.utc)
-    rules = list(db.scalars(select(SlaRule)))
+    # Daily-time rules read rule.robot.schedule.timezone; both hops load in bulk.
+    rules = list(
+        db.scalars(
+            select(SlaRule).options(
+                selectinload(SlaRule.robot).selectinload(Robot.schedule)
+            )
+        )
+    )
     created = 0
 
     for rule in rules:
@@ -329,8 +345,8 @@ def run_sla_monitor_cycle(db: Session, now_utc: datetime | None = None) -> SlaCy
                 create_alert_if_needed(
                     db=db,
                     robot_id=rule.robot_id,
-                    alert_type=AlertType.LATE.value,
-                    severity=AlertSeverity.WARN.value,
+                    alert_type=AlertType.LATE,
+                    severity=AlertSeverity.WARN,
                     message=f"Robot {rule.robot_id} is late based on configured SLA.",
                     metadata={
                         "expected_run_every_minutes": rule.expected_run_every_minutes,
@@ -346,8 +362,8 @@ def run_sla_monitor_cycle(db: Session, now_utc: datetime | None = None) -> SlaCy
                 create_alert_if_needed(
                     db=db,
                     robot_id=rule.robot_id,
-                    alert_type=AlertType.FAILURE_STREAK.value,
-                    severity=AlertSeverity.CRITICAL.value,
+                    alert_type=AlertType.FAILURE_STREAK,
+                    severity=AlertSeverity.CRITICAL,
                     message=f"Robot {rule.robot_id} reached failure streak >= {settings.failure_streak_threshold}.",
                     metadata={"failure_streak_threshold": settings.failure_streak_threshold},
                 )
@@ -370,8 +386,8 @@ def _evaluate_queue_backlog(db: Session) -> int:
         create_alert_if_needed(
             db=db,
             robot_id=robot_id,
-            alert_type=AlertType.QUEUE_BACKLOG.value,
-            severity=AlertSeverity.WARN.value,
+            alert_type=AlertType.QUEUE_BACKLOG,
+            severity=AlertSeverity.WARN,
             message=f"Queue depth is high ({depth}).",
             metadata={"queue_depth": depth, "threshold": settings.queue_backlog_alert_threshold},
         )
@@ -391,8 +407,8 @@ def _evaluate_worker_down(db: Session, now_utc: datetime) -> int:
             create_alert_if_needed(
                 db=db,
                 robot_id=robot_id,
-                alert_type=AlertType.WORKER_DOWN.value,
-                severity=AlertSeverity.CRITICAL.value,
+                alert_type=AlertType.WORKER_DOWN,
+                severity=AlertSeverity.CRITICAL,
                 message="Worker heartbeat is stale.",
                 metadata={"stale_workers": stale, "stale_after_seconds": settings.worker_stale_seconds},
             )
@@ -424,8 +440,7 @@ def _is_robot_late(db: Session, rule: SlaRule, now_utc: datetime) -> bool:
         return elapsed_minutes > (rule.expected_run_every_minutes + rule.late_after_minutes)
 
     if rule.expected_daily_time:
-        tz_name = _safe_timezone_name(rule.robot.schedule.timezone if rule.robot and rule.robot.schedule else settings.app_timezone)
-        tz = ZoneInfo(tz_name)
+        tz = _get_tz(rule.robot.schedule.timezone if rule.robot and rule.robot.schedule else settings.app_timezone)
         local_now = now_utc.astimezone(tz)
         target_time = _parse_hhmm(rule.expected_daily_time)
         expected_local = datetime.combine(local_now.date(), target_time, tzinfo=tz)
@@ -460,17 +475,13 @@ def _has_failure_streak(db: Session, robot_id: UUID, threshold: int) -> bool:
     return all(item.status == RunStatus.FAILED.value for item in runs)
 
 
-def _is_schedule_due(schedule: Schedule, now_utc: datetime) -> bool:
-    tz_name = _safe_timezone_name(schedule.timezone)
-    local_now = now_utc.astimezone(ZoneInfo(tz_name))
+def _is_schedule_due(schedule: Schedule, local_now: datetime) -> bool:
     return _cron_matches(schedule.cron_expr, local_now)
 
 
-def _inside_execution_window(schedule: Schedule, now_utc: datetime) -> bool:
+def _inside_execution_window(schedule: Schedule, local_now: datetime) -> bool:
     if not schedule.window_start or not schedule.window_end:
         return True
-    tz_name = _safe_timezone_name(schedule.timezone)
-    local_now = now_utc.astimezone(ZoneInfo(tz_name))
     now_t = local_now.time()
     start = _parse_hhmm(schedule.window_start)
     end = _parse_hhmm(schedule.window_end)
@@ -479,20 +490,64 @@ def _inside_execution_window(schedule: Schedule, now_utc: datetime) -> bool:
     return now_t >= start or now_t <= end
 
 
-def _already_dispatched_this_minute(db: Session, schedule_id: UUID, now_utc: datetime) -> bool:
+def _minute_bounds(now_utc: datetime) -> tuple[datetime, datetime]:
     minute_start = now_utc.replace(second=0, microsecond=0)
-    minute_end = minute_start + timedelta(minutes=1)
-    existing = db.scalar(
+    return minute_start, minute_start + timedelta(minutes=1)
+
+
+def _prefetch_dispatch_state(
+    db: Session, schedules: list[Schedule], now_utc: datetime
+) -> tuple[set[UUID], dict[UUID, int]]:
+    if not schedules:
+        return set(), {}
+    minute_start, minute_end = _minute_bounds(now_utc)
+    dispatched_ids = set(
+        db.scalars(
+            select(Run.schedule_id).where(
+                Run.schedule_id.in_([schedule.id for schedule in schedules]),
+                Run.trigger_type == TriggerType.SCHEDULED.value,
+                Run.queued_at >= minute_start,
+                Run.queued_at < minute_end,
+            )
+        )
+    )
+    active_by_robot = dict(
+        db.execute(
+            select(Run.robot_id, func.count())
+            .where(
+                Run.robot_id.in_({schedule.robot_id for schedule in schedules}),
+                Run.status.in_([RunStatus.PENDING, RunStatus.RUNNING]),
+            )
+            .group_by(Run.robot_id)
+        ).all()
+    )
+    return dispatched_ids, active_by_robot
+
+
+def _dispatch_state(db: Session, schedule: Schedule, now_utc: datetime) -> tuple[bool, int]:
+    minute_start, minute_end = _minute_bounds(now_utc)
+    dispatched = (
         select(func.count())
         .select_from(Run)
         .where(
-            Run.schedule_id == schedule_id,
+            Run.schedule_id == schedule.id,
             Run.trigger_type == TriggerType.SCHEDULED.value,
             Run.queued_at >= minute_start,
             Run.queued_at < minute_end,
         )
-    ) or 0
-    return existing > 0
+        .scalar_subquery()
+    )
+    active = (
+        select(func.count())
+        .select_from(Run)
+        .where(
+            Run.robot_id == schedule.robot_id,
+            Run.status.in_([RunStatus.PENDING, RunStatus.RUNNING]),
+        )
+        .scalar_subquery()
+    )
+    dispatched_count, active_count = db.execute(select(dispatched, active)).one()
+    return (dispatched_count or 0) > 0, active_count or 0
 
 
 def _acquire_robot_lock(db: Session, lock_key: str) -> bool:
@@ -536,30 +591,49 @@ def _release_robot_lock(db: Session, lock_key: str) -> None:
 
 
 def _cron_matches(expr: str, local_dt: datetime) -> bool:
+    compiled = _compile_cron(expr)
+    if compiled is None:
+        return False
+
+    minutes, hours, days, months, dows = compiled
+    cron_dow = local_dt.isoweekday() % 7  # Sunday=0
+    return (
+        local_dt.minute in minutes
+        and local_dt.hour in hours
+        and local_dt.day in days
+        and local_dt.month in months
+        and cron_dow in dows
+    )
+
+
+@lru_cache(maxsize=4096)
+def _compile_cron(expr: str) -> tuple[frozenset[int], ...] | None:
+    # Each field is expanded once into the set of values it matches; ticks then only do set lookups.
     fields = expr.split()
     if len(fields) != 5:
-        return False
+        return None
 
     minute, hour, day, month, dow = fields
-    cron_dow = local_dt.isoweekday() % 7  # Sunday=0
     return (
-        _match_cron_field(minute, local_dt.minute, 0, 59)
-        and _match_cron_field(hour, local_dt.hour, 0, 23)
-        and _match_cron_field(day, local_dt.day, 1, 31)
-        and _match_cron_field(month, local_dt.month, 1, 12)
-        and _match_cron_field(dow, cron_dow, 0, 7, is_day_of_week=True)
+        _expand_cron_field(minute, 0, 59),
+        _expand_cron_field(hour, 0, 23),
+        _expand_cron_field(day, 1, 31),
+        _expand_cron_field(month, 1, 12),
+        _expand_cron_field(dow, 0, 7, is_day_of_week=True),
     )
 
 
-def _match_cron_field(raw: str, value: int, min_value: int, max_value: int, is_day_of_week: bool = False) -> bool:
+def _expand_cron_field(raw: str, min_value: int, max_value: int, is_day_of_week: bool = False) -> frozenset[int]:
+    values: set[int] = set()
     for part in raw.split(","):
         part = part.strip()
         if not part:
             continue
         if part == "*":
-            return True
-        if not _cron_field_regex.match(part):
-            return False
+            return frozenset(range(min_value, max_value + 1))
+        # An invalid part or reversed range ends the field: only values matched by earlier parts count.
+        if not _is_cron_token(part):
+            break
 
         step = 1
         if "/" in part:
@@ -567,10 +641,11 @@ def _match_cron_field(raw: str, value: int, min_value: int, max_value: int, is_d
             step = int(step_text)
         else:
             base = part
+        if step == 0:
+            continue
 
         if base == "*":
-            if (value - min_value) % step == 0:
-                return True
+            values.update(range(min_value, max_value + 1, step))
             continue
 
         if "-" in base:
@@ -581,46 +656,49 @@ def _match_cron_field(raw: str, value: int, min_value: int, max_value: int, is_d
                 start = 0 if start == 7 else start
                 end = 0 if end == 7 else end
             if start > end:
-                return False
-            if start <= value <= end and (value - start) % step == 0:
-                return True
+                break
+            values.update(range(start, end + 1, step))
             continue
 
         num = int(base)
         if is_day_of_week and num == 7:
             num = 0
-        if num == value:
-            return True
-    return False
+        values.add(num)
+    return frozenset(values)
 
 
+def _is_cron_token(token: str) -> bool:
+    # Accepts "*", "N" or "N-M", optionally followed by "/N", with plain string checks instead of a regex.
+    base, slash, step = token.partition("/")
+    if slash and not step.isdecimal():
+        return False
+    if base == "*":
+        return True
+    start, dash, end = base.partition("-")
+    return start.isdecimal() and (not dash or end.isdecimal())
+
+
+@lru_cache(maxsize=1024)
 def _parse_hhmm(value: str) -> time:
     hour_str, minute_str = value.split(":")
     return time(hour=int(hour_str), minute=int(minute_str))
 
 
-def _safe_timezone_name(value: str | None) -> str:
-    candidate = value or settings.app_timezone
+@lru_cache(maxsize=256)
+def _get_tz(value: str | None) -> ZoneInfo:
+    # Unknown or empty names fall back to the app timezone; the resolved zone is reused across ticks.
     try:
-        ZoneInfo(candidate)
-        return candidate
+        return ZoneInfo(value or settings.app_timezone)
     except Exception:  # noqa: BLE001
-        return settings.app_timezone
+        return ZoneInfo(settings.app_timezone)
 
 
 def _validate_schedule_payload(cron_expr: str, timezone_name: str, window_start: str | None, window_end: str | None) -> None:
     if len(cron_expr.split()) != 5:
         raise ValueError("cron_expr must have exactly 5 fields.")
-    probe_dt = datetime.now(timezone.utc).astimezone(ZoneInfo(_safe_timezone_name(timezone_name)))
-    if not _cron_matches(cron_expr, probe_dt):
-        # still valid even if current moment does not match; use syntax-only validation below.
-        pass
-
     for field in cron_expr.split():
         for part in field.split(","):
-            if part.strip() == "*":
-                continue
-            if not _cron_field_regex.match(part.strip()):
+            if not _is_cron_token(part.strip()):
                 raise ValueError("cron_expr contains invalid field syntax.")
 
     if bool(window_start) ^ bool(window_end):
@@ -640,8 +718,8 @@ def _validate_sla_payload(expected_run_every_minutes: int | None, expected_daily
 def _send_notification_placeholder(alert: AlertEvent) -> None:
     logger.warning(
         "ALERT_NOTIFICATION_PLACEHOLDER type=%s severity=%s robot_id=%s run_id=%s message=%s",
-        alert.type,
-        alert.severity,
+        alert.type.value,
+        alert.severity.value,
         alert.robot_id,
         alert.run_id,
         alert.message,
@@ -1,12 +1,11 @@
 from __future__ import annotations
 
 import hashlib
-import shutil
 import zipfile
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Protocol
-from uuid import UUID
+from uuid import UUID, uuid4
 
 from fastapi import UploadFile
 try:
@@ -18,6 +17,8 @@ from app.core.config import get_settings
 
 settings = get_settings()
 
+_UPLOAD_CHUNK_SIZE = 4 * 1024 * 1024
+
 
 @dataclass(slots=True)
 class StoredArtifact:
@@ -31,6 +32,9 @@ class ArtifactStorage(Protocol):
     async def save_robot_version_artifact(self, robot_id: UUID, version: str, upload: UploadFile) -> StoredArtifact:
         ...
 
+    def delete_robot_version_artifact(self, stored: StoredArtifact) -> None:
+        ...
+
 
 class LocalArtifactStorage:
     async def save_robot_version_artifact(self, robot_id: UUID, version: str, upload: UploadFile) -> StoredArtifact:
@@ -38,13 +42,19 @@ class LocalArtifactStorage:
         artifact_type = "ZIP" if suffix == ".zip" else "EXE"
         destination_dir = Path(settings.artifacts_root) / "robots" / str(robot_id) / version
         destination_dir.mkdir(parents=True, exist_ok=True)
-        destination_file = destination_dir / f"artifact{suffix}"
+        # Each upload gets its own file, so a concurrent publish of the same version that loses the
+        # insert race never overwrites the winner's artifact and can be removed on its own.
+        destination_file = destination_dir / f"artifact-{uuid4().hex}{suffix}"
 
-        upload.file.seek(0)
+        # The digest is fed from the same chunks that are written, so the artifact is never read back.
+        digest = hashlib.sha256(usedforsecurity=False)
+        await upload.seek(0)
         with destination_file.open("wb") as output_file:
-            shutil.copyfileobj(upload.file, output_file)
+            while chunk := await upload.read(_UPLOAD_CHUNK_SIZE):
+                output_file.write(chunk)
+                digest.update(chunk)
 
-        sha256 = _file_sha256(destination_file)
+        sha256 = digest.hexdigest()
         relative_path = destination_file.relative_to(Path(settings.artifacts_root)).as_posix()
         return StoredArtifact(
             artifact_type=artifact_type,
@@ -53,6 +63,9 @@ class LocalArtifactStorage:
             sha256=sha256,
         )
 
+    def delete_robot_version_artifact(self, stored: StoredArtifact) -> None:
+        Path(stored.absolute_path).unlink(missing_ok=True)
+
 
 def _resolve_suffix(filename: str) -> str:
     lowered = filename.lower()
@@ -63,17 +76,6 @@ def _resolve_suffix(filename: str) -> str:
     raise ValueError("Only .zip and .exe artifacts are supported.")
 
 
-def _file_sha256(path: Path) -> str:
-    digest = hashlib.sha256()
-    with path.open("rb") as handle:
-        while True:
-            chunk = handle.read(1024 * 1024)
-            if not chunk:
-                break
-            digest.update(chunk)
-    return digest.hexdigest()
-
-
 def extract_required_env_keys_from_artifact(artifact_path: str, artifact_type: str) -> list[str]:
     if artifact_type != "ZIP":
         return []
@@ -63,14 +63,14 @@ def set_worker_status(db: Session, worker_id: UUID, status: str) -> Worker:
 def get_ops_status(db: Session, started_at_monotonic: float) -> dict[str, int]:
     total_workers = db.scalar(select(func.count()).select_from(Worker)) or 0
     workers_running = db.scalar(
-        select(func.count()).select_from(Worker).where(Worker.status == WorkerStatus.RUNNING.value)
+        select(func.count()).select_from(Worker).where(Worker.status == WorkerStatus.RUNNING)
     ) or 0
     workers_paused = db.scalar(
-        select(func.count()).select_from(Worker).where(Worker.status == WorkerStatus.PAUSED.value)
+        select(func.count()).select_from(Worker).where(Worker.status == WorkerStatus.PAUSED)
     ) or 0
 
     runs_running = db.scalar(
-        select(func.count()).select_from(Run).where(Run.status == RunStatus.RUNNING.value)
+        select(func.count()).select_from(Run).where(Run.status == RunStatus.RUNNING)
     ) or 0
 
     one_hour_ago = datetime.now(timezone.utc) - timedelta(hours=1)
@@ -78,7 +78,7 @@ def get_ops_status(db: Session, started_at_monotonic: float) -> dict[str, int]:
         select(func.count())
         .select_from(Run)
         .where(
-            Run.status == RunStatus.FAILED.value,
+            Run.status == RunStatus.FAILED,
             func.coalesce(Run.finished_at, Run.queued_at) >= one_hour_ago,
         )
     ) or 0
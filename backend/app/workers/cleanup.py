@@ -23,6 +23,7 @@ def run_cleanup_once() -> None:
                 "removed_log_rows": result.removed_log_rows,
                 "removed_artifact_rows": result.removed_artifact_rows,
                 "removed_artifact_files": result.removed_artifact_files,
+                "failed_artifact_files": result.failed_artifact_files,
             },
         )
     finally:
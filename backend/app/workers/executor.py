@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import json
 import logging
 import os
 import queue
@@ -15,7 +14,8 @@ from pathlib import Path
 from typing import Any
 from uuid import UUID, uuid4
 
-from sqlalchemy import select
+import orjson
+from sqlalchemy import insert, select
 from sqlalchemy.orm import Session
 
 from app.core.config import get_settings
@@ -27,7 +27,14 @@ from app.models.robot import ArtifactType, EntryPointType, RobotVersion
 from app.models.run import Run, RunLog, RunStatus
 from app.models.scheduler import Schedule, TriggerType
 from app.models.worker import WorkerStatus
-from app.services.queue_service import get_run_log_channel, get_sync_redis, refresh_queue_depth_sync, register_worker_heartbeat
+from app.schemas.run import dump_ws_log
+from app.services.queue_service import (
+    get_run_log_channel,
+    get_sync_redis,
+    get_sync_redis_raw,
+    refresh_queue_depth_sync,
+    register_worker_heartbeat,
+)
 from app.services.robot_env_service import resolve_runtime_env
 from app.services.worker_service import get_worker, set_worker_status, upsert_worker_heartbeat
 
@@ -42,6 +49,7 @@ logger = logging.getLogger("enesa.worker")
 worker_name = f"{socket.gethostname()}:{os.getpid()}"
 worker_id = UUID(os.getenv("ENESA_WORKER_ID", str(uuid4())))
 worker_version = os.getenv("ENESA_WORKER_VERSION", "2.0.0")
+LOG_BATCH_SIZE = 500
 
 
 @dataclass(slots=True)
@@ -61,29 +69,23 @@ def utcnow() -> datetime:
 
 
 def append_log(db: Session, run_id: UUID, level: str, message: str) -> None:
+    append_logs(db, run_id, [StreamLine(level=level, message=message)])
+
+
+def append_logs(db: Session, run_id: UUID, lines: list[StreamLine]) -> None:
+    if not lines:
+        return
     timestamp = utcnow()
-    db.add(
-        RunLog(
-            run_id=run_id,
-            timestamp=timestamp,
-            level=level,
-            message=message,
-        )
-    )
+    rows = [{"run_id": run_id, "timestamp": timestamp, "level": line.level, "message": line.message} for line in lines]
+    db.execute(insert(RunLog), rows)
     db.commit()
 
-    redis = get_sync_redis()
-    redis.publish(
-        get_run_log_channel(str(run_id)),
-        json.dumps(
-            {
-                "run_id": str(run_id),
-                "timestamp": timestamp.isoformat(),
-                "level": level,
-                "message": message,
-            }
-        ),
-    )
+    channel = get_run_log_channel(str(run_id))
+    run_id_text = str(run_id)
+    pipe = get_sync_redis().pipeline(transaction=False)
+    for line in lines:
+        pipe.publish(channel, dump_ws_log(run_id_text, timestamp, line.level, line.message))
+    pipe.execute()
 
 
 def make_environment(version: RobotVersion, runtime_env: dict[str, str]) -> dict[str, str]:
@@ -281,7 +283,7 @@ def process_run(payload: dict[str, Any]) -> None:
 
         version = db.scalar(select(RobotVersion).where(RobotVersion.id == run.robot_version_id))
         if not version:
-            run.status = RunStatus.FAILED.value
+            run.status = RunStatus.FAILED
             run.error_message = "Robot version not found."
             run.finished_at = utcnow()
             db.commit()
@@ -289,7 +291,7 @@ def process_run(payload: dict[str, Any]) -> None:
             finalize_metrics(run)
             return
 
-        run.status = RunStatus.RUNNING.value
+        run.status = RunStatus.RUNNING
         run.started_at = utcnow()
         run.host_name = socket.gethostname()
         db.commit()
@@ -337,13 +339,18 @@ def process_run(payload: dict[str, Any]) -> None:
 
         with log_file_path.open("a", encoding="utf-8") as log_file:
             while True:
+                batch: list[StreamLine] = []
                 try:
-                    item = line_queue.get(timeout=0.2)
-                    append_log(db, run_id, item.level, item.message)
-                    log_file.write(f"{utcnow().isoformat()} [{item.level}] {item.message}\n")
-                    log_file.flush()
+                    batch = [line_queue.get(timeout=0.2)]
+                    while len(batch) < LOG_BATCH_SIZE:
+                        batch.append(line_queue.get_nowait())
                 except queue.Empty:
                     pass
+                if batch:
+                    append_logs(db, run_id, batch)
+                    written_at = utcnow().isoformat()
+                    log_file.writelines(f"{written_at} [{item.level}] {item.message}\n" for item in batch)
+                    log_file.flush()
 
                 now_monotonic = time.monotonic()
                 if process.poll() is None and (now_monotonic - last_cancel_check) >= 1:
@@ -373,16 +380,16 @@ def process_run(payload: dict[str, Any]) -> None:
         run.process_id = None
 
         if canceled:
-            run.status = RunStatus.CANCELED.value
+            run.status = RunStatus.CANCELED
             run.error_message = None
             run.canceled_at = finished_at
             append_log(db, run_id, "INFO", "Execution marked as CANCELED.")
         elif return_code == 0 and not timed_out:
-            run.status = RunStatus.SUCCESS.value
+            run.status = RunStatus.SUCCESS
             run.error_message = None
             append_log(db, run_id, "INFO", "Execution finished successfully.")
         else:
-            run.status = RunStatus.FAILED.value
+            run.status = RunStatus.FAILED
             run.error_message = "TIMEOUT" if timed_out else f"Process returned exit code {return_code}"
             append_log(db, run_id, "ERROR", run.error_message)
 
@@ -401,7 +408,7 @@ def process_run(payload: dict[str, Any]) -> None:
         run = db.scalar(select(Run).where(Run.run_id == run_id))
         if run:
             finished_at = utcnow()
-            run.status = RunStatus.FAILED.value
+            run.status = RunStatus.FAILED
             run.finished_at = finished_at
             run.duration_seconds = (finished_at - run.started_at).total_seconds() if run.started_at else None
             run.error_message = str(exc)
@@ -413,7 +420,7 @@ def process_run(payload: dict[str, Any]) -> None:
 
 
 def run_worker() -> None:
-    redis = get_sync_redis()
+    redis = get_sync_redis_raw()
     queue_name = settings.redis_queue_name
     logger.info("Worker started, listening queue=%s worker_id=%s", queue_name, worker_id)
 
@@ -453,8 +460,8 @@ def run_worker() -> None:
                 continue
 
             try:
-                payload = json.loads(raw_payload)
-            except json.JSONDecodeError:
+                payload = orjson.loads(raw_payload)
+            except orjson.JSONDecodeError:
                 logger.error("Invalid payload from queue: %s", raw_payload)
                 continue
 
@@ -493,7 +500,7 @@ def _schedule_retry_if_needed(
         trigger_type=TriggerType.RETRY.value,
         attempt=retry_attempt,
         parameters_json=run.parameters_json,
-        status=RunStatus.PENDING.value,
+        status=RunStatus.PENDING,
         queued_at=utcnow(),
         triggered_by=run.triggered_by,
     )
@@ -516,8 +523,8 @@ def _schedule_retry_if_needed(
         "env_name": retry_run.env_name,
         "not_before_ts": time.time() + max(1, schedule.retry_backoff_seconds),
     }
-    redis = get_sync_redis()
-    redis.lpush(settings.redis_queue_name, json.dumps(retry_payload))
+    redis = get_sync_redis_raw()
+    redis.lpush(settings.redis_queue_name, orjson.dumps(retry_payload))
     refresh_queue_depth_sync()
     append_log(
         db,
@@ -0,0 +1,52 @@
+-- Enesa Automation Hub - Composite covering indexes for run listings
+
+SET ANSI_NULLS ON;
+SET QUOTED_IDENTIFIER ON;
+
+IF NOT EXISTS (
+    SELECT 1
+    FROM sys.indexes
+    WHERE name = 'IX_runs_robot_status_queued'
+      AND object_id = OBJECT_ID('dbo.runs')
+)
+BEGIN
+    CREATE INDEX IX_runs_robot_status_queued
+        ON dbo.runs(robot_id, status, queued_at DESC)
+        INCLUDE (finished_at, duration_seconds);
+END;
+GO
+
+IF NOT EXISTS (
+    SELECT 1
+    FROM sys.indexes
+    WHERE name = 'IX_runs_status_queued'
+      AND object_id = OBJECT_ID('dbo.runs')
+)
+BEGIN
+    CREATE INDEX IX_runs_status_queued
+        ON dbo.runs(status, queued_at DESC)
+        INCLUDE (finished_at, duration_seconds);
+END;
+GO
+
+IF EXISTS (
+    SELECT 1
+    FROM sys.indexes
+    WHERE name = 'IX_runs_robot_id'
+      AND object_id = OBJECT_ID('dbo.runs')
+)
+BEGIN
+    DROP INDEX IX_runs_robot_id ON dbo.runs;
+END;
+GO
+
+IF EXISTS (
+    SELECT 1
+    FROM sys.indexes
+    WHERE name = 'IX_runs_status'
+      AND object_id = OBJECT_ID('dbo.runs')
+)
+BEGIN
+    DROP INDEX IX_runs_status ON dbo.runs;
+END;
+GO
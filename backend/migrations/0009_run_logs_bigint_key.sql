@@ -0,0 +1,49 @@
+-- Enesa Automation Hub - run_logs BIGINT key and per-run index
+
+SET ANSI_NULLS ON;
+SET QUOTED_IDENTIFIER ON;
+
+IF EXISTS (
+    SELECT 1
+    FROM sys.columns
+    WHERE object_id = OBJECT_ID('dbo.run_logs')
+      AND name = 'id'
+      AND system_type_id = TYPE_ID('int')
+)
+BEGIN
+    DECLARE @pk_name SYSNAME = (
+        SELECT name
+        FROM sys.key_constraints
+        WHERE parent_object_id = OBJECT_ID('dbo.run_logs')
+          AND type = 'PK'
+    );
+    DECLARE @drop_pk NVARCHAR(400) = N'ALTER TABLE dbo.run_logs DROP CONSTRAINT ' + QUOTENAME(@pk_name) + N';';
+    IF @pk_name IS NOT NULL
+        EXEC sp_executesql @drop_pk;
+
+    ALTER TABLE dbo.run_logs ALTER COLUMN id BIGINT NOT NULL;
+    ALTER TABLE dbo.run_logs ADD CONSTRAINT PK_run_logs PRIMARY KEY CLUSTERED (id);
+END;
+GO
+
+IF NOT EXISTS (
+    SELECT 1
+    FROM sys.indexes
+    WHERE name = 'IX_run_logs_run_ts'
+      AND object_id = OBJECT_ID('dbo.run_logs')
+)
+BEGIN
+    CREATE INDEX IX_run_logs_run_ts ON dbo.run_logs(run_id, [timestamp]);
+END;
+GO
+
+IF EXISTS (
+    SELECT 1
+    FROM sys.indexes
+    WHERE name = 'IX_run_logs_run_id'
+      AND object_id = OBJECT_ID('dbo.run_logs')
+)
+BEGIN
+    DROP INDEX IX_run_logs_run_id ON dbo.run_logs;
+END;
+GO
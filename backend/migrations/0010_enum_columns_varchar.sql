@@ -0,0 +1,75 @@
+-- Enesa Automation Hub - Narrow enum-like columns to VARCHAR
+
+SET ANSI_NULLS ON;
+SET QUOTED_IDENTIFIER ON;
+
+IF EXISTS (
+    SELECT 1
+    FROM sys.columns
+    WHERE object_id = OBJECT_ID('dbo.runs')
+      AND name = 'status'
+      AND system_type_id = TYPE_ID('nvarchar')
+)
+BEGIN
+    IF EXISTS (SELECT 1 FROM sys.indexes WHERE name = 'IX_runs_robot_status_queued' AND object_id = OBJECT_ID('dbo.runs'))
+        DROP INDEX IX_runs_robot_status_queued ON dbo.runs;
+    IF EXISTS (SELECT 1 FROM sys.indexes WHERE name = 'IX_runs_status_queued' AND object_id = OBJECT_ID('dbo.runs'))
+        DROP INDEX IX_runs_status_queued ON dbo.runs;
+
+    ALTER TABLE dbo.runs ALTER COLUMN status VARCHAR(20) NOT NULL;
+
+    CREATE INDEX IX_runs_robot_status_queued
+        ON dbo.runs(robot_id, status, queued_at DESC)
+        INCLUDE (finished_at, duration_seconds);
+    CREATE INDEX IX_runs_status_queued
+        ON dbo.runs(status, queued_at DESC)
+        INCLUDE (finished_at, duration_seconds);
+END;
+GO
+
+IF EXISTS (
+    SELECT 1
+    FROM sys.columns
+    WHERE object_id = OBJECT_ID('dbo.workers')
+      AND name = 'status'
+      AND system_type_id = TYPE_ID('nvarchar')
+)
+BEGIN
+    IF EXISTS (SELECT 1 FROM sys.indexes WHERE name = 'IX_workers_status' AND object_id = OBJECT_ID('dbo.workers'))
+        DROP INDEX IX_workers_status ON dbo.workers;
+
+    ALTER TABLE dbo.workers ALTER COLUMN status VARCHAR(20) NOT NULL;
+
+    CREATE INDEX IX_workers_status ON dbo.workers(status);
+END;
+GO
+
+IF EXISTS (
+    SELECT 1
+    FROM sys.columns
+    WHERE object_id = OBJECT_ID('dbo.alert_events')
+      AND name = 'type'
+      AND system_type_id = TYPE_ID('nvarchar')
+)
+BEGIN
+    IF EXISTS (SELECT 1 FROM sys.indexes WHERE name = 'IX_alert_events_type' AND object_id = OBJECT_ID('dbo.alert_events'))
+        DROP INDEX IX_alert_events_type ON dbo.alert_events;
+
+    ALTER TABLE dbo.alert_events ALTER COLUMN type VARCHAR(40) NOT NULL;
+    ALTER TABLE dbo.alert_events ALTER COLUMN severity VARCHAR(20) NOT NULL;
+
+    CREATE INDEX IX_alert_events_type ON dbo.alert_events(type);
+END;
+GO
+
+IF EXISTS (
+    SELECT 1
+    FROM sys.columns
+    WHERE object_id = OBJECT_ID('dbo.robot_versions')
+      AND name = 'entrypoint_type'
+      AND system_type_id = TYPE_ID('nvarchar')
+)
+BEGIN
+    ALTER TABLE dbo.robot_versions ALTER COLUMN entrypoint_type VARCHAR(20) NOT NULL;
+END;
+GO
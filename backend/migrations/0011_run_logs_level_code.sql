@@ -0,0 +1,52 @@
+-- Enesa Automation Hub - run_logs level as SMALLINT code
+
+SET ANSI_NULLS ON;
+SET QUOTED_IDENTIFIER ON;
+
+IF EXISTS (
+    SELECT 1
+    FROM sys.columns
+    WHERE object_id = OBJECT_ID('dbo.run_logs')
+      AND name = 'level'
+      AND system_type_id = TYPE_ID('nvarchar')
+)
+AND COL_LENGTH('dbo.run_logs', 'level_code') IS NULL
+BEGIN
+    ALTER TABLE dbo.run_logs
+    ADD level_code SMALLINT NULL;
+END;
+GO
+
+IF COL_LENGTH('dbo.run_logs', 'level_code') IS NOT NULL
+BEGIN
+    -- Dynamic SQL so the batch still compiles once level_code has been renamed away.
+    EXEC sp_executesql N'
+        UPDATE dbo.run_logs
+        SET level_code = CASE [level]
+            WHEN ''DEBUG'' THEN 10
+            WHEN ''WARN'' THEN 30
+            WHEN ''WARNING'' THEN 30
+            WHEN ''ERROR'' THEN 40
+            ELSE 20
+        END;';
+
+    ALTER TABLE dbo.run_logs ALTER COLUMN level_code SMALLINT NOT NULL;
+
+    IF EXISTS (SELECT 1 FROM sys.indexes WHERE name = 'ix_run_logs_level' AND object_id = OBJECT_ID('dbo.run_logs'))
+        DROP INDEX ix_run_logs_level ON dbo.run_logs;
+
+    ALTER TABLE dbo.run_logs DROP COLUMN [level];
+    EXEC sp_rename 'dbo.run_logs.level_code', 'level', 'COLUMN';
+END;
+GO
+
+IF NOT EXISTS (
+    SELECT 1
+    FROM sys.indexes
+    WHERE name = 'IX_run_logs_errors'
+      AND object_id = OBJECT_ID('dbo.run_logs')
+)
+BEGIN
+    CREATE INDEX IX_run_logs_errors ON dbo.run_logs(run_id) WHERE [level] >= 30;
+END;
+GO
@@ -0,0 +1,50 @@
+-- Enesa Automation Hub - FK index for runs.robot_version_id and removal of redundant robot_id indexes
+-- robot_id already leads UQ_robot_versions_robot_id_version, UQ_robot_tags_robot_id_tag
+-- and UQ_robot_release_tags_robot_tag, so the standalone indexes only add write cost.
+
+SET ANSI_NULLS ON;
+SET QUOTED_IDENTIFIER ON;
+
+IF NOT EXISTS (
+    SELECT 1
+    FROM sys.indexes
+    WHERE name = 'IX_runs_robot_version_id'
+      AND object_id = OBJECT_ID('dbo.runs')
+)
+BEGIN
+    CREATE INDEX IX_runs_robot_version_id ON dbo.runs(robot_version_id);
+END;
+GO
+
+IF EXISTS (
+    SELECT 1
+    FROM sys.indexes
+    WHERE name = 'IX_robot_versions_robot_id'
+      AND object_id = OBJECT_ID('dbo.robot_versions')
+)
+BEGIN
+    DROP INDEX IX_robot_versions_robot_id ON dbo.robot_versions;
+END;
+GO
+
+IF EXISTS (
+    SELECT 1
+    FROM sys.indexes
+    WHERE name = 'IX_robot_tags_robot_id'
+      AND object_id = OBJECT_ID('dbo.robot_tags')
+)
+BEGIN
+    DROP INDEX IX_robot_tags_robot_id ON dbo.robot_tags;
+END;
+GO
+
+IF EXISTS (
+    SELECT 1
+    FROM sys.indexes
+    WHERE name = 'IX_robot_release_tags_robot_id'
+      AND object_id = OBJECT_ID('dbo.robot_release_tags')
+)
+BEGIN
+    DROP INDEX IX_robot_release_tags_robot_id ON dbo.robot_release_tags;
+END;
+GO
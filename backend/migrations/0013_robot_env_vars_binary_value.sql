@@ -0,0 +1,35 @@
+-- Enesa Automation Hub - Store robot env var ciphertext as raw VARBINARY
+
+SET ANSI_NULLS ON;
+SET QUOTED_IDENTIFIER ON;
+
+IF EXISTS (
+    SELECT 1
+    FROM sys.columns
+    WHERE object_id = OBJECT_ID('dbo.robot_env_vars')
+      AND name = 'value_encrypted'
+      AND system_type_id = TYPE_ID('nvarchar')
+)
+AND COL_LENGTH('dbo.robot_env_vars', 'value_cipher') IS NULL
+BEGIN
+    ALTER TABLE dbo.robot_env_vars
+    ADD value_cipher VARBINARY(MAX) NULL;
+END;
+GO
+
+IF COL_LENGTH('dbo.robot_env_vars', 'value_cipher') IS NOT NULL
+BEGIN
+    -- Fernet tokens are urlsafe base64; map back to the standard alphabet before decoding.
+    EXEC sp_executesql N'
+        UPDATE env
+        SET value_cipher = CAST(N'''' AS XML).value(''xs:base64Binary(sql:column("token.b64"))'', ''VARBINARY(MAX)'')
+        FROM dbo.robot_env_vars AS env
+        CROSS APPLY (
+            SELECT REPLACE(REPLACE(CAST(env.value_encrypted AS VARCHAR(MAX)), ''-'', ''+''), ''_'', ''/'') AS b64
+        ) AS token;';
+
+    ALTER TABLE dbo.robot_env_vars ALTER COLUMN value_cipher VARBINARY(MAX) NOT NULL;
+    ALTER TABLE dbo.robot_env_vars DROP COLUMN value_encrypted;
+    EXEC sp_rename 'dbo.robot_env_vars.value_cipher', 'value_encrypted', 'COLUMN';
+END;
+GO
@@ -0,0 +1,67 @@
+-- Enesa Automation Hub - Normalize robot version arguments and env vars into side tables
+
+SET ANSI_NULLS ON;
+SET QUOTED_IDENTIFIER ON;
+
+IF OBJECT_ID('dbo.robot_version_arguments', 'U') IS NULL
+BEGIN
+    CREATE TABLE dbo.robot_version_arguments (
+        robot_version_id UNIQUEIDENTIFIER NOT NULL,
+        position INT NOT NULL,
+        value NVARCHAR(MAX) NOT NULL,
+        CONSTRAINT PK_robot_version_arguments PRIMARY KEY (robot_version_id, position),
+        CONSTRAINT FK_robot_version_arguments_version FOREIGN KEY (robot_version_id) REFERENCES dbo.robot_versions(id) ON DELETE CASCADE
+    );
+END;
+GO
+
+IF OBJECT_ID('dbo.robot_version_env_vars', 'U') IS NULL
+BEGIN
+    CREATE TABLE dbo.robot_version_env_vars (
+        robot_version_id UNIQUEIDENTIFIER NOT NULL,
+        [key] NVARCHAR(150) NOT NULL,
+        value NVARCHAR(MAX) NOT NULL,
+        CONSTRAINT PK_robot_version_env_vars PRIMARY KEY (robot_version_id, [key]),
+        CONSTRAINT FK_robot_version_env_vars_version FOREIGN KEY (robot_version_id) REFERENCES dbo.robot_versions(id) ON DELETE CASCADE
+    );
+    CREATE INDEX IX_robot_version_env_vars_key ON dbo.robot_version_env_vars([key]);
+END;
+GO
+
+IF COL_LENGTH('dbo.robot_versions', 'arguments') IS NOT NULL
+BEGIN
+    -- Dynamic SQL so the batch still compiles once the JSON column has been dropped.
+    EXEC sp_executesql N'
+        INSERT INTO dbo.robot_version_arguments (robot_version_id, position, value)
+        SELECT v.id, CAST(item.[key] AS INT), item.[value]
+        FROM dbo.robot_versions AS v
+        CROSS APPLY OPENJSON(v.arguments) AS item
+        WHERE ISJSON(v.arguments) = 1
+          AND NOT EXISTS (
+              SELECT 1
+              FROM dbo.robot_version_arguments AS existing
+              WHERE existing.robot_version_id = v.id
+          );';
+
+    ALTER TABLE dbo.robot_versions DROP COLUMN arguments;
+END;
+GO
+
+IF COL_LENGTH('dbo.robot_versions', 'env_vars') IS NOT NULL
+BEGIN
+    EXEC sp_executesql N'
+        INSERT INTO dbo.robot_version_env_vars (robot_version_id, [key], value)
+        SELECT v.id, item.[key], item.[value]
+        FROM dbo.robot_versions AS v
+        CROSS APPLY OPENJSON(v.env_vars) AS item
+        WHERE ISJSON(v.env_vars) = 1
+          AND item.[value] IS NOT NULL
+          AND NOT EXISTS (
+              SELECT 1
+              FROM dbo.robot_version_env_vars AS existing
+              WHERE existing.robot_version_id = v.id
+          );';
+
+    ALTER TABLE dbo.robot_versions DROP COLUMN env_vars;
+END;
+GO
@@ -0,0 +1,29 @@
+-- Enesa Automation Hub - Remove single-column indexes on robot_env_vars
+-- Every env var lookup filters on (robot_id, env_name[, key]), which is the clustered primary key
+-- PK_robot_env_vars. The clustered key already carries value_encrypted and is_secret, so no covering
+-- index is needed, and the standalone env_name/key indexes are never chosen but cost every write.
+
+SET ANSI_NULLS ON;
+SET QUOTED_IDENTIFIER ON;
+
+IF EXISTS (
+    SELECT 1
+    FROM sys.indexes
+    WHERE name = 'IX_robot_env_vars_env_name'
+      AND object_id = OBJECT_ID('dbo.robot_env_vars')
+)
+BEGIN
+    DROP INDEX IX_robot_env_vars_env_name ON dbo.robot_env_vars;
+END;
+GO
+
+IF EXISTS (
+    SELECT 1
+    FROM sys.indexes
+    WHERE name = 'IX_robot_env_vars_key'
+      AND object_id = OBJECT_ID('dbo.robot_env_vars')
+)
+BEGIN
+    DROP INDEX IX_robot_env_vars_key ON dbo.robot_env_vars;
+END;
+GO
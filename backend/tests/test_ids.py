@@ -0,0 +1,26 @@
+import time
+import uuid
+
+from app.models.ids import sequential_uuid
+
+
+def test_sequential_uuid_is_rfc_version_8() -> None:
+    value = sequential_uuid()
+    assert value.variant == uuid.RFC_4122
+    assert value.version == 8
+
+
+def test_sequential_uuid_orders_by_trailing_timestamp() -> None:
+    first = sequential_uuid()
+    time.sleep(0.002)
+    second = sequential_uuid()
+    # SQL Server compares the last group of a uniqueidentifier first.
+    assert str(first).rsplit("-", 1)[1] < str(second).rsplit("-", 1)[1]
+
+
+def test_sequential_uuid_behaves_like_parsed_uuid() -> None:
+    value = sequential_uuid()
+    parsed = uuid.UUID(str(value))
+    assert parsed == value
+    assert hash(parsed) == hash(value)
+    assert parsed.bytes == value.bytes
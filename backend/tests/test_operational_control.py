@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 from datetime import datetime, timezone
 from uuid import uuid4
 
@@ -18,6 +19,8 @@ from app.db.session import get_db
 from app.models.run import Run, RunStatus
 from app.models.worker import Worker, WorkerStatus
 from app.schemas.robot import RobotCreate, RobotVersionBase
+from app.schemas.run import RunExecuteRequest
+from app.services import run_service
 from app.services.identity_service import Principal
 from app.services.robot_service import create_robot
 
@@ -149,3 +152,49 @@ def test_pause_and_resume_worker() -> None:
     resumed = client.post(f"/api/v1/workers/{worker_id}/resume")
     assert resumed.status_code == 200
     assert resumed.json()["status"] == WorkerStatus.RUNNING.value
+
+
+def test_failed_background_enqueue_fails_the_run() -> None:
+    _, testing_session_local = _setup_test_context()
+
+    with testing_session_local() as db:
+        robot = create_robot(
+            db=db,
+            created_by=None,
+            payload=RobotCreate(
+                name=f"enqueue-robot-{uuid4()}",
+                description="enqueue failure test",
+                tags=[],
+                initial_version=RobotVersionBase(version="1.0.0", entrypoint_type="PYTHON", entrypoint_path="main.py"),
+            ),
+        )
+        robot_id = robot.id
+
+    async def failing_enqueue(payload: dict) -> None:
+        raise ConnectionError("redis unavailable")
+
+    async def create_in_background() -> Run:
+        with testing_session_local() as db:
+            created = await run_service.create_run_and_enqueue(
+                db=db,
+                robot_id=robot_id,
+                payload=RunExecuteRequest(runtime_arguments=[], runtime_env={}),
+                triggered_by=None,
+                background=True,
+            )
+            await run_service.drain_enqueue_tasks()
+            return created
+
+    original_enqueue = run_service.enqueue_run
+    run_service.enqueue_run = failing_enqueue
+    try:
+        run = asyncio.run(create_in_background())
+    finally:
+        run_service.enqueue_run = original_enqueue
+
+    with testing_session_local() as db:
+        stored = db.scalar(select(Run).where(Run.run_id == run.run_id))
+        assert stored is not None
+        assert stored.status == RunStatus.FAILED.value
+        assert stored.error_message == "Enqueue failed: redis unavailable"
+        assert stored.finished_at is not None
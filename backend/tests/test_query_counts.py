@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.db.base import Base
+from app.schemas.robot import RobotCreate, RobotVersionBase
+from app.schemas.run import RunExecuteRequest, RunRead
+from app.services import run_service
+from app.services.robot_service import create_robot, list_robots
+
+
+@contextmanager
+def _count_statements(engine: Engine) -> Iterator[list[str]]:
+    statements: list[str] = []
+
+    def record(conn, cursor, statement, parameters, context, executemany) -> None:
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+
+
+def test_service_read_paths_keep_their_query_counts() -> None:
+    engine = create_engine(
+        "sqlite+pysqlite://",
+        future=True,
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    # Mirrors the production session so counts reflect what the API actually issues.
+    TestingSessionLocal = sessionmaker(bind=engine, class_=Session, autocommit=False, autoflush=False, expire_on_commit=False)
+    Base.metadata.create_all(bind=engine)
+
+    with TestingSessionLocal() as db:
+        for index in range(3):
+            robot = create_robot(
+                db=db,
+                created_by=None,
+                payload=RobotCreate(
+                    name=f"query-count-robot-{index}",
+                    description="query counts",
+                    tags=["qa", "ops"],
+                    initial_version=RobotVersionBase(
+                        version="1.0.0",
+                        channel="stable",
+                        artifact_type="ZIP",
+                        artifact_path=f"robots/query-count-{index}/1.0.0/artifact.zip",
+                        artifact_sha256="sha-query-count",
+                        changelog="initial",
+                        entrypoint_type="PYTHON",
+                        entrypoint_path="main.py",
+                        arguments=["--flag"],
+                        env_vars={"MODE": "test"},
+                        working_directory=None,
+                        checksum="sha-query-count",
+                    ),
+                ),
+            )
+        robot_id = robot.id
+
+    # Page with window total, tags, release tags, top-N versions and their argument/env rows.
+    with TestingSessionLocal() as db, _count_statements(engine) as statements:
+        robots, total = list_robots(db=db)
+        assert total == 3
+        assert all(len(item.versions) == 1 and item.version_count == 1 for item in robots)
+    assert len(statements) == 6
+
+    async def fake_enqueue(payload: dict) -> None:
+        return None
+
+    run_service.invalidate_version_cache()
+    original_enqueue = run_service.enqueue_run
+    run_service.enqueue_run = fake_enqueue
+    try:
+        # Version resolve plus the INSERT; no post-commit refresh or reload.
+        with TestingSessionLocal() as db, _count_statements(engine) as statements:
+            run = asyncio.run(
+                run_service.create_run_and_enqueue(
+                    db=db,
+                    robot_id=robot_id,
+                    payload=RunExecuteRequest(runtime_arguments=[], runtime_env={}),
+                    triggered_by=None,
+                )
+            )
+        assert len(statements) == 2
+
+        # The resolved version is cached, so a second run only inserts.
+        with TestingSessionLocal() as db, _count_statements(engine) as statements:
+            asyncio.run(
+                run_service.create_run_and_enqueue(
+                    db=db,
+                    robot_id=robot_id,
+                    payload=RunExecuteRequest(runtime_arguments=[], runtime_env={}),
+                    triggered_by=None,
+                )
+            )
+        assert len(statements) == 1
+    finally:
+        run_service.enqueue_run = original_enqueue
+
+    # Run with joined version/service, then artifacts; serializing must not lazy-load anything else.
+    with TestingSessionLocal() as db, _count_statements(engine) as statements:
+        loaded = run_service.get_run(db=db, run_id=run.run_id)
+        assert loaded is not None
+        serialized = RunRead.from_row(loaded)
+        assert serialized.robot_version is not None
+    assert len(statements) == 2
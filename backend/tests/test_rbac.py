@@ -13,7 +13,7 @@ from app.core.rbac import (
     Role,
     permissions_for_role,
 )
-from app.services.identity_service import Principal, _role_from_groups, settings
+from app.services.identity_service import Principal, _derive_role, _role_from_groups, settings
 
 
 def test_role_permission_matrix() -> None:
@@ -68,3 +68,12 @@ def test_group_mapping_to_role() -> None:
         settings.azure_ad_group_admin_ids = original_admin
         settings.azure_ad_group_operator_ids = original_operator
         settings.azure_ad_group_viewer_ids = original_viewer
+
+
+def test_role_derivation_from_user_permissions() -> None:
+    assert _derive_role(Role.VIEWER, frozenset({PERMISSION_SERVICE_MANAGE}), True) == Role.ADMIN
+    assert _derive_role(Role.VIEWER, frozenset({PERMISSION_SERVICE_MANAGE}), False) == Role.VIEWER
+    assert _derive_role(Role.VIEWER, frozenset({PERMISSION_ROBOT_PUBLISH, PERMISSION_ROBOT_RUN}), True) == Role.MAINTAINER
+    assert _derive_role(Role.VIEWER, frozenset({PERMISSION_SERVICE_RUN}), False) == Role.OPERATOR
+    assert _derive_role(Role.OPERATOR, frozenset({PERMISSION_ROBOT_PUBLISH}), False) == Role.OPERATOR
+    assert _derive_role(Role.VIEWER, frozenset({"legacy.action"}), True) == Role.VIEWER
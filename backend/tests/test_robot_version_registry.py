@@ -1,9 +1,12 @@
 from __future__ import annotations
 
+import hashlib
 import io
 import uuid
 import zipfile
 
+import pytest
+
 from fastapi import FastAPI
 from fastapi.testclient import TestClient
 from sqlalchemy import create_engine, select
@@ -19,7 +22,7 @@ from app.db.session import get_db
 from app.models.robot import RobotVersion
 from app.schemas.robot import RobotCreate, RobotVersionBase
 from app.services.identity_service import Principal
-from app.services.robot_service import create_robot
+from app.services.robot_service import create_robot, publish_robot_version
 
 
 def _zip_payload() -> bytes:
@@ -111,6 +114,9 @@ def test_publish_list_activate_registry(tmp_path) -> None:
     assert published["artifact_type"] == "ZIP"
     assert published["is_active"] is True
     assert published["artifact_sha256"]
+    # The digest computed while streaming must match a fresh read of the stored file.
+    with (tmp_path / published["artifact_path"]).open("rb") as stored_artifact:
+        assert published["artifact_sha256"] == hashlib.file_digest(stored_artifact, "sha256").hexdigest()
 
     duplicate_response = client.post(
         f"/api/v1/robots/{robot_id}/versions/publish",
@@ -149,3 +155,52 @@ def test_publish_list_activate_registry(tmp_path) -> None:
         assert active_versions[0].id == initial_version_id
 
     settings.artifacts_root = original_artifacts_root
+
+
+def test_checked_publish_of_taken_version_raises_value_error() -> None:
+    engine = create_engine(
+        "sqlite+pysqlite://",
+        future=True,
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    TestingSessionLocal = sessionmaker(bind=engine, class_=Session, autocommit=False, autoflush=False)
+    Base.metadata.create_all(bind=engine)
+
+    with TestingSessionLocal() as db:
+        robot = create_robot(
+            db=db,
+            created_by=None,
+            payload=RobotCreate(
+                name="robot-publish-race",
+                description="race",
+                tags=[],
+                initial_version=RobotVersionBase(version="1.0.0"),
+            ),
+        )
+        robot_id = robot.id
+
+    # Both publishers passed check_new_version before uploading; the second insert loses the race.
+    publish_kwargs = dict(
+        robot_id=robot_id,
+        version="1.1.0",
+        channel="stable",
+        changelog=None,
+        artifact_type="ZIP",
+        artifact_path="robots/race/1.1.0/artifact.zip",
+        artifact_sha256="sha",
+        created_by=None,
+        entrypoint_path="main.py",
+        checked=True,
+    )
+    with TestingSessionLocal() as db:
+        publish_robot_version(db=db, **publish_kwargs)
+    with TestingSessionLocal() as db:
+        with pytest.raises(ValueError, match="Version already exists for this robot."):
+            publish_robot_version(db=db, **publish_kwargs)
+
+        # The rollback also undid the loser's deactivation, so the winner stays the only active version.
+        active_versions = list(
+            db.scalars(select(RobotVersion).where(RobotVersion.robot_id == robot_id, RobotVersion.is_active.is_(True)))
+        )
+        assert [item.version for item in active_versions] == ["1.1.0"]
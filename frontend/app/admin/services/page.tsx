@@ -1,10 +1,18 @@
 "use client";
 
 import Link from "next/link";
-import { FormEvent, useEffect, useMemo, useState } from "react";
+import { FormEvent, useEffect, useState } from "react";
 
-import { createService, deleteService, fetchDomains, fetchRobots, fetchServices, updateService } from "@/lib/api";
-import { Domain, Robot, Service } from "@/lib/types";
+import {
+  createService,
+  deleteService,
+  fetchDomains,
+  fetchRobotVersions,
+  fetchRobots,
+  fetchServices,
+  updateService
+} from "@/lib/api";
+import { Domain, Robot, RobotVersion, Service } from "@/lib/types";
 
 const defaultToken = process.env.NEXT_PUBLIC_API_TOKEN ?? "";
 const SAMPLE_SCHEMA = `{
@@ -54,6 +62,7 @@ export default function AdminServicesPage() {
   const [editingServiceId, setEditingServiceId] = useState<string | null>(null);
   const [domainId, setDomainId] = useState("");
   const [robotId, setRobotId] = useState("");
+  const [robotVersions, setRobotVersions] = useState<RobotVersion[]>([]);
   const [title, setTitle] = useState("");
   const [description, setDescription] = useState("");
   const [icon, setIcon] = useState("");
@@ -62,8 +71,6 @@ export default function AdminServicesPage() {
   const [schemaRaw, setSchemaRaw] = useState(SAMPLE_SCHEMA);
   const [templateRaw, setTemplateRaw] = useState(SAMPLE_TEMPLATE);
 
-  const selectedRobot = useMemo(() => robots.find((robot) => robot.id === robotId), [robots, robotId]);
-
   const loadAll = async () => {
     setLoading(true);
     setError(null);
@@ -80,8 +87,6 @@ export default function AdminServicesPage() {
       if (!domainId && loadedDomains[0]) setDomainId(loadedDomains[0].id);
       if (!robotId && loadedRobots.items[0]) {
         setRobotId(loadedRobots.items[0].id);
-        const active = loadedRobots.items[0].versions.find((version) => version.is_active);
-        setDefaultVersionId(active?.id ?? loadedRobots.items[0].versions[0]?.id ?? "");
       }
     } catch (err) {
       setError(err instanceof Error ? err.message : "Falha ao carregar dados de servico.");
@@ -95,11 +100,25 @@ export default function AdminServicesPage() {
     // eslint-disable-next-line react-hooks/exhaustive-deps
   }, []);
 
+  // The robot list only embeds recent versions, so the picker loads the full history per robot.
   useEffect(() => {
-    if (!selectedRobot) return;
-    const active = selectedRobot.versions.find((version) => version.is_active);
-    setDefaultVersionId(active?.id ?? selectedRobot.versions[0]?.id ?? "");
-  }, [selectedRobot]);
+    if (!robotId) return;
+    let canceled = false;
+    fetchRobotVersions(robotId, token)
+      .then((versions) => {
+        if (canceled) return;
+        setRobotVersions(versions);
+        const active = versions.find((version) => version.is_active);
+        setDefaultVersionId(active?.id ?? versions[0]?.id ?? "");
+      })
+      .catch((err) => {
+        if (!canceled) setError(err instanceof Error ? err.message : "Falha ao carregar versoes do robo.");
+      });
+    return () => {
+      canceled = true;
+    };
+    // eslint-disable-next-line react-hooks/exhaustive-deps
+  }, [robotId]);
 
   const resetForm = () => {
     setEditingServiceId(null);
@@ -226,7 +245,7 @@ export default function AdminServicesPage() {
             Versao default
             <select value={defaultVersionId} onChange={(event) => setDefaultVersionId(event.target.value)}>
               <option value="">Sem versao fixa (usar ativa)</option>
-              {(selectedRobot?.versions ?? []).map((version) => (
+              {robotVersions.map((version) => (
                 <option key={version.id} value={version.id}>
                   {version.version} ({version.channel}) {version.is_active ? "[active]" : ""}
                 </option>
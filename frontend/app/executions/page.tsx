@@ -2,8 +2,8 @@
 
 import { FormEvent, useEffect, useMemo, useState } from "react";
 
-import { cancelRun, executeRun, fetchRobots, fetchRun } from "@/lib/api";
-import { Robot } from "@/lib/types";
+import { cancelRun, executeRun, fetchRobotVersions, fetchRobots, fetchRun } from "@/lib/api";
+import { Robot, RobotVersion } from "@/lib/types";
 import { useRunStream } from "@/lib/use-run-stream";
 
 import { RunStatusPill } from "@/components/run-status-pill";
@@ -15,6 +15,7 @@ export default function ExecutionsPage() {
   const [token, setToken] = useState(defaultToken);
   const [robots, setRobots] = useState<Robot[]>([]);
   const [robotId, setRobotId] = useState("");
+  const [robotVersions, setRobotVersions] = useState<RobotVersion[]>([]);
   const [robotVersionId, setRobotVersionId] = useState("");
   const [runtimeArgsRaw, setRuntimeArgsRaw] = useState("");
   const [runtimeEnvRaw, setRuntimeEnvRaw] = useState("");
@@ -25,8 +26,6 @@ export default function ExecutionsPage() {
   const [isExecuting, setIsExecuting] = useState(false);
   const [isCanceling, setIsCanceling] = useState(false);
 
-  const selectedRobot = useMemo(() => robots.find((robot) => robot.id === robotId), [robots, robotId]);
-
   const runtimeArguments = useMemo(
     () =>
       runtimeArgsRaw
@@ -101,8 +100,6 @@ export default function ExecutionsPage() {
       setRobots(response.items);
       if (!robotId && response.items[0]) {
         setRobotId(response.items[0].id);
-        const active = response.items[0].versions.find((version) => version.is_active);
-        setRobotVersionId(active?.id ?? response.items[0].versions[0]?.id ?? "");
       }
     } catch (err) {
       setError(err instanceof Error ? err.message : "Failed to load robots.");
@@ -114,14 +111,28 @@ export default function ExecutionsPage() {
     // eslint-disable-next-line react-hooks/exhaustive-deps
   }, []);
 
+  // The robot list only embeds recent versions, so the picker loads the full history per robot.
   useEffect(() => {
-    if (!selectedRobot) return;
-    const found = selectedRobot.versions.find((version) => version.id === robotVersionId);
-    if (!found) {
-      const active = selectedRobot.versions.find((version) => version.is_active);
-      setRobotVersionId(active?.id ?? selectedRobot.versions[0]?.id ?? "");
-    }
-  }, [selectedRobot, robotVersionId]);
+    if (!robotId) return;
+    let canceled = false;
+    fetchRobotVersions(robotId, token)
+      .then((versions) => {
+        if (canceled) return;
+        setRobotVersions(versions);
+        setRobotVersionId((current) => {
+          if (versions.some((version) => version.id === current)) return current;
+          const active = versions.find((version) => version.is_active);
+          return active?.id ?? versions[0]?.id ?? "";
+        });
+      })
+      .catch((err) => {
+        if (!canceled) setError(err instanceof Error ? err.message : "Failed to load robot versions.");
+      });
+    return () => {
+      canceled = true;
+    };
+    // eslint-disable-next-line react-hooks/exhaustive-deps
+  }, [robotId]);
 
   const onExecute = async (event: FormEvent<HTMLFormElement>) => {
     event.preventDefault();
@@ -194,7 +205,7 @@ export default function ExecutionsPage() {
             <label>
               Version
               <select value={robotVersionId} onChange={(event) => setRobotVersionId(event.target.value)}>
-                {(selectedRobot?.versions ?? []).map((version) => (
+                {robotVersions.map((version) => (
                   <option key={version.id} value={version.id}>
                     {version.version} ({version.channel}) {version.is_active ? "[active]" : ""}
                   </option>
@@ -208,7 +208,7 @@ export default function RobotsPage() {
                       </Link>
                     </td>
                     <td>{robot.tags.join(", ") || "-"}</td>
-                    <td>{robot.versions.length}</td>
+                    <td>{robot.version_count}</td>
                     <td>{new Date(robot.updated_at).toLocaleString()}</td>
                   </tr>
                 ))}
@@ -31,6 +31,7 @@ export type Robot = {
   created_at: string;
   updated_at: string;
   versions: RobotVersion[];
+  version_count: number;
 };
 
 export type RobotListResponse = {